@@ -26,6 +26,8 @@ class SearchBreedsQuery(BaseModel):
     page: int = Field(default=1, description="页码，从1开始")
     page_size: int = Field(default=10, description="每页大小")
     include_deleted: bool = Field(default=False, description="是否包含已删除的品种")
+    cursor: str | None = Field(default=None, description="分页游标，传入时忽略页码")
+    with_total: bool = Field(default=False, description="是否统计总数（额外一次 COUNT 查询）")
 
 
 class ListBreedsQuery(BaseModel):
@@ -33,3 +35,5 @@ class ListBreedsQuery(BaseModel):
     page: int = Field(default=1, description="页码，从1开始")
     page_size: int = Field(default=10, description="每页大小")
     include_deleted: bool = Field(default=False, description="是否包含已删除的品种")
+    cursor: str | None = Field(default=None, description="分页游标，传入时忽略页码")
+    with_total: bool = Field(default=False, description="是否统计总数（额外一次 COUNT 查询）")
@@ -64,43 +64,51 @@ class BreedQueryService:
     async def search_breeds(self, query: SearchBreedsQuery) -> BreedSearchResult:
         """搜索品种"""
         # 搜索品种
-        breeds, total_count = await self.breed_repository.search_breeds(
+        result = await self.breed_repository.search_breeds(
             search_term=query.search_term,
             language=query.language,
             page=query.page,
             page_size=query.page_size,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        breed_views = [BreedSummaryView.from_entity(breed) for breed in breeds]
+        breed_views = [BreedSummaryView.from_entity(breed) for breed in result.items]
 
         # 创建搜索结果
         return BreedSearchResult.create(
             breeds=breed_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def list_breeds(self, query: ListBreedsQuery) -> BreedSearchResult:
         """获取品种列表（保持向后兼容）"""
         # 获取品种列表
-        breeds, total_count = await self.breed_repository.list_all(
+        result = await self.breed_repository.list_all(
             page=query.page,
             page_size=query.page_size,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        breed_views = [BreedSummaryView.from_entity(breed) for breed in breeds]
+        breed_views = [BreedSummaryView.from_entity(breed) for breed in result.items]
 
         # 创建搜索结果
         return BreedSearchResult.create(
             breeds=breed_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def get_breed_with_pets(self, query: GetBreedByIdQuery) -> BreedWithPetsView:
@@ -18,10 +18,13 @@ class SearchPetRecordsQuery(BaseModel):
     search_term: str | None = Field(default=None, description="搜索关键词")
     pet_id: str | None = Field(default=None, description="宠物ID")
     event_type: PetEventTypeEnum | None = Field(default=None, description="事件类型")
+    event_types: list[PetEventTypeEnum] | None = Field(default=None, description="事件类型列表（匹配任意一个）")
     creator_id: str | None = Field(default=None, description="创建者ID")
     page: int = Field(default=1, description="页码，从1开始")
     page_size: int = Field(default=10, description="每页大小")
     include_deleted: bool = Field(default=False, description="是否包含已删除的记录")
+    cursor: str | None = Field(default=None, description="分页游标，传入时忽略页码")
+    with_total: bool = Field(default=False, description="是否统计总数（额外一次 COUNT 查询）")
 
 
 class ListPetRecordsQuery(BaseModel):
@@ -33,3 +36,5 @@ class ListPetRecordsQuery(BaseModel):
     event_type: PetEventTypeEnum | None = Field(default=None, description="事件类型")
     creator_id: str | None = Field(default=None, description="创建者ID")
     include_deleted: bool = Field(default=False, description="是否包含已删除的记录")
+    cursor: str | None = Field(default=None, description="分页游标，传入时忽略页码")
+    with_total: bool = Field(default=False, description="是否统计总数（额外一次 COUNT 查询）")
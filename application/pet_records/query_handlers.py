@@ -40,31 +40,36 @@ class PetRecordQueryService:
     async def search_pet_records(self, query: SearchPetRecordsQuery) -> PetRecordSearchResult:
         """搜索宠物记录"""
         # 搜索记录
-        records, total_count = await self.pet_record_repository.search_pet_records(
+        result = await self.pet_record_repository.search_pet_records(
             search_term=query.search_term,
             pet_id=query.pet_id,
             event_type=query.event_type,
+            event_types=query.event_types,
             creator_id=query.creator_id,
             page=query.page,
             page_size=query.page_size,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        record_views = [PetRecordSummaryView.from_entity(record) for record in records]
+        record_views = [PetRecordSummaryView.from_entity(record) for record in result.items]
 
         # 创建搜索结果
         return PetRecordSearchResult.create(
             records=record_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def list_pet_records(self, query: ListPetRecordsQuery) -> PetRecordSearchResult:
         """获取宠物记录列表"""
         # 获取记录列表
-        records, total_count = await self.pet_record_repository.list_all(
+        result = await self.pet_record_repository.list_all(
             page=query.page,
             page_size=query.page_size,
             search=query.search,
@@ -72,25 +77,33 @@ class PetRecordQueryService:
             event_type=query.event_type,
             creator_id=query.creator_id,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        record_views = [PetRecordSummaryView.from_entity(record) for record in records]
+        record_views = [PetRecordSummaryView.from_entity(record) for record in result.items]
 
         # 创建搜索结果
         return PetRecordSearchResult.create(
             records=record_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def get_pet_records_by_pet_id(self, pet_id: str) -> list[PetRecordSummaryView]:
         """根据宠物ID获取记录列表"""
-        records = await self.pet_record_repository.get_by_pet_id(pet_id)
-        return [PetRecordSummaryView.from_entity(record) for record in records]
+        return [
+            PetRecordSummaryView.from_entity(record)
+            async for record in self.pet_record_repository.iter_by_pet_id(pet_id)
+        ]
 
     async def get_pet_records_by_creator_id(self, creator_id: str) -> list[PetRecordSummaryView]:
         """根据创建者ID获取记录列表"""
-        records = await self.pet_record_repository.get_by_creator_id(creator_id)
-        return [PetRecordSummaryView.from_entity(record) for record in records]
+        return [
+            PetRecordSummaryView.from_entity(record)
+            async for record in self.pet_record_repository.iter_by_creator_id(creator_id)
+        ]
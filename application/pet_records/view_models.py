@@ -63,25 +63,31 @@ class PetRecordDetailsView(BaseModel):
 class PetRecordSearchResult(BaseModel):
     """宠物记录搜索结果"""
     records: list[PetRecordSummaryView]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
 
     @classmethod
     def create(
         cls,
         records: list[PetRecordSummaryView],
-        total: int,
+        total: int | None,
         page: int,
         page_size: int,
+        has_more: bool = False,
+        next_cursor: str | None = None,
     ) -> "PetRecordSearchResult":
-        """创建搜索结果"""
-        total_pages = (total + page_size - 1) // page_size
+        """创建搜索结果（未统计总数时 total/total_pages 为 None）"""
+        total_pages = (total + page_size - 1) // page_size if total is not None else None
         return cls(
             records=records,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
@@ -13,7 +13,7 @@ from application.pets.queries import (
     ListPetsByOwnerQuery,
     SearchPetsQuery,
 )
-from application.pets.read_models import PetSearchReadRepository
+from application.pets.read_models import PetSearchReadRepository, PetSearchRow
 from application.pets.view_models import (
     BreedView,
     MorphologyView,
@@ -23,6 +23,7 @@ from application.pets.view_models import (
     PetSummaryView,
 )
 from domain.common.entities import I18n
+from domain.common.pagination import Page
 from domain.pets.exceptions import PetNotFoundError
 from domain.pets.repository import BreedRepository, MorphologyRepository, PetRepository
 from domain.users.repository import UserRepository
@@ -119,7 +120,7 @@ class PetQueryService:
     async def search_pets(self, query: SearchPetsQuery) -> PetSearchResult:
         """搜索宠物"""
         # 搜索宠物
-        rows, total_count = await self.pet_search_repository.search_pets(
+        result = await self.pet_search_repository.search_pets(
             search_term=query.search_term,
             owner_id=query.owner_id,
             breed_id=query.breed_id,
@@ -127,11 +128,19 @@ class PetQueryService:
             page=query.page,
             page_size=query.page_size,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
+        return self._to_search_result(result, query.page, query.page_size)
+
+    def _to_search_result(
+        self, result: Page[PetSearchRow], page: int, page_size: int
+    ) -> PetSearchResult:
+        """将读模型的一页结果转换为搜索结果视图"""
         # 创建摘要视图模型
         pet_views = []
-        for row in rows:
+        for row in result.items:
             # 获取主人名称（如果有主人ID）
             owner_name = row.owner_name
 
@@ -154,9 +163,11 @@ class PetQueryService:
         # 创建搜索结果
         return PetSearchResult.create(
             pets=pet_views,
-            total=total_count,
-            page=query.page,
-            page_size=query.page_size,
+            total=result.total,
+            page=page,
+            page_size=page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def list_pets_by_owner(self, query: ListPetsByOwnerQuery) -> PetSearchResult:
@@ -167,45 +178,14 @@ class PetQueryService:
             from domain.users.exceptions import UserNotFoundError
             raise UserNotFoundError(f"User with id '{query.owner_id}' not found")
 
-        # 获取用户的宠物
-        pets = await self.pet_repository.get_by_owner_id(query.owner_id)
-
-        # 计算分页
-        start_idx = (query.page - 1) * query.page_size
-        end_idx = start_idx + query.page_size
-        paginated_pets = pets[start_idx:end_idx]
-
-        # 创建摘要视图模型
-        pet_views = []
-        for pet in paginated_pets:
-            # 获取品种名称（如果有品种ID）
-            breed_name = None
-            if pet.breed_id:
-                breed = await self.breed_repository.get_by_id(pet.breed_id)
-                if breed and breed.name:
-                    # 使用I18n的get_text方法获取当前语言的名称，默认为英语
-                    breed_name = breed.name
-
-            # 创建摘要视图
-            pet_view = PetSummaryView(
-                id=pet.id,
-                name=pet.name,
-                gender=pet.gender,
-                created_at=pet.created_at,
-                owner_name=owner.username or owner.full_name,
-                breed_name=breed_name,
-                # 在实际实现中，这里应该获取主图URL
-                primary_picture_url=None,
-            )
-            pet_views.append(pet_view)
-
-        # 创建搜索结果
-        return PetSearchResult.create(
-            pets=pet_views,
-            total=len(pets),
+        # 分页在数据库中完成：只读取当前页，主人与品种名称由同一条查询关联取回
+        result = await self.pet_search_repository.search_pets(
+            owner_id=query.owner_id,
             page=query.page,
             page_size=query.page_size,
+            with_total=True,
         )
+        return self._to_search_result(result, query.page, query.page_size)
 
     async def list_pets_by_breed(self, query: ListPetsByBreedQuery) -> PetSearchResult:
         """列出特定品种的宠物"""
@@ -215,44 +195,13 @@ class PetQueryService:
             from domain.pets.exceptions import BreedNotFoundError
             raise BreedNotFoundError(query.breed_id)
 
-        # 获取该品种的宠物
-        pets = await self.pet_repository.get_by_breed_id(query.breed_id)
-
-        # 计算分页
-        start_idx = (query.page - 1) * query.page_size
-        end_idx = start_idx + query.page_size
-        paginated_pets = pets[start_idx:end_idx]
-
-        # 创建摘要视图模型
-        pet_views = []
-        for pet in paginated_pets:
-            # 获取主人名称（如果有主人ID）
-            owner_name = None
-            if pet.owner_id:
-                owner = await self.user_repository.get_by_id(pet.owner_id)
-                if owner:
-                    owner_name = owner.username or owner.full_name
-
-            # 创建摘要视图
-            pet_view = PetSummaryView(
-                id=pet.id,
-                name=pet.name,
-                gender=pet.gender,
-                created_at=pet.created_at,
-                owner_name=owner_name,
-                breed_name=breed.name.get("en", "") if breed.name else None,
-                # 在实际实现中，这里应该获取主图URL
-                primary_picture_url=None,
-            )
-            pet_views.append(pet_view)
-
-        # 创建搜索结果
-        return PetSearchResult.create(
-            pets=pet_views,
-            total=len(pets),
+        result = await self.pet_search_repository.search_pets(
+            breed_id=query.breed_id,
             page=query.page,
             page_size=query.page_size,
+            with_total=True,
         )
+        return self._to_search_result(result, query.page, query.page_size)
 
     async def list_pets_by_morphology(self, query: ListPetsByMorphologyQuery) -> PetSearchResult:
         """列出特定品系的宠物"""
@@ -262,49 +211,10 @@ class PetQueryService:
             from domain.pets.exceptions import MorphologyNotFoundError
             raise MorphologyNotFoundError(query.morphology_id)
 
-        # 获取该品系的宠物
-        pets = await self.pet_repository.get_by_morphology_id(query.morphology_id)
-
-        # 计算分页
-        start_idx = (query.page - 1) * query.page_size
-        end_idx = start_idx + query.page_size
-        paginated_pets = pets[start_idx:end_idx]
-
-        # 创建摘要视图模型
-        pet_views = []
-        for pet in paginated_pets:
-            # 获取主人名称（如果有主人ID）
-            owner_name = None
-            if pet.owner_id:
-                owner = await self.user_repository.get_by_id(pet.owner_id)
-                if owner:
-                    owner_name = owner.username or owner.full_name
-
-            # 获取品种名称（如果有品种ID）
-            breed_name = None
-            if pet.breed_id:
-                breed = await self.breed_repository.get_by_id(pet.breed_id)
-                if breed and breed.name:
-                    # 使用I18n的get_text方法获取当前语言的名称，默认为英语
-                    breed_name = breed.name
-
-            # 创建摘要视图
-            pet_view = PetSummaryView(
-                id=pet.id,
-                name=pet.name,
-                gender=pet.gender,
-                created_at=pet.created_at,
-                owner_name=owner_name,
-                breed_name=breed_name,
-                # 在实际实现中，这里应该获取主图URL
-                primary_picture_url=None,
-            )
-            pet_views.append(pet_view)
-
-        # 创建搜索结果
-        return PetSearchResult.create(
-            pets=pet_views,
-            total=len(pets),
+        result = await self.pet_search_repository.search_pets(
+            morphology_id=query.morphology_id,
             page=query.page,
             page_size=query.page_size,
+            with_total=True,
         )
+        return self._to_search_result(result, query.page, query.page_size)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
+from domain.common.pagination import Page
 from domain.pets.value_objects import GenderEnum
 
 
@@ -34,6 +35,9 @@ class PetSearchReadRepository:
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[PetSearchRow], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[PetSearchRow]:
+        """按 (created_at DESC, id DESC) 分页搜索；传入 cursor 时按 keyset 分页，with_total 为真时才统计总数"""
         raise NotImplementedError
 
@@ -121,19 +121,34 @@ class PetSearchResult(BaseModel):
     """宠物搜索结果"""
 
     pets: list[PetSummaryView]
-    total_count: int
+    total_count: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
 
     @classmethod
-    def create(cls, pets: list[PetSummaryView], total: int, page: int, page_size: int) -> "PetSearchResult":
-        """创建搜索结果"""
-        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+    def create(
+        cls,
+        pets: list[PetSummaryView],
+        total: int | None,
+        page: int,
+        page_size: int,
+        has_more: bool = False,
+        next_cursor: str | None = None,
+    ) -> "PetSearchResult":
+        """创建搜索结果（未统计总数时 total_count/total_pages 为 None）"""
+        if total is None:
+            total_pages = None
+        else:
+            total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
         return cls(
             pets=pets,
             total_count=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
@@ -4,6 +4,7 @@ Implements the CQRS pattern's command part, handling write operations.
 Uses domain services and entity methods instead of implementing business logic directly.
 """
 
+import asyncio
 from uuid import uuid4
 
 from loguru import logger
@@ -72,8 +73,9 @@ class CreateUserHandler:
         if await self.user_repository.exists_by_email(command.email):
             raise DuplicateEmailError(f"Email '{command.email}' already exists")
 
-        # Hash the password using the injected hasher
-        hashed_password = self.password_hasher.hash(command.password)
+        # Hash the password using the injected hasher; bcrypt is CPU-bound,
+        # so it runs in a worker thread instead of blocking the event loop
+        hashed_password = await asyncio.to_thread(self.password_hasher.hash, command.password)
 
         # Create user entity
         user = User(
@@ -212,15 +214,17 @@ class UpdatePasswordHandler:
         if not user:
             raise UserNotFoundError(f"User with id '{command.user_id}' not found")
 
-        # Verify current password using entity method
-        if not user.verify_password(command.current_password, self.password_hasher):
+        # Verify current password using entity method (off the event loop, see CreateUserHandler)
+        if not await asyncio.to_thread(
+            user.verify_password, command.current_password, self.password_hasher
+        ):
             raise InvalidCredentialsError("Current password is incorrect")
 
         # Validate new password strength
         self.password_policy.validate(command.new_password)
 
         # Use entity method to change password (handles hashing and event)
-        user.change_password(command.new_password, self.password_hasher)
+        await asyncio.to_thread(user.change_password, command.new_password, self.password_hasher)
 
         self.logger.info(f"Updating password for user: {user.username}")
 
@@ -44,3 +44,5 @@ class ListUsersQuery(BaseModel):
     user_type: UserTypeEnum | None = None
     is_active: bool | None = None
     include_deleted: bool = False
+    cursor: str | None = None
+    with_total: bool = False
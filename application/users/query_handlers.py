@@ -81,45 +81,53 @@ class UserQueryService:
     async def search_users(self, query: SearchUsersQuery) -> UserSearchResult:
         """搜索用户"""
         # 搜索用户
-        users, total_count = await self.user_repository.list_all(
+        result = await self.user_repository.list_all(
             page=query.page,
             page_size=query.page_size,
             search=query.search_term,
             user_type=query.user_type.value if query.user_type else None,
             is_active=query.is_active,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        user_views = [UserSummaryView.from_entity(user) for user in users]
+        user_views = [UserSummaryView.from_entity(user) for user in result.items]
 
         # 创建搜索结果
         return UserSearchResult.create(
             users=user_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def list_users(self, query: ListUsersQuery) -> UserSearchResult:
         """获取用户列表（保持向后兼容）"""
         # 搜索用户
-        users, total_count = await self.user_repository.list_all(
+        result = await self.user_repository.list_all(
             page=query.page,
             page_size=query.page_size,
             search=query.search,
             user_type=query.user_type.value if query.user_type else None,
             is_active=query.is_active,
             include_deleted=query.include_deleted,
+            cursor=query.cursor,
+            with_total=query.with_total,
         )
 
         # 创建摘要视图模型
-        user_views = [UserSummaryView.from_entity(user) for user in users]
+        user_views = [UserSummaryView.from_entity(user) for user in result.items]
 
         # 创建搜索结果
         return UserSearchResult.create(
             users=user_views,
-            total=total_count,
+            total=result.total,
             page=query.page,
             page_size=query.page_size,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
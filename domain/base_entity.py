@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from domain.common.events import DomainEvent
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 class BaseEntity(BaseModel):
     """Base entity class for all domain entities."""
 
+    # 不引入 __weakref__ 槽位；子类同样声明空 __slots__
+    __slots__ = ()
+
     id: str | None = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -26,9 +29,8 @@ class BaseEntity(BaseModel):
         }
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._domain_events: list[DomainEvent] = []
+    # 声明为私有属性，model_construct 创建的实例同样会初始化
+    _domain_events: list["DomainEvent"] = PrivateAttr(default_factory=list)
 
     def mark_as_deleted(self) -> None:
         """Mark the entity as deleted and update the updated_at timestamp."""
@@ -11,9 +11,7 @@ if TYPE_CHECKING:
 class AggregateRoot(BaseEntity):
     """Base class for aggregate roots with enhanced domain event capabilities."""
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Domain events are already initialized in BaseEntity
+    __slots__ = ()
 
     def add_domain_event(self, event: "DomainEvent") -> None:
         """Add a domain event to be published.
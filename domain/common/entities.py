@@ -1,5 +1,5 @@
 
-from pydantic import Field, RootModel
+from pydantic import ConfigDict, Field, RootModel
 
 from domain.base_entity import BaseEntity
 from domain.common.value_objects import EntityTypeEnum, I18nEnum, PictureEnum
@@ -21,8 +21,20 @@ class I18n(RootModel[dict[I18nEnum, str]]):
     - Provides small helpers for common operations
     """
 
+    __slots__ = ()
+    model_config = ConfigDict(frozen=True)
+
     root: dict[I18nEnum, str]
 
+    @classmethod
+    def from_storage(cls, data: dict[str, str] | None) -> "I18n":
+        """Build from a mapping read back from storage, skipping validation.
+
+        Stored mappings were validated on write, so only the keys need
+        converting back to ``I18nEnum``.
+        """
+        return cls.model_construct({I18nEnum(k): v for k, v in (data or {}).items()})
+
     def get_text(self, language: I18nEnum | str, fallback_language: I18nEnum | str | None = None) -> str | None:
         """Return text for language, with optional fallback."""
         if not self.root:
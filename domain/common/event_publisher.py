@@ -51,13 +51,21 @@ class EventPublisher:
     async def publish_events_from_aggregates(
         self, aggregates: list["AggregateRoot"]
     ) -> None:
-        """Publish all domain events from multiple aggregate roots.
+        """Publish all domain events from multiple aggregate roots in one batch.
+
+        Events are collected from every aggregate first and handed to the
+        event bus in a single ``publish_all`` call; the aggregates are cleared
+        only after the whole batch has been published.
 
         Args:
             aggregates: List of aggregate roots containing domain events.
         """
+        events = [event for aggregate in aggregates for event in aggregate.get_domain_events()]
+        if not events:
+            return
+        await self.event_bus.publish_all(events)
         for aggregate in aggregates:
-            await self.publish_events_from_aggregate(aggregate)
+            aggregate.clear_domain_events()
 
     async def publish_event(self, event: "DomainEvent") -> None:
         """Publish a single domain event directly.
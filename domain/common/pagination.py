@@ -0,0 +1,69 @@
+"""Keyset pagination cursor and page result shared by repository list/search methods."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from domain.common.value_object_base import ValueObject
+
+
+class PageCursor(ValueObject):
+    """Position after the last item of a page ordered by (created_at DESC, id DESC).
+
+    Clients only ever see the opaque encoded form returned by ``encode``.
+    """
+
+    created_at: datetime
+    id: str
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe string."""
+        payload = json.dumps([self.created_at.isoformat(), self.id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        """Decode a cursor produced by ``encode``; raises ValueError if it is malformed."""
+        try:
+            created_at, entity_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return cls(created_at=created_at, id=entity_id)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+class PageItem(Protocol):
+    """What ``Page.next_cursor`` reads from an item: entities and read-model rows both qualify."""
+
+    @property
+    def id(self) -> str | None: ...
+
+    @property
+    def created_at(self) -> datetime: ...
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T: PageItem]:
+    """One page of a list/search result.
+
+    ``has_more`` comes from fetching one row past the page, so no COUNT query is
+    needed to know whether another page exists; ``total`` is only filled in when
+    the caller explicitly asks for it.
+    """
+
+    items: list[T]
+    has_more: bool
+    total: int | None = None
+
+    @property
+    def next_cursor(self) -> str | None:
+        """Cursor for the following page, or None if this is the last page."""
+        if not self.has_more or not self.items:
+            return None
+        last = self.items[-1]
+        # An unsaved entity has no id and cannot mark a position
+        if last.id is None:
+            return None
+        return PageCursor(created_at=last.created_at, id=last.id).encode()
@@ -1,6 +1,5 @@
 from typing import TypeVar
 
-from loguru import logger
 from pydantic import BaseModel
 
 from domain.pet_records.value_objects import PetEventTypeEnum
@@ -141,16 +140,17 @@ class PetRecordDataFactory:
         return data_class(**kwargs)
 
     @classmethod
-    def parse_data(cls, event_type: PetEventTypeEnum, data: dict) -> PetRecordData:
-        """根据事件类型解析数据字典为对应的数据实例
+    def parse_data(cls, event_type: PetEventTypeEnum, data: dict | str | bytes) -> PetRecordData:
+        """根据事件类型解析数据为对应的数据实例
 
         Args:
             event_type: 宠物事件类型枚举
-            data: 数据字典
+            data: 数据字典，或原始 JSON 文本（直接解析，不生成中间 dict）
 
         Returns:
             解析后的数据实例
         """
-        logger.info(f"Parsing data for event type: {event_type}")
         data_class = cls.get_data_class(event_type)
+        if isinstance(data, str | bytes):
+            return data_class.model_validate_json(data)
         return data_class.model_validate(data)
@@ -1,5 +1,7 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 
+from domain.common.pagination import Page
 from domain.common.repository import BaseRepository
 from domain.pet_records.entities import PetRecord
 from domain.pet_records.value_objects import PetEventTypeEnum
@@ -38,12 +40,16 @@ class PetRecordRepository(BaseRepository[PetRecord]):
         event_type: PetEventTypeEnum | None = None,
         creator_id: str | None = None,
         include_deleted: bool = False,
-    ) -> tuple[list[PetRecord], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[PetRecord]:
         """
         获取记录列表
 
+        传入 cursor（上一页返回的游标）时按 keyset 分页，忽略 page；with_total 为真时才统计总数。
+
         Returns:
-            tuple[List[PetRecord], int]: (记录列表, 总数量)
+            Page[PetRecord]: 记录分页结果（total 仅在 with_total 为真时填充）
         """
         pass
 
@@ -57,6 +63,16 @@ class PetRecordRepository(BaseRepository[PetRecord]):
         """根据创建者ID获取记录列表"""
         pass
 
+    @abstractmethod
+    def iter_by_pet_id(self, pet_id: str) -> AsyncIterator[PetRecord]:
+        """流式遍历宠物的未删除记录（按创建时间倒序），适用于记录较多的宠物"""
+        pass
+
+    @abstractmethod
+    def iter_by_creator_id(self, creator_id: str) -> AsyncIterator[PetRecord]:
+        """流式遍历创建者的未删除记录（按创建时间倒序）"""
+        pass
+
     @abstractmethod
     async def search_pet_records(
         self,
@@ -67,6 +83,12 @@ class PetRecordRepository(BaseRepository[PetRecord]):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[PetRecord], int]:
-        """搜索宠物记录"""
+        cursor: str | None = None,
+        with_total: bool = False,
+        event_types: list[PetEventTypeEnum] | None = None,
+    ) -> Page[PetRecord]:
+        """搜索宠物记录，传入 cursor 时按 keyset 分页；with_total 为真时才统计总数
+
+        event_types 按多个事件类型筛选（匹配其中任意一个）。
+        """
         pass
@@ -22,6 +22,8 @@ class Breed(AggregateRoot):
     This is an aggregate root as breeds are managed independently.
     """
 
+    __slots__ = ()
+
     name: I18n = Field(..., description="Name of the breed keyed by locale")
     description: I18n | None = Field(
         default=None, description="Description of the breed keyed by locale"
@@ -72,6 +74,8 @@ class Gene(AggregateRoot):
     This is an aggregate root as genes are managed independently.
     """
 
+    __slots__ = ()
+
     name: I18n = Field(..., description="Name of the gene keyed by locale")
     alias: I18n | None = Field(
         default=None, description="Alias of the gene keyed by locale"
@@ -139,6 +143,8 @@ class Morphology(AggregateRoot):
     This is an aggregate root as morphologies are managed independently.
     """
 
+    __slots__ = ()
+
     name: I18n = Field(..., description="Name of the morphology keyed by locale")
     description: I18n | None = Field(
         default=None, description="Description of the morphology keyed by locale"
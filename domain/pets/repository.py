@@ -1,5 +1,7 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 
+from domain.common.pagination import Page
 from domain.common.repository import BaseRepository
 from domain.pets.entities import Breed, Gene, Morphology, Pet
 from domain.pets.value_objects import GeneCategoryEnum, InheritanceTypeEnum
@@ -8,6 +10,27 @@ from domain.pets.value_objects import GeneCategoryEnum, InheritanceTypeEnum
 class PetRepository(BaseRepository[Pet]):
     """宠物聚合Repository接口"""
 
+    @abstractmethod
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        search: str | None = None,
+        owner_id: str | None = None,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Pet]:
+        """
+        获取宠物列表
+
+        传入 cursor（上一页返回的游标）时按 keyset 分页，忽略 page；with_total 为真时才统计总数。
+
+        Returns:
+            Page[Pet]: 宠物分页结果（total 仅在 with_total 为真时填充）
+        """
+        pass
+
     @abstractmethod
     async def get_by_owner_id(self, owner_id: str) -> list[Pet]:
         """根据主人ID获取宠物列表"""
@@ -33,10 +56,37 @@ class PetRepository(BaseRepository[Pet]):
         """检查指定名称的宠物是否存在（可选排除ID）"""
         pass
 
+    @abstractmethod
+    async def bulk_create(self, pets: list[Pet]) -> int:
+        """批量创建宠物，返回插入的行数"""
+        pass
+
+    @abstractmethod
+    def iter_all(self, owner_id: str | None = None) -> AsyncIterator[Pet]:
+        """流式遍历未删除的宠物（可选按主人过滤），适用于导出等大结果集场景"""
+        pass
+
 
 class BreedRepository(BaseRepository[Breed]):
     """品种聚合Repository接口"""
 
+    @abstractmethod
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Breed]:
+        """获取品种列表，传入 cursor 时按 keyset 分页（page 仅作为无游标时的回退）；with_total 为真时才统计总数"""
+        pass
+
+    @abstractmethod
+    async def count(self, include_deleted: bool = False) -> int:
+        """统计品种数量"""
+        pass
+
     @abstractmethod
     async def get_by_name(self, name: str, language: str = "en") -> Breed | None:
         """根据名称获取品种（支持国际化）"""
@@ -50,7 +100,9 @@ class BreedRepository(BaseRepository[Breed]):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Breed], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Breed]:
         """
         搜索品种
 
@@ -60,9 +112,11 @@ class BreedRepository(BaseRepository[Breed]):
             page: 页码，从1开始
             page_size: 每页大小
             include_deleted: 是否包含已删除的记录
+            cursor: 上一页返回的游标（PageCursor），传入时忽略 page 并按 keyset 分页
+            with_total: 是否额外执行 COUNT 统计总数
 
         Returns:
-            tuple[List[Breed], int]: (品种列表, 总数量)
+            Page[Breed]: 品种分页结果（total 仅在 with_total 为真时填充）
         """
         pass
 
@@ -70,6 +124,23 @@ class BreedRepository(BaseRepository[Breed]):
 class GeneRepository(BaseRepository[Gene]):
     """基因聚合Repository接口"""
 
+    @abstractmethod
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Gene]:
+        """获取基因列表，传入 cursor 时按 keyset 分页（page 仅作为无游标时的回退）；with_total 为真时才统计总数"""
+        pass
+
+    @abstractmethod
+    async def count(self, include_deleted: bool = False) -> int:
+        """统计基因数量"""
+        pass
+
     @abstractmethod
     async def get_by_category(self, category: GeneCategoryEnum) -> list[Gene]:
         """根据基因类别获取基因列表"""
@@ -80,6 +151,16 @@ class GeneRepository(BaseRepository[Gene]):
         """根据遗传类型获取基因列表"""
         pass
 
+    @abstractmethod
+    def iter_by_category(self, category: GeneCategoryEnum) -> AsyncIterator[Gene]:
+        """流式遍历指定类别的基因，适用于大结果集场景"""
+        pass
+
+    @abstractmethod
+    def iter_by_inheritance_type(self, inheritance_type: InheritanceTypeEnum) -> AsyncIterator[Gene]:
+        """流式遍历指定遗传类型的基因，适用于大结果集场景"""
+        pass
+
     @abstractmethod
     async def get_by_notation(self, notation: str) -> Gene | None:
         """根据基因标记获取基因"""
@@ -95,7 +176,9 @@ class GeneRepository(BaseRepository[Gene]):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Gene], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Gene]:
         """
         搜索基因
 
@@ -107,9 +190,11 @@ class GeneRepository(BaseRepository[Gene]):
             page: 页码，从1开始
             page_size: 每页大小
             include_deleted: 是否包含已删除的记录
+            cursor: 上一页返回的游标（PageCursor），传入时忽略 page 并按 keyset 分页
+            with_total: 是否额外执行 COUNT 统计总数
 
         Returns:
-            tuple[List[Gene], int]: (基因列表, 总数量)
+            Page[Gene]: 基因分页结果（total 仅在 with_total 为真时填充）
         """
         pass
 
@@ -117,6 +202,18 @@ class GeneRepository(BaseRepository[Gene]):
 class MorphologyRepository(BaseRepository[Morphology]):
     """品系聚合Repository接口"""
 
+    @abstractmethod
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Morphology]:
+        """获取品系列表，传入 cursor 时按 keyset 分页（page 仅作为无游标时的回退）；with_total 为真时才统计总数"""
+        pass
+
     @abstractmethod
     async def get_by_gene_combination(self, gene_ids: list[str]) -> list[Morphology]:
         """根据基因组合获取品系列表"""
@@ -146,7 +243,9 @@ class MorphologyRepository(BaseRepository[Morphology]):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Morphology], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Morphology]:
         """
         搜索品系
 
@@ -157,8 +256,10 @@ class MorphologyRepository(BaseRepository[Morphology]):
             page: 页码，从1开始
             page_size: 每页大小
             include_deleted: 是否包含已删除的记录
+            cursor: 上一页返回的游标（PageCursor），传入时忽略 page 并按 keyset 分页
+            with_total: 是否额外执行 COUNT 统计总数
 
         Returns:
-            tuple[List[Morphology], int]: (品系列表, 总数量)
+            Page[Morphology]: 品系分页结果（total 仅在 with_total 为真时填充）
         """
         pass
@@ -17,6 +17,8 @@ class User(AggregateRoot):
     This is an aggregate root that encapsulates user-related business logic.
     """
 
+    __slots__ = ()
+
     username: str = Field(..., description="Unique username of the user")
     email: str = Field(..., description="Unique email address of the user")
     full_name: str | None = Field(default=None, description="Full name of the user")
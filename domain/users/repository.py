@@ -1,5 +1,6 @@
 from abc import abstractmethod
 
+from domain.common.pagination import Page
 from domain.common.repository import BaseRepository
 from domain.users.entities import User
 
@@ -17,6 +18,11 @@ class UserRepository(BaseRepository[User]):
         """根据ID获取用户"""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ids: list[str]) -> dict[str, User]:
+        """根据ID批量获取用户，返回 ID 到用户的映射（不存在或已删除的 ID 不出现在结果中）"""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> User | None:
         """根据邮箱获取用户"""
@@ -27,6 +33,11 @@ class UserRepository(BaseRepository[User]):
         """创建用户"""
         pass
 
+    @abstractmethod
+    async def bulk_create(self, users: list[User]) -> int:
+        """批量创建用户，返回插入的行数"""
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         """更新用户"""
@@ -41,12 +52,16 @@ class UserRepository(BaseRepository[User]):
         user_type: str | None = None,
         is_active: bool | None = None,
         include_deleted: bool = False,
-    ) -> tuple[list[User], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[User]:
         """
         获取用户列表
 
+        传入 cursor（上一页返回的游标）时按 keyset 分页，忽略 page；with_total 为真时才统计总数。
+
         Returns:
-            tuple[List[User], int]: (用户列表, 总数量)
+            Page[User]: 用户分页结果（total 仅在 with_total 为真时填充）
         """
         pass
 
@@ -39,6 +39,8 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     # 60 minutes * 24 hours * 8 days = 8 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8
+    # bcrypt 成本因子：每减少 1 轮哈希/校验耗时减半，只在威胁模型允许时调低
+    BCRYPT_ROUNDS: int = 12
     FRONTEND_HOST: str = "http://localhost:5173"
     BACKEND_HOST: str = "https://dev.didatx.cn/aidex"
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
@@ -61,6 +63,15 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    # 异步引擎连接池：pool_size 为常驻连接数，max_overflow 为高峰期允许额外创建的连接数
+    POSTGRES_POOL_SIZE: int = 20
+    POSTGRES_MAX_OVERFLOW: int = 10
+    # 连接最长复用时间（秒），避免被服务端或中间代理静默断开
+    POSTGRES_POOL_RECYCLE: int = 1800
+    # asyncpg 每条连接缓存的预备语句数量（驱动默认 100），热点查询复用服务端已解析的语句
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 500
+    # 经 PgBouncer（事务池模式）连接时开启：关闭预备语句缓存，且不发送 PgBouncer 不认识的启动参数
+    POSTGRES_PGBOUNCER: bool = False
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -7,17 +7,23 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.persistence.postgres.init_db import async_engine
+from infrastructure.persistence.postgres.init_db import async_session_maker
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session with automatic transaction management.
 
+    FastAPI caches dependencies per request, so every repository resolved for
+    the same request receives this one session and shares its single
+    transaction (one BEGIN/COMMIT per request). Repositories therefore must
+    not commit; they only flush when they need database-generated values
+    back before the request ends.
+
     Yields:
         AsyncSession: Database session with transaction started.
         Transaction is automatically committed on success or rolled back on error.
     """
-    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+    async with async_session_maker() as session:
         async with session.begin():
             yield session
 
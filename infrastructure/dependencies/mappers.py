@@ -1,6 +1,7 @@
 """Mapper dependency module.
 
-Provides entity-to-model mapper dependencies.
+Provides entity-to-model mapper dependencies. Mappers are stateless, so the
+object graph is built once at import time and shared by every request.
 """
 
 from infrastructure.persistence.postgres.mappers.breed_mapper import BreedMapper
@@ -17,6 +18,19 @@ from infrastructure.persistence.postgres.mappers.pet_record_mapper import (
 )
 from infrastructure.persistence.postgres.mappers.user_mapper import UserMapper
 
+_user_mapper = UserMapper()
+_breed_mapper = BreedMapper()
+_gene_mapper = GeneMapper()
+_morph_gene_mapping_mapper = MorphGeneMappingMapper(_gene_mapper)
+_morphology_mapper = MorphologyMapper(_morph_gene_mapping_mapper)
+_pet_mapper = PetMapper(
+    breed_mapper=_breed_mapper,
+    morphology_mapper=_morphology_mapper,
+    gene_mapping_mapper=_morph_gene_mapping_mapper,
+    user_mapper=_user_mapper,
+)
+_pet_record_mapper = PetRecordMapper()
+
 
 async def get_user_mapper() -> UserMapper:
     """Get user mapper instance.
@@ -24,7 +38,7 @@ async def get_user_mapper() -> UserMapper:
     Returns:
         UserMapper: Mapper for User entity to model conversion.
     """
-    return UserMapper()
+    return _user_mapper
 
 
 async def get_breed_mapper() -> BreedMapper:
@@ -33,7 +47,7 @@ async def get_breed_mapper() -> BreedMapper:
     Returns:
         BreedMapper: Mapper for Breed entity to model conversion.
     """
-    return BreedMapper()
+    return _breed_mapper
 
 
 async def get_gene_mapper() -> GeneMapper:
@@ -42,7 +56,7 @@ async def get_gene_mapper() -> GeneMapper:
     Returns:
         GeneMapper: Mapper for Gene entity to model conversion.
     """
-    return GeneMapper()
+    return _gene_mapper
 
 
 async def get_morph_gene_mapping_mapper(
@@ -51,13 +65,13 @@ async def get_morph_gene_mapping_mapper(
     """Get morph gene mapping mapper instance.
 
     Args:
-        gene_mapper: Optional gene mapper, creates new one if not provided.
+        gene_mapper: Optional gene mapper, uses the shared one if not provided.
 
     Returns:
         MorphGeneMappingMapper: Mapper for MorphGeneMapping entity to model conversion.
     """
     if gene_mapper is None:
-        gene_mapper = GeneMapper()
+        return _morph_gene_mapping_mapper
     return MorphGeneMappingMapper(gene_mapper)
 
 
@@ -67,13 +81,13 @@ async def get_morphology_mapper(
     """Get morphology mapper instance.
 
     Args:
-        morph_gene_mapping_mapper: Optional mapping mapper, creates new one if not provided.
+        morph_gene_mapping_mapper: Optional mapping mapper, uses the shared one if not provided.
 
     Returns:
         MorphologyMapper: Mapper for Morphology entity to model conversion.
     """
     if morph_gene_mapping_mapper is None:
-        morph_gene_mapping_mapper = MorphGeneMappingMapper(GeneMapper())
+        return _morphology_mapper
     return MorphologyMapper(morph_gene_mapping_mapper)
 
 
@@ -83,17 +97,7 @@ async def get_pet_mapper() -> PetMapper:
     Returns:
         PetMapper: Mapper for Pet entity to model conversion.
     """
-    breed_mapper = BreedMapper()
-    gene_mapper = GeneMapper()
-    morph_gene_mapping_mapper = MorphGeneMappingMapper(gene_mapper)
-    morphology_mapper = MorphologyMapper(morph_gene_mapping_mapper)
-    user_mapper = UserMapper()
-    return PetMapper(
-        breed_mapper=breed_mapper,
-        morphology_mapper=morphology_mapper,
-        gene_mapping_mapper=morph_gene_mapping_mapper,
-        user_mapper=user_mapper,
-    )
+    return _pet_mapper
 
 
 async def get_pet_record_mapper() -> PetRecordMapper:
@@ -102,5 +106,5 @@ async def get_pet_record_mapper() -> PetRecordMapper:
     Returns:
         PetRecordMapper: Mapper for PetRecord entity to model conversion.
     """
-    return PetRecordMapper()
+    return _pet_record_mapper
 
@@ -6,6 +6,9 @@ Provides password hashing and policy dependencies.
 from domain.users.services import PasswordHasher, PasswordPolicy
 from infrastructure.security.bcrypt_hasher import BcryptPasswordHasher
 
+# The hasher is stateless, so one instance is shared by every request
+_password_hasher = BcryptPasswordHasher()
+
 
 def get_password_hasher() -> PasswordHasher:
     """Get password hasher instance.
@@ -13,7 +16,7 @@ def get_password_hasher() -> PasswordHasher:
     Returns:
         PasswordHasher: Bcrypt password hasher implementation.
     """
-    return BcryptPasswordHasher()
+    return _password_hasher
 
 
 def get_password_policy() -> PasswordPolicy:
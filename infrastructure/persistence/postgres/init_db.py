@@ -1,14 +1,58 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from uuid import uuid4
+
+from pydantic_core import from_json
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import configure_mappers
 from sqlmodel import SQLModel
 
+# 统一从 models 包注册全部表，保证 create_all 看到完整且唯一的元数据
+import infrastructure.persistence.postgres.models  # noqa: F401
 from infrastructure.config import settings
 
-# 异步引擎
+# 启动时一次性解析全部关系（字符串形式的目标类等），避免推迟到首次查询
+configure_mappers()
+
+if settings.POSTGRES_PGBOUNCER:
+    # 事务池模式下同一会话的语句可能落在不同的服务端连接上：关闭两级预备语句缓存，
+    # 并为每条预备语句生成唯一名称，避免与其他客户端留在服务端连接上的同名语句冲突；
+    # PgBouncer 默认拒绝 jit 等未知启动参数，因此不再通过 server_settings 设置
+    _statement_cache_size = 0
+    _connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+else:
+    _statement_cache_size = settings.POSTGRES_STATEMENT_CACHE_SIZE
+    # 关闭 JIT：短小的 OLTP 查询上 JIT 编译开销大于收益
+    _connect_args = {"server_settings": {"jit": "off"}}
+
+# 异步引擎（asyncpg 驱动；配置中的 URI 使用 psycopg，供同步引擎使用）
+# 连接池为异步引擎默认的 AsyncAdaptedQueuePool，连接在请求之间复用
 async_engine: AsyncEngine = create_async_engine(
-    settings.SQLALCHEMY_DATABASE_URI.replace("postgresql://", "postgresql+asyncpg://"),
+    make_url(settings.SQLALCHEMY_DATABASE_URI)
+    .set(drivername="postgresql+asyncpg")
+    .update_query_dict({"prepared_statement_cache_size": str(_statement_cache_size)}),
     echo=False, # 打印SQL语句
-    future=True
+    future=True,
+    insertmanyvalues_page_size=1000,  # 批量插入时每条 INSERT 携带的行数
+    pool_size=settings.POSTGRES_POOL_SIZE,
+    max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+    pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    pool_pre_ping=True,  # 取出连接时检测连接是否仍然可用
+    connect_args=_connect_args,
+    # asyncpg 以二进制协议取回 JSON/JSONB，由 pydantic-core 的 Rust 解析器解码（比标准库 json.loads 快）
+    json_deserializer=from_json,
+)
+
+# 全局共享的会话工厂：会话配置只在启动时确定一次，所有会话都从 async_engine 的连接池取连接
+async_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 # 同步引擎（用于迁移等）
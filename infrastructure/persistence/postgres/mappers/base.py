@@ -1,9 +1,24 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Any, TypeVar
 
 DomainEntity = TypeVar('DomainEntity')
 DatabaseModel = TypeVar('DatabaseModel')
 
+# 由数据库默认值填充的列，值为空时不写入插入语句
+_SERVER_DEFAULT_COLUMNS = ("id", "created_at", "updated_at")
+
+# 批量转换超过该行数时放到工作线程执行，避免长时间占用事件循环；小批量直接转换，省去线程切换开销
+OFFLOAD_MIN_ROWS = 500
+
+
+def omit_server_defaults(row: dict[str, Any]) -> dict[str, Any]:
+    """去掉值为空、应由数据库默认值填充的列"""
+    for column in _SERVER_DEFAULT_COLUMNS:
+        if row.get(column) is None:
+            row.pop(column, None)
+    return row
+
 
 class BaseMapper[DomainEntity, DatabaseModel](ABC):
     """基础Mapper接口，定义实体与模型转换"""
@@ -22,10 +37,20 @@ class BaseMapper[DomainEntity, DatabaseModel](ABC):
         """批量转换数据库模型为领域实体"""
         return [self.to_domain(model) for model in models]
 
+    async def to_domain_list_async(self, models: list[DatabaseModel]) -> list[DomainEntity]:
+        """批量转换数据库模型为领域实体，大批量时在工作线程中执行"""
+        if len(models) < OFFLOAD_MIN_ROWS:
+            return self.to_domain_list(models)
+        return await asyncio.to_thread(self.to_domain_list, models)
+
     def to_model_list(self, entities: list[DomainEntity]) -> list[DatabaseModel]:
         """批量转换领域实体为数据库模型"""
         return [self.to_model(entity) for entity in entities]
 
+    def to_row(self, entity: DomainEntity) -> dict[str, Any]:
+        """领域实体转换为批量插入用的列字典"""
+        return omit_server_defaults(self.to_model(entity).model_dump())
+
     def to_domain_optional(self, model: DatabaseModel | None) -> DomainEntity | None:
         """可选的数据库模型转换为领域实体"""
         return self.to_domain(model) if model is not None else None
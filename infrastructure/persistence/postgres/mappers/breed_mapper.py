@@ -1,5 +1,3 @@
-from loguru import logger
-
 from domain.common.entities import I18n
 from domain.pets.entities import Breed
 from infrastructure.persistence.postgres.mappers.base import BaseMapper
@@ -11,13 +9,10 @@ class BreedMapper(BaseMapper[Breed, BreedModel]):
 
     def to_domain(self, model: BreedModel) -> Breed:
         """数据库模型转换为领域实体"""
-        # 直接传递 dict[str,str]
-        logger.info(f"Breed model: {model}")
-        name = I18n.model_validate(model.name or {})
-        description = I18n.model_validate(model.description) if model.description else None
-        logger.info(f"Breed name: {name}")
-        logger.info(f"Breed description: {description}")
-        return Breed(
+        name = I18n.from_storage(model.name or {})
+        description = I18n.from_storage(model.description) if model.description else None
+        # 数据库中的数据已经过校验，跳过 Pydantic 校验流程
+        return Breed.model_construct(
             id=model.id,
             name=name,
             description=description,
@@ -9,11 +9,12 @@ class GeneMapper(BaseMapper[Gene, GeneModel]):
 
     def to_domain(self, model: GeneModel) -> Gene:
         """数据库模型转换为领域实体"""
-        return Gene(
+        # 数据库中的数据已经过校验，跳过 Pydantic 校验流程
+        return Gene.model_construct(
             id=model.id,
-            name=I18n.model_validate(model.name or {}),
-            alias=I18n.model_validate(model.alias) if model.alias else None,
-            description=I18n.model_validate(model.description) if model.description else None,
+            name=I18n.from_storage(model.name or {}),
+            alias=I18n.from_storage(model.alias) if model.alias else None,
+            description=I18n.from_storage(model.description) if model.description else None,
             notation=model.notation,
             inheritance_type=model.inheritance_type,
             category=model.category,
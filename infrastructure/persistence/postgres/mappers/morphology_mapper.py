@@ -16,18 +16,15 @@ class MorphologyMapper(BaseMapper[Morphology, MorphologyModel]):
 
     def to_domain(self, model: MorphologyModel) -> Morphology:
         """数据库模型转换为领域实体"""
-        gene_mappings = []
-        if model.gene_mappings:
-            gene_mappings = [
-                self.gene_mapping_mapper.to_domain(mapping)
-                for mapping in model.gene_mappings
-            ]
+        # 品系聚合只持有基因映射的 ID，映射本身由各自的仓储加载
+        gene_mapping_ids = [mapping.id for mapping in model.gene_mappings or []]
 
-        return Morphology(
+        # 数据库中的数据已经过校验，跳过 Pydantic 校验流程
+        return Morphology.model_construct(
             id=model.id,
-            name=I18n.model_validate(model.name or {}),
-            description=I18n.model_validate(model.description) if model.description else None,
-            gene_mappings=gene_mappings,
+            name=I18n.from_storage(model.name or {}),
+            description=I18n.from_storage(model.description) if model.description else None,
+            gene_mapping_ids=gene_mapping_ids,
             picture_list=[],  # TODO: 实现图片转换逻辑
             created_at=model.created_at,
             updated_at=model.updated_at,
@@ -1,8 +1,10 @@
-
-from loguru import logger
+from typing import Any
 
 from domain.pets.entities import Pet
-from infrastructure.persistence.postgres.mappers.base import BaseMapper
+from infrastructure.persistence.postgres.mappers.base import (
+    BaseMapper,
+    omit_server_defaults,
+)
 from infrastructure.persistence.postgres.mappers.breed_mapper import BreedMapper
 from infrastructure.persistence.postgres.mappers.morph_gene_mapping_mapper import (
     MorphGeneMappingMapper,
@@ -31,8 +33,6 @@ class PetMapper(BaseMapper[Pet, PetModel]):
 
     def to_domain(self, model: PetModel) -> Pet:
         """数据库模型转换为领域实体"""
-        logger.info(f"Converting pet model: {model}")
-
         # 转换额外基因列表
         extra_gene_list = []
         if model.extra_gene_list:
@@ -72,3 +72,21 @@ class PetMapper(BaseMapper[Pet, PetModel]):
             updated_at=entity.updated_at,
             is_deleted=entity.is_deleted,
         )
+
+    def to_row(self, entity: Pet) -> dict[str, Any]:
+        """领域实体直接转换为批量插入用的列字典，不构建 PetModel 实例"""
+        return omit_server_defaults(
+            {
+                "id": entity.id,
+                "name": entity.name,
+                "description": entity.description,
+                "birth_date": entity.birth_date,
+                "owner_id": entity.owner_id,
+                "breed_id": entity.breed_id,
+                "gender": entity.gender,
+                "morphology_id": entity.morphology_id,
+                "created_at": entity.created_at,
+                "updated_at": entity.updated_at,
+                "is_deleted": entity.is_deleted,
+            }
+        )
@@ -15,7 +15,8 @@ class PetRecordMapper(BaseMapper[PetRecord, PetRecordModel]):
             data=model.event_data
         )
 
-        return PetRecord(
+        # 数据库中的数据已经过校验，跳过 Pydantic 校验流程（事件数据仍按类型解析）
+        return PetRecord.model_construct(
             id=model.id,
             pet_id=model.pet_id,
             creator_id=model.creator_id,
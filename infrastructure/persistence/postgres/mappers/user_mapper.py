@@ -3,6 +3,20 @@ from domain.users.entities import User
 from infrastructure.persistence.postgres.mappers.base import BaseMapper
 from infrastructure.persistence.postgres.models.user import UserModel
 
+# 实体与模型共享的字段，模块加载时确定一次
+_USER_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "full_name",
+    "hashed_password",
+    "user_type",
+    "is_active",
+    "created_at",
+    "updated_at",
+    "is_deleted",
+)
+
 
 class UserMapper(BaseMapper[User, UserModel]):
     """用户实体与模型转换器"""
@@ -12,30 +26,9 @@ class UserMapper(BaseMapper[User, UserModel]):
 
     def to_domain(self, model: UserModel) -> User:
         """数据库模型转换为领域实体"""
-        return User(
-            id=model.id,
-            username=model.username,
-            email=model.email,
-            full_name=model.full_name,
-            hashed_password=model.hashed_password,
-            user_type=model.user_type,
-            is_active=model.is_active,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            is_deleted=model.is_deleted,
-        )
+        # 数据库中的数据已经过校验，跳过 Pydantic 校验流程
+        return User.model_construct(**{field: getattr(model, field) for field in _USER_FIELDS})
 
     def to_model(self, entity: User) -> UserModel:
         """领域实体转换为数据库模型"""
-        return UserModel(
-            id=entity.id,
-            username=entity.username,
-            email=entity.email,
-            full_name=entity.full_name,
-            hashed_password=entity.hashed_password,
-            user_type=entity.user_type,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-            is_deleted=entity.is_deleted,
-        )
+        return UserModel(**{field: getattr(entity, field) for field in _USER_FIELDS})
@@ -7,6 +7,10 @@ from infrastructure.persistence.postgres.models.morph_gene_mapping import MorphG
 from infrastructure.persistence.postgres.models.pet import PetModel
 from infrastructure.persistence.postgres.models.picture import PictureModel
 from infrastructure.persistence.postgres.models.pet_record import PetRecordModel
+from infrastructure.persistence.postgres.models.user import UserModel
+
+# 注册软删除查询条件（do_orm_execute 事件）
+import infrastructure.persistence.postgres.models.soft_delete  # noqa: F401
 
 __all__ = [
     "BaseModel",
@@ -17,4 +21,5 @@ __all__ = [
     "PetModel",
     "PictureModel",
     "PetRecordModel",
+    "UserModel",
 ]
@@ -1,27 +1,40 @@
 import datetime
-import uuid
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, func, text
 from sqlmodel import Field, SQLModel
 
+from infrastructure.persistence.postgres.models.types import UUIDType
+
 
 class BaseModel(SQLModel):
     model_config = {
         "arbitrary_types_allowed": True  # 允许使用任意类型，包括 datetime
     }
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
+    # 服务端生成的默认值随 INSERT/UPDATE 的 RETURNING 一并取回，避免访问时再次查询
+    __mapper_args__ = {"eager_defaults": True}
+
+    # 未指定 ID 时由数据库生成（INSERT ... RETURNING 取回），不在 Python 侧逐行生成
+    id: str | None = Field(
+        default=None,
+        primary_key=True,
+        sa_type=UUIDType,
+        sa_column_kwargs={"server_default": text("gen_random_uuid()")},
+    )
 
-    created_at: datetime = Field(
-        default_factory=datetime.datetime.now,
+    # 时间戳由数据库在语句级别填充（now()），不在 Python 侧逐行取时钟
+    created_at: datetime.datetime | None = Field(
+        default=None,
         sa_type=DateTime(timezone=True),
-        nullable=False
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
 
-    updated_at: datetime = Field(
-        default_factory=datetime.datetime.now,
+    updated_at: datetime.datetime | None = Field(
+        default=None,
         sa_type=DateTime(timezone=True),
-        nullable=False
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
     is_deleted: bool = Field(default=False, nullable=False)
@@ -1,7 +1,12 @@
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field
 
 from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.indexes import (
+    add_search_vector,
+    i18n_trigram_indexes,
+)
+from infrastructure.persistence.postgres.models.types import JSONBType
 
 
 class BreedModel(BaseModel, table=True):
@@ -10,10 +15,32 @@ class BreedModel(BaseModel, table=True):
     __tablename__ = "breeds"
 
     name: dict[str, str] = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSONBType, nullable=False),
         description="I18n name of the breed keyed by locale"
     )
     description: dict[str, str] | None = Field(
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONBType, nullable=True),
         description="I18n description of the breed keyed by locale"
     )
+
+    __table_args__ = (
+        # GIN 索引（jsonb_path_ops）：get_by_name 的 name @> {"<locale>": "<name>"} 包含查询（仅 PostgreSQL）
+        Index(
+            "idx_breeds_name_gin",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index("idx_breeds_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        # 三元组索引：search_breeds 的 ILIKE '%term%' 模糊搜索
+        *i18n_trigram_indexes("breeds", "name", "description"),
+    )
+
+
+# 英文全文检索向量（tsvector 生成列 + GIN 索引）
+add_search_vector(
+    BreedModel.__table__,
+    "name ->> 'en_US'",
+    "description ->> 'en_US'",
+)
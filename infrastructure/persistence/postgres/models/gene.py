@@ -1,25 +1,44 @@
-from sqlalchemy import JSON, Column, Enum, String
+from sqlalchemy import Column, Index, String, text
 from sqlmodel import Field
 
 from domain.pets.value_objects import GeneCategoryEnum, InheritanceTypeEnum
 from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.indexes import (
+    add_search_vector,
+    i18n_trigram_indexes,
+)
+from infrastructure.persistence.postgres.models.types import JSONBType, SmallIntEnumType
 
 
 class GeneModel(BaseModel, table=True):
     """Gene model representing a gene in the database."""
 
     __tablename__ = "genes"
+    __table_args__ = (
+        # 部分索引：基因查询只针对未删除的记录（按 ID 的查找已由主键覆盖）
+        Index("idx_genes_notation_active", "notation", postgresql_where=text("is_deleted = false")),
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index("idx_genes_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        # 三元组索引：search_genes 的 ILIKE '%term%' 模糊搜索
+        *i18n_trigram_indexes("genes", "name", "alias", "description"),
+        Index(
+            "idx_genes_notation_trgm",
+            "notation",
+            postgresql_using="gin",
+            postgresql_ops={"notation": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     name: dict[str, str] = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSONBType, nullable=False),
         description="I18n name of the gene"
     )
     alias: dict[str, str] | None = Field(
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONBType, nullable=True),
         description="I18n alias of the gene"
     )
     description: dict[str, str] | None = Field(
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONBType, nullable=True),
         description="I18n description of the gene"
     )
     notation: str | None = Field(
@@ -27,10 +46,20 @@ class GeneModel(BaseModel, table=True):
         description="Notation of the gene"
     )
     inheritance_type: InheritanceTypeEnum | None = Field(
-        sa_column=Column(Enum(InheritanceTypeEnum), nullable=True),
+        sa_column=Column(SmallIntEnumType(InheritanceTypeEnum), nullable=True),
         description="Inheritance type of the gene"
     )
     category: GeneCategoryEnum | None = Field(
-        sa_column=Column(Enum(GeneCategoryEnum), nullable=True),
+        sa_column=Column(SmallIntEnumType(GeneCategoryEnum), nullable=True),
         description="Category of the gene"
     )
+
+
+# 英文全文检索向量（tsvector 生成列 + GIN 索引）
+add_search_vector(
+    GeneModel.__table__,
+    "name ->> 'en_US'",
+    "alias ->> 'en_US'",
+    "description ->> 'en_US'",
+    "notation",
+)
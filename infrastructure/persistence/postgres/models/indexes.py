@@ -0,0 +1,102 @@
+from sqlalchemy import (
+    DDL,
+    ColumnElement,
+    Index,
+    Table,
+    event,
+    func,
+    literal,
+    literal_column,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import SQLModel
+
+from domain.common.value_objects import I18nEnum
+
+# pg_trgm 提供 gin_trgm_ops，使 ILIKE '%term%' 可以走 GIN 索引而不是顺序扫描
+event.listen(
+    SQLModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def i18n_trigram_indexes(table: str, *columns: str) -> tuple[Index, ...]:
+    """为 I18n JSONB 列的每种语言文本建立 pg_trgm GIN 索引（仅 PostgreSQL）
+
+    查询条件必须与索引表达式一致：使用 column[language].as_string()，即 column ->> 'language'。
+    """
+    return tuple(
+        Index(
+            f"idx_{table}_{column}_{language.value.lower()}_trgm",
+            text(f"({column} ->> '{language.value}') gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql")
+        for column in columns
+        for language in I18nEnum
+    )
+
+
+def i18n_text(column, language: str):
+    """I18n JSONB 列中指定语言的文本表达式（column ->> 'language'），与上面的三元组索引表达式一致
+
+    语言键以字面量渲染到 SQL 中，使规划器（包括通用计划）能够匹配表达式索引。
+    """
+    return column[literal(language, literal_execute=True)].as_string()
+
+
+# 全文检索向量只为英文建立：中文没有合适的分词配置，仍使用三元组索引的 ILIKE 搜索
+SEARCH_VECTOR_LANGUAGE = I18nEnum.EN_US
+SEARCH_VECTOR_COLUMN = "tsv_en_us"
+SEARCH_VECTOR_CONFIG = "english"
+
+
+# Table.info 中记录该表需要的全文检索 DDL（均为幂等语句）
+SEARCH_VECTOR_DDL = "search_vector_ddl"
+
+
+def add_search_vector(
+    table: Table,
+    *sources: str,
+    config: str = SEARCH_VECTOR_CONFIG,
+    column: str = SEARCH_VECTOR_COLUMN,
+) -> None:
+    """在 PostgreSQL 上为表添加 tsvector 生成列及其 GIN 索引
+
+    该列不映射到模型（ORM 查询不会加载它），只用于全文检索条件，见 search_vector_match。
+    语句使用 IF NOT EXISTS，并在每次 create_all 结束后执行：create_all 会跳过已存在的表，
+    已有数据库因此也会在启动时补上该列与索引，而不是在查询时报列不存在。
+    """
+    document = " || ' ' || ".join(f"coalesce({source}, '')" for source in sources)
+    table.info.setdefault(SEARCH_VECTOR_DDL, []).extend(
+        (
+            f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column} tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{config}', {document})) STORED",
+            f"CREATE INDEX IF NOT EXISTS idx_{table.name}_{column} ON {table.name} USING gin ({column})",
+        )
+    )
+
+
+@event.listens_for(SQLModel.metadata, "after_create")
+def _create_search_vectors(target, connection, **_kw) -> None:
+    """create_all 结束后为全部表补齐全文检索列与索引（包括 create_all 跳过的已有表）"""
+    if connection.dialect.name != "postgresql":
+        return
+    for table in target.sorted_tables:
+        for statement in table.info.get(SEARCH_VECTOR_DDL, ()):
+            connection.execute(DDL(statement))
+
+
+def search_vector_match(
+    table: Table,
+    term: str,
+    config: str = SEARCH_VECTOR_CONFIG,
+    column: str = SEARCH_VECTOR_COLUMN,
+) -> ColumnElement[bool]:
+    """tsvector 生成列的全文检索条件：tsv @@ plainto_tsquery(config, term)
+
+    config 必须与生成列使用的配置一致，否则查询词与索引中的词位不匹配。
+    """
+    vector = literal_column(f"{table.name}.{column}", TSVECTOR)
+    return vector.bool_op("@@")(func.plainto_tsquery(config, term))
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
-    Enum,
     ForeignKey,
     Index,
-    String,
-    UniqueConstraint,
+    text,
 )
 from sqlmodel import Field, Relationship
 
@@ -16,6 +15,7 @@ from infrastructure.persistence.postgres.models.base import BaseModel
 from infrastructure.persistence.postgres.models.gene import GeneModel
 from infrastructure.persistence.postgres.models.morphology import MorphologyModel
 from infrastructure.persistence.postgres.models.pet import PetModel
+from infrastructure.persistence.postgres.models.types import SmallIntEnumType, UUIDType
 
 
 class MorphGeneMappingModel(BaseModel, table=True):
@@ -29,19 +29,19 @@ class MorphGeneMappingModel(BaseModel, table=True):
     __tablename__ = "morph_gene_mappings"
 
     gene_id: str = Field(
-        sa_column=Column(String, ForeignKey("genes.id"), nullable=False),
+        sa_column=Column(UUIDType, ForeignKey("genes.id"), nullable=False),
         description="Foreign key to gene"
     )
     morphology_id: str | None = Field(
-        sa_column=Column(String, ForeignKey("morphologies.id"), nullable=True),
+        sa_column=Column(UUIDType, ForeignKey("morphologies.id"), nullable=True),
         description="Foreign key to morphology (null for pet-specific genes)"
     )
     pet_id: str | None = Field(
-        sa_column=Column(String, ForeignKey("pets.id"), nullable=True),
+        sa_column=Column(UUIDType, ForeignKey("pets.id"), nullable=True),
         description="Foreign key to pet (null for morphology definition)"
     )
     zygosity: ZygosityEnum = Field(
-        sa_column=Column(Enum(ZygosityEnum), nullable=False, default=ZygosityEnum.UNKNOWN),
+        sa_column=Column(SmallIntEnumType(ZygosityEnum), nullable=False, default=ZygosityEnum.UNKNOWN),
         description="Zygosity type"
     )
     is_required: bool = Field(
@@ -51,21 +51,26 @@ class MorphGeneMappingModel(BaseModel, table=True):
 
     # 数据库约束和索引
     __table_args__ = (
-        # 确保每条记录要么属于morphology要么属于pet，不能两者都为空
-        # 这个约束需要通过应用层或数据库触发器来实现，SQLAlchemy不直接支持这种约束
+        # 检查约束：每条记录必须且只能属于morphology或pet之一
+        CheckConstraint(
+            '(morphology_id IS NOT NULL) <> (pet_id IS NOT NULL)',
+            name='morph_gene_mapping_xor',
+        ),
 
-        # 唯一约束：防止morphology重复添加相同基因
-        UniqueConstraint('morphology_id', 'gene_id', name='unique_morphology_gene'),
-        # 唯一约束：防止宠物重复添加相同基因
-        UniqueConstraint('pet_id', 'gene_id', name='unique_pet_gene'),
+        # 部分唯一索引：防止morphology重复添加相同基因（已软删除的记录不参与，删除后可重新添加）
+        Index(
+            'unique_morphology_gene', 'morphology_id', 'gene_id',
+            unique=True, postgresql_where=text('is_deleted = false'),
+        ),
+        # 部分唯一索引：防止宠物重复添加相同基因（已软删除的记录不参与）
+        Index(
+            'unique_pet_gene', 'pet_id', 'gene_id',
+            unique=True, postgresql_where=text('is_deleted = false'),
+        ),
 
-        # 索引：优化根据品系ID查询基因的性能
-        Index('idx_morphology_genes', 'morphology_id'),
-        # 索引：优化根据宠物ID查询额外基因的性能
-        Index('idx_pet_extra_genes', 'pet_id'),
         # 索引：优化根据基因ID查询的性能
         Index('idx_gene_mappings', 'gene_id'),
-        # 复合索引：优化按杂合性查询的性能
+        # 复合索引：优化按杂合性查询的性能；前导列同时服务于按品系ID/宠物ID的查询
         Index('idx_morphology_gene_zygosity', 'morphology_id', 'zygosity'),
         Index('idx_pet_gene_zygosity', 'pet_id', 'zygosity'),
     )
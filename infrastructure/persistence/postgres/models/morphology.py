@@ -1,9 +1,11 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, Relationship
 
 from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.indexes import i18n_trigram_indexes
+from infrastructure.persistence.postgres.models.types import JSONBType
 
 if TYPE_CHECKING:
     from infrastructure.persistence.postgres.models.morph_gene_mapping import (
@@ -17,14 +19,23 @@ class MorphologyModel(BaseModel, table=True):
     __tablename__ = "morphologies"
 
     name: dict[str, str] = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(JSONBType, nullable=False),
         description="I18n name of the morphology"
     )
     description: dict[str, str] | None = Field(
-        sa_column=Column(JSON, nullable=True),
+        sa_column=Column(JSONBType, nullable=True),
         description="I18n description of the morphology"
     )
 
+    __table_args__ = (
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index(
+            "idx_morphologies_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")
+        ),
+        # 三元组索引：search_morphologies 的 ILIKE '%term%' 模糊搜索
+        *i18n_trigram_indexes("morphologies", "name", "description"),
+    )
+
     # Relationships
     # 使用字符串引用避免循环导入
     gene_mappings: list["MorphGeneMappingModel"] = Relationship(
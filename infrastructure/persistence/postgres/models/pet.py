@@ -1,13 +1,15 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, text
 from sqlmodel import Field, Relationship
 
 from domain.pets.value_objects import GenderEnum
 from infrastructure.persistence.postgres.models.base import BaseModel
 from infrastructure.persistence.postgres.models.breed import BreedModel
+from infrastructure.persistence.postgres.models.indexes import add_search_vector
 from infrastructure.persistence.postgres.models.morphology import MorphologyModel
+from infrastructure.persistence.postgres.models.types import SmallIntEnumType, UUIDType
 
 if TYPE_CHECKING:
     from infrastructure.persistence.postgres.models.morph_gene_mapping import (
@@ -34,25 +36,55 @@ class PetModel(BaseModel, table=True):
         description="Birth date of the pet",
     )
     owner_id: str = Field(
-        sa_column=Column(String, ForeignKey("users.id"), nullable=False),
+        sa_column=Column(UUIDType, ForeignKey("users.id"), nullable=False),
         description="Foreign key to owner"
     )
     breed_id: str = Field(
-        sa_column=Column(String, ForeignKey("breeds.id"), nullable=False),
+        sa_column=Column(UUIDType, ForeignKey("breeds.id"), nullable=False),
         description="Foreign key to breed",
     )
     gender: GenderEnum = Field(
-        sa_column=Column(Enum(GenderEnum), nullable=False, default=GenderEnum.UNKNOWN),
+        sa_column=Column(SmallIntEnumType(GenderEnum), nullable=False, default=GenderEnum.UNKNOWN),
         description="Gender of the pet",
     )
     morphology_id: str | None = Field(
-        sa_column=Column(String, ForeignKey("morphologies.id"), nullable=True),
+        sa_column=Column(UUIDType, ForeignKey("morphologies.id"), nullable=True),
         description="Foreign key to morphology",
     )
 
+    __table_args__ = (
+        # 部分索引：按主人查询未删除的宠物
+        Index("idx_pets_owner_active", "owner_id", postgresql_where=text("is_deleted = false")),
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index("idx_pets_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        # 部分索引：按名称精确查找与重名检查
+        Index("idx_pets_name_active", "name", postgresql_where=text("is_deleted = false")),
+        # 三元组索引：按名称的 ILIKE '%term%' 模糊搜索（前导通配符无法使用 B-tree）
+        Index(
+            "idx_pets_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_where=text("is_deleted = false"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationships
     breed: BreedModel = Relationship()
     morphology: MorphologyModel | None = Relationship()
     owner: "UserModel" = Relationship(back_populates="pets")
     # 使用字符串引用避免循环导入
     extra_gene_list: list["MorphGeneMappingModel"] = Relationship(back_populates="pet")
+
+
+# 宠物名称没有语言之分，全文检索使用不做词干化的 simple 配置；
+# 多个词按任意顺序匹配，单词内的子串仍由上面的三元组索引负责
+PET_NAME_SEARCH_CONFIG = "simple"
+PET_NAME_SEARCH_COLUMN = "name_tsv"
+
+add_search_vector(
+    PetModel.__table__,
+    "name",
+    config=PET_NAME_SEARCH_CONFIG,
+    column=PET_NAME_SEARCH_COLUMN,
+)
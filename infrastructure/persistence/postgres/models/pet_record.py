@@ -1,11 +1,16 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, Column, ForeignKey, String
-from sqlmodel import Enum, Field, Relationship
+from sqlalchemy import Column, ForeignKey, Index, text
+from sqlmodel import Field, Relationship
 
 from domain.pet_records.pet_record_data import PetRecordData
 from domain.pet_records.value_objects import PetEventTypeEnum
 from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.types import (
+    RawJSONBType,
+    SmallIntEnumType,
+    UUIDType,
+)
 
 if TYPE_CHECKING:
     from infrastructure.persistence.postgres.models.pet import PetModel
@@ -18,22 +23,52 @@ class PetRecordModel(BaseModel, table=True):
     __tablename__ = "pet_records"
 
     pet_id: str = Field(
-        sa_column=Column(String, ForeignKey("pets.id"), nullable=False),
+        sa_column=Column(UUIDType, ForeignKey("pets.id"), nullable=False),
         description="ID of the pet"
     )
 
     creator_id: str = Field(
-        sa_column=Column(String, ForeignKey("users.id"), nullable=False),
+        sa_column=Column(UUIDType, ForeignKey("users.id"), nullable=False),
         description="ID of the creator"
     )
 
     event_type: PetEventTypeEnum = Field(
-        sa_column=Column(Enum(PetEventTypeEnum), nullable=False),
+        sa_column=Column(SmallIntEnumType(PetEventTypeEnum), nullable=False),
     )
+    # 读取时为原始 JSON 文本，由 PetRecordMapper 按 event_type 解析为对应的数据类
     event_data: PetRecordData = Field(
-        sa_column=Column(JSON, nullable=False),
+        sa_column=Column(RawJSONBType, nullable=False),
         description="Data of the record"
     )
 
+    __table_args__ = (
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index(
+            "idx_pet_records_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")
+        ),
+        # 等值过滤列在前、排序列在后：按宠物/创建者/事件类型过滤后直接按索引顺序读取，无需再排序
+        Index(
+            "idx_pet_records_pet_created",
+            "pet_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "idx_pet_records_creator_created",
+            "creator_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "idx_pet_records_event_type_created",
+            "event_type",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     pet: "PetModel" = Relationship()
     creator: "UserModel" = Relationship()
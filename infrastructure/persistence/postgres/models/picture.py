@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Enum, String
+from sqlalchemy import Column, String
 from sqlmodel import Field
 
 from domain.common.value_objects import EntityTypeEnum, PictureEnum
 from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.types import SmallIntEnumType, UUIDType
 
 
 class PictureModel(BaseModel, table=True):
@@ -15,14 +16,14 @@ class PictureModel(BaseModel, table=True):
         description="URL of the picture"
     )
     picture_type: PictureEnum = Field(
-        sa_column=Column(Enum(PictureEnum), nullable=False),
+        sa_column=Column(SmallIntEnumType(PictureEnum), nullable=False),
         description="Type of the picture"
     )
     entity_id: str = Field(
-        sa_column=Column(String, nullable=False),
+        sa_column=Column(UUIDType, nullable=False),
         description="ID of the entity this picture belongs to"
     )
     entity_type: EntityTypeEnum = Field(
-        sa_column=Column(Enum(EntityTypeEnum), nullable=False),
+        sa_column=Column(SmallIntEnumType(EntityTypeEnum), nullable=False),
         description="Type of the entity"
     )
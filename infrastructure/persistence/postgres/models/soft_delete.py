@@ -0,0 +1,37 @@
+from sqlalchemy import event, false
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from infrastructure.persistence.postgres.models.breed import BreedModel
+from infrastructure.persistence.postgres.models.gene import GeneModel
+
+# 查询时默认排除已软删除记录的模型
+SOFT_DELETE_MODELS = (BreedModel, GeneModel)
+
+# 需要包含已删除记录时：statement.execution_options(include_deleted=True)
+INCLUDE_DELETED = "include_deleted"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(state: ORMExecuteState) -> None:
+    """为以软删除模型为主体的 SELECT 自动追加 is_deleted = false 条件
+
+    条件写作 = false（而不是 IS false），与 WHERE is_deleted = false 的部分索引谓词一致，
+    规划器才能使用这些部分索引。关系加载不受影响：已删除的品种仍可作为宠物的关联对象加载。
+    """
+    if not state.is_select or state.is_column_load or state.is_relationship_load:
+        return
+    if state.execution_options.get(INCLUDE_DELETED, False):
+        return
+
+    mapper = state.bind_mapper
+    if mapper is None or mapper.class_ not in SOFT_DELETE_MODELS:
+        return
+
+    state.statement = state.statement.options(
+        with_loader_criteria(
+            mapper.class_,
+            lambda cls: cls.is_deleted == false(),
+            include_aliases=True,
+            propagate_to_loaders=False,
+        )
+    )
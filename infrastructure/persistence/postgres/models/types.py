@@ -0,0 +1,103 @@
+import re
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Dialect,
+    SmallInteger,
+    String,
+    Text,
+    TypeDecorator,
+    cast,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeEngine
+
+# PostgreSQL 上使用 JSONB（预解析的二进制存储，可建立 GIN 索引），
+# SQLite（集成测试）回退为 JSON
+JSONBType = JSONB().with_variant(JSON(), "sqlite")
+
+# PostgreSQL 上使用原生 UUID（16 字节），Python 侧仍以字符串表示；其他方言回退为 String
+UUIDType = String().with_variant(PG_UUID(as_uuid=False), "postgresql")
+
+# 各驱动都接受的 UUID 文本：8-4-4-4-12 分组的 32 个十六进制数字，连字符可省略。
+# 不用 uuid.UUID 判断：它还接受 "urn:uuid:" 前缀和花括号，驱动编码或 PostgreSQL 会拒绝这些写法
+_UUID_TEXT = re.compile(
+    r"[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+def is_valid_id(session: AsyncSession, value: str | None) -> bool:
+    """ID 能否与 UUIDType 列比较
+
+    PostgreSQL 的 uuid 列遇到非 UUID 文本时整条语句报 DataError；这样的 ID 本就不可能对应任何行，
+    调用方应直接按"未找到"处理。其他方言回退为 String 列，任何字符串都可以比较。
+    """
+    bind = session.bind
+    if bind is None or bind.dialect.name != "postgresql":
+        return True
+    return _UUID_TEXT.fullmatch(str(value)) is not None
+
+
+class RawJSONBType(TypeDecorator[Any]):
+    """JSONB 列：写入时直接接受 Pydantic 值对象，读取时返回原始 JSON 文本
+
+    读取结果不经过 json.loads 生成中间 dict，由映射器按具体类型一次性解析。
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value: Any | None, dialect: Dialect) -> Any:
+        if isinstance(value, PydanticBaseModel):
+            return value.model_dump(mode="json")
+        return value
+
+    def column_expression(self, column: ColumnElement[Any]) -> ColumnElement[Any]:
+        return cast(column, Text)
+
+    def result_processor(self, dialect: Dialect, coltype: object) -> None:
+        return None
+
+
+class SmallIntEnumType(TypeDecorator[Enum]):
+    """以 SMALLINT（2 字节）存储的枚举列，在 Python 侧完成 int <-> 枚举 的映射
+
+    编号按枚举成员的声明顺序从 1 开始分配：新增成员只能追加在末尾，
+    已有成员不能重排或删除，否则会改变已存数据的含义。
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._codes = {member: code for code, member in enumerate(enum_class, start=1)}
+        self._members = {code: member for member, code in self._codes.items()}
+
+    def process_bind_param(self, value: Enum | str | None, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> Enum | None:
+        if value is None:
+            return None
+        try:
+            return self._members[value]
+        except KeyError:
+            raise ValueError(
+                f"Unknown {self.enum_class.__name__} code {value}: "
+                f"expected 1-{len(self._members)} in declaration order"
+            ) from None
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship
 
 from domain.users.value_objects import UserTypeEnum
@@ -21,6 +22,25 @@ class UserModel(BaseModel, table=True):
     user_type: UserTypeEnum = Field(default=UserTypeEnum.USER, nullable=False)
     is_active: bool = Field(default=True, nullable=False)
 
+    __table_args__ = (
+        # 部分索引：登录与唯一性校验只查询未删除的用户
+        Index("idx_users_username_active", "username", postgresql_where=text("is_deleted = false")),
+        Index("idx_users_email_active", "email", postgresql_where=text("is_deleted = false")),
+        # keyset 分页：(created_at, id) 有序索引，反向扫描即可满足 DESC 排序
+        Index("idx_users_keyset", "created_at", "id", postgresql_where=text("is_deleted = false")),
+        # 三元组索引：用户列表按用户名/邮箱/姓名的 ILIKE '%term%' 模糊搜索（前导通配符无法使用 B-tree）
+        *(
+            Index(
+                f"idx_users_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_where=text("is_deleted = false"),
+            ).ddl_if(dialect="postgresql")
+            for column in ("username", "email", "full_name")
+        ),
+    )
+
     # Relationships
     pets: list["PetModel"] = Relationship(back_populates="owner")
 
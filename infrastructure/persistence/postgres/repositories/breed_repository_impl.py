@@ -1,17 +1,57 @@
 from loguru import logger
-from sqlalchemy import func, or_, select
+from sqlalchemy import bindparam, false, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import String, cast
 
 from domain.common.event_publisher import EventPublisher
+from domain.common.pagination import Page
 from domain.pets.entities import Breed
 from domain.pets.exceptions import BreedNotFoundError, BreedRepositoryError
 from domain.pets.repository import BreedRepository
 from infrastructure.persistence.postgres.mappers.breed_mapper import BreedMapper
 from infrastructure.persistence.postgres.models.breed import BreedModel
+from infrastructure.persistence.postgres.models.indexes import (
+    SEARCH_VECTOR_LANGUAGE,
+    i18n_text,
+    search_vector_match,
+)
+from infrastructure.persistence.postgres.models.types import is_valid_id
+from infrastructure.persistence.postgres.repositories.bulk_copy import copy_rows
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+)
 from infrastructure.persistence.postgres.repositories.event_aware_repository import (
     EventAwareRepository,
 )
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.projection import entity_columns
+
+# 只读列表/查找路径按列投影，返回 Row 直接映射为领域实体，不构建 ORM 实例
+_BREED_COLUMNS = entity_columns(BreedModel)
+
+# 热点查询（未删除条件由 soft_delete 全局追加）
+_GET_BY_ID = select(BreedModel).where(BreedModel.id == bindparam("id"))
+# 单条 UPDATE ... RETURNING
+_UPDATE = (
+    update(BreedModel)
+    .where(BreedModel.id == bindparam("breed_id"), BreedModel.is_deleted == false())
+    .values(
+        name=bindparam("new_name"),
+        description=bindparam("new_description"),
+        updated_at=bindparam("new_updated_at"),
+    )
+    .returning(BreedModel)
+    .execution_options(populate_existing=True)
+)
+# 单条 UPDATE 软删除
+_SOFT_DELETE = (
+    update(BreedModel)
+    .where(BreedModel.id == bindparam("breed_id"), BreedModel.is_deleted == false())
+    .values(is_deleted=True)
+)
 
 
 class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository):
@@ -25,13 +65,10 @@ class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository
 
     async def get_by_id(self, entity_id: str) -> Breed | None:
         """根据ID获取品种"""
+        if not is_valid_id(self.session, entity_id):
+            return None
         try:
-            stmt = (
-                select(BreedModel)
-                .where(BreedModel.id == entity_id)
-                .where(BreedModel.is_deleted.is_(False))
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_BY_ID, {"id": entity_id})
             model = result.scalar_one_or_none()
 
             if model is None:
@@ -39,50 +76,58 @@ class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository
 
             return self.mapper.to_domain(model)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to get breed by id {entity_id}: {e}")
             raise BreedRepositoryError(f"Failed to get breed: {e}", "get_by_id")
 
     async def create(self, entity: Breed) -> Breed:
         """创建品种"""
         try:
-            model = self.mapper.to_model(entity)
-            self.session.add(model)
-            await self.session.flush()
-            await self.session.refresh(model)
+            # 单条 INSERT ... RETURNING 直接取回完整行（含服务端默认值），不经过工作单元的 flush 流程
+            stmt = insert(BreedModel).values(**self.mapper.to_row(entity)).returning(BreedModel)
+            result = await self.session.execute(stmt)
+            model = result.scalar_one()
 
-            await self._publish_events_from_entity(entity)
+            self._publish_events_from_entity(entity)
 
             return self.mapper.to_domain(model)
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to create breed {entity.id}: {e}")
             raise BreedRepositoryError(f"Failed to create breed: {e}", "create")
 
+    async def bulk_copy(self, entities: list[Breed]) -> int:
+        """通过 COPY FROM STDIN 批量导入品种（仅用于导入/初始化脚本，不发布领域事件）"""
+        if not entities:
+            return 0
+
+        try:
+            rows = [self.mapper.to_row(entity) for entity in entities]
+            return await copy_rows(self.session, BreedModel.__table__, rows)
+
+        # COPY 直接使用驱动连接，驱动自身的异常不会被包装为 SQLAlchemyError
+        except Exception as e:
+            self.logger.error(f"Failed to bulk copy {len(entities)} breeds: {e}")
+            raise BreedRepositoryError(f"Failed to bulk copy breeds: {e}", "bulk_copy")
+
     async def update(self, entity: Breed) -> Breed:
         """更新品种"""
         try:
-            # 先检查实体是否存在
-            existing_model = await self.session.get(BreedModel, entity.id)
-            if existing_model is None or existing_model.is_deleted:
+            params = {
+                "breed_id": entity.id,
+                "new_name": entity.name.model_dump(),
+                "new_description": entity.description.model_dump() if entity.description else None,
+                "new_updated_at": entity.updated_at,
+            }
+            result = await self.session.execute(_UPDATE, params)
+            updated_model = result.scalar_one_or_none()
+            if updated_model is None:
                 raise BreedNotFoundError(entity.id)
-
-            # 更新字段
-            existing_model.name = entity.name.model_dump()
-            existing_model.description = (
-                entity.description.model_dump() if entity.description else None
-            )
-            existing_model.updated_at = entity.updated_at
-
-            await self.session.flush()
-            await self.session.refresh(existing_model)
 
-            await self._publish_events_from_entity(entity)
+            self._publish_events_from_entity(entity)
 
-            return self.mapper.to_domain(existing_model)
+            return self.mapper.to_domain(updated_model)
 
-        except BreedNotFoundError:
-            raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to update breed {entity.id}: {e}")
             raise BreedRepositoryError(f"Failed to update breed: {e}", "update")
 
@@ -91,20 +136,17 @@ class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository
         try:
             breed_entity: Breed | None = entity if isinstance(entity, Breed) else None
             entity_id = entity.id if isinstance(entity, Breed) else entity
-            model = await self.session.get(BreedModel, entity_id)
-            if model is None or model.is_deleted:
+            result = await self.session.execute(_SOFT_DELETE, {"breed_id": entity_id})
+            if result.rowcount == 0:
                 return False
 
-            model.is_deleted = True
-            await self.session.flush()
-
-            if breed_entity is None:
-                breed_entity = self.mapper.to_domain(model)
-            await self._publish_events_from_entity(breed_entity)
+            # 只传入 ID 时没有已加载的聚合，也就没有待发布的领域事件
+            if breed_entity is not None:
+                self._publish_events_from_entity(breed_entity)
 
             return True
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to delete breed {entity_id}: {e}")
             raise BreedRepositoryError(f"Failed to delete breed: {e}", "delete")
 
@@ -112,55 +154,70 @@ class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository
         self,
         page: int = 1,
         page_size: int = 10,
-        include_deleted: bool = False
-    ) -> tuple[list[Breed], int]:
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Breed]:
         """获取品种列表"""
+        position = decode_cursor(self.session, cursor)
+
         try:
             # 构建基础查询
-            stmt = select(BreedModel)
+            stmt = select(*_BREED_COLUMNS)
             count_stmt = select(func.count(BreedModel.id))
 
-            if not include_deleted:
-                stmt = stmt.where(BreedModel.is_deleted.is_(False))
-                count_stmt = count_stmt.where(BreedModel.is_deleted.is_(False))
-
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+            # 未删除条件由 soft_delete 的全局查询条件追加；需要包含已删除记录时显式关闭
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+                count_stmt = count_stmt.execution_options(include_deleted=True)
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = stmt.offset(offset).limit(page_size).order_by(BreedModel.created_at.desc())
+            stmt = paginate(stmt, BreedModel, page, page_size, position)
 
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            # 仅在调用方需要总数时才执行 COUNT（否则通过多取一行判断是否有下一页），并与分页查询并发执行
+            total_count = None
+            if with_total:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            rows = result.all()
 
-            breeds = self.mapper.to_domain_list(list(models))
+            breeds = await self.mapper.to_domain_list_async(list(rows[:page_size]))
 
-            return breeds, total_count
+            return Page(items=breeds, has_more=len(rows) > page_size, total=total_count)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to list breeds: {e}")
             raise BreedRepositoryError(f"Failed to list breeds: {e}", "list_all")
 
+    async def count(self, include_deleted: bool = False) -> int:
+        """统计品种数量"""
+        try:
+            stmt = select(func.count(BreedModel.id))
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+
+            result = await self.session.execute(stmt)
+            return result.scalar_one()
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to count breeds: {e}")
+            raise BreedRepositoryError(f"Failed to count breeds: {e}", "count")
+
     async def get_by_name(self, name: str, language: str = "en") -> Breed | None:
         """根据名称获取品种（支持国际化）"""
         try:
-            # 使用JSON查询搜索国际化名称
-            stmt = (
-                select(BreedModel)
-                .where(cast(BreedModel.name[language], String) == name)
-                .where(BreedModel.is_deleted.is_(False))
-            )
+            # JSONB 包含查询（@>），可使用 jsonb_path_ops GIN 索引
+            stmt = select(*_BREED_COLUMNS).where(BreedModel.name.contains({language: name}))
             result = await self.session.execute(stmt)
-            model = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if model is None:
+            if row is None:
                 return None
 
-            return self.mapper.to_domain(model)
+            return self.mapper.to_domain(row)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to get breed by name {name}: {e}")
             raise BreedRepositoryError(f"Failed to get breed by name: {e}", "get_by_name")
 
@@ -171,37 +228,45 @@ class PostgreSQLBreedRepositoryImpl(EventAwareRepository[Breed], BreedRepository
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Breed], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Breed]:
         """搜索品种"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            # 构建搜索查询
-            search_condition = or_(
-                cast(BreedModel.name[language], String).ilike(f"%{search_term}%"),
-                cast(BreedModel.description[language], String).ilike(f"%{search_term}%")
-            )
+            # 构建搜索查询：子串匹配走三元组索引；英文额外由 tsvector 全文检索命中多个词（两者均为 GIN 索引，可 BitmapOr）
+            search_arms = [
+                i18n_text(BreedModel.name, language).ilike(f"%{search_term}%"),
+                i18n_text(BreedModel.description, language).ilike(f"%{search_term}%")
+            ]
+            if language == SEARCH_VECTOR_LANGUAGE:
+                search_arms.append(search_vector_match(BreedModel.__table__, search_term))
+            search_condition = or_(*search_arms)
 
-            stmt = select(BreedModel).where(search_condition)
+            stmt = select(*_BREED_COLUMNS).where(search_condition)
             count_stmt = select(func.count(BreedModel.id)).where(search_condition)
 
-            if not include_deleted:
-                stmt = stmt.where(BreedModel.is_deleted.is_(False))
-                count_stmt = count_stmt.where(BreedModel.is_deleted.is_(False))
-
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+            # 未删除条件由 soft_delete 的全局查询条件追加；需要包含已删除记录时显式关闭
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+                count_stmt = count_stmt.execution_options(include_deleted=True)
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = stmt.offset(offset).limit(page_size).order_by(BreedModel.created_at.desc())
+            stmt = paginate(stmt, BreedModel, page, page_size, position)
 
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            # 仅在调用方需要总数时才执行 COUNT（否则通过多取一行判断是否有下一页），并与分页查询并发执行
+            total_count = None
+            if with_total:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            rows = result.all()
 
-            breeds = self.mapper.to_domain_list(list(models))
+            breeds = await self.mapper.to_domain_list_async(list(rows[:page_size]))
 
-            return breeds, total_count
+            return Page(items=breeds, has_more=len(rows) > page_size, total=total_count)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to search breeds with term {search_term}: {e}")
             raise BreedRepositoryError(f"Failed to search breeds: {e}", "search_breeds")
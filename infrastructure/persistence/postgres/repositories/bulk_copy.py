@@ -0,0 +1,48 @@
+"""COPY FROM STDIN helpers for large import/seed flows.
+
+Not meant for request-path code: COPY bypasses ORM events and returns no rows.
+
+Requires the application's async engine (asyncpg), which sends binary COPY
+through ``copy_records_to_table`` and encodes each value with the codec of its
+column type.
+"""
+
+import json
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import Dialect, Table, TypeDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _copy_value(table: Table, column: str, value: Any, dialect: Dialect) -> Any:
+    """转换为 COPY 可写入的值：先经过列类型的绑定转换（如枚举 -> SMALLINT 编号），JSON 值序列化为文本
+
+    None 原样保留，由驱动写为 NULL；asyncpg 的 JSONB 编码接受 JSON 文本。
+    """
+    column_type = table.c[column].type
+    if isinstance(column_type, TypeDecorator):
+        value = column_type.process_bind_param(value, dialect)
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def copy_rows(session: AsyncSession, table: Table, rows: list[dict[str, Any]]) -> int:
+    """在当前会话的事务中通过 COPY FROM STDIN 批量写入行，返回写入的行数"""
+    connection = await session.connection()
+    raw_connection = (await connection.get_raw_connection()).driver_connection
+
+    # 按列集合分组，保证每次 COPY 的列一致（省略的列使用数据库默认值）
+    groups: dict[tuple[str, ...], list[tuple[Any, ...]]] = defaultdict(list)
+    for row in rows:
+        groups[tuple(row)].append(
+            tuple(_copy_value(table, column, value, connection.dialect) for column, value in row.items())
+        )
+
+    for columns, records in groups.items():
+        await raw_connection.copy_records_to_table(
+            table.name, records=records, columns=list(columns)
+        )
+
+    return len(rows)
@@ -0,0 +1,100 @@
+"""Run a page query and its COUNT concurrently on separate connections."""
+
+import asyncio
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Result, Select, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.pool import Pool, QueuePool, SingletonThreadPool, StaticPool
+
+# session.info 中标记当前事务已有写入：此后 COUNT 必须在同一事务内执行才能看到这些写入
+_HAS_WRITES = "has_writes"
+
+# 只有一条底层连接的连接池，无法提供第二条连接并发执行
+_SINGLE_CONNECTION_POOLS = (StaticPool, SingletonThreadPool)
+
+# 同时在独立连接上执行的 COUNT 最多占常驻连接数的 1/4：其余连接留给请求会话本身。
+# 否则高并发时每个请求都持有一条连接再等待第二条，直到连接池超时
+_COUNT_SHARE_DIVISOR = 4
+
+# 各连接池上正在执行（或正在等待连接）的并发 COUNT 数
+_counts_in_flight: WeakKeyDictionary[Pool, int] = WeakKeyDictionary()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement_writes(state: ORMExecuteState) -> None:
+    """记录通过 session.execute 执行的 INSERT/UPDATE/DELETE"""
+    if not state.is_select:
+        state.session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush_writes(session: Session, _flush_context: Any) -> None:
+    """记录工作单元 flush 产生的写入"""
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _reset_writes(session: Session, transaction: SessionTransaction) -> None:
+    """最外层事务结束后清除写入标记"""
+    if transaction.parent is None:
+        session.info.pop(_HAS_WRITES, None)
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """当前事务是否已有写入（其他连接看不到这些未提交的数据）"""
+    return session.info.get(_HAS_WRITES, False)
+
+
+def can_count_concurrently(session: AsyncSession) -> bool:
+    """会话尚未写入且连接池能提供第二条连接时，COUNT 才能放到独立连接上执行"""
+    bind = session.bind
+    if bind is None or has_writes(session):
+        return False
+    if isinstance(bind.pool, _SINGLE_CONNECTION_POOLS):
+        return False
+    return _has_spare_connection(bind.pool)
+
+
+def _has_spare_connection(pool: Pool) -> bool:
+    """连接池的常驻连接未全部借出，且并发 COUNT 未用完名额（不限连接数的连接池总是有空余）"""
+    if not isinstance(pool, QueuePool):
+        return True
+    return (
+        pool.checkedout() < pool.size()
+        and _counts_in_flight.get(pool, 0) < pool.size() // _COUNT_SHARE_DIVISOR
+    )
+
+
+async def _count_on_own_session(session: AsyncSession, count_statement: Select) -> int:
+    """在独立会话（独立连接）上执行 COUNT"""
+    async with AsyncSession(session.bind) as count_session:
+        result = await count_session.execute(count_statement)
+        return result.scalar_one()
+
+
+async def execute_with_count(
+    session: AsyncSession, statement: Select, count_statement: Select
+) -> tuple[Result, int]:
+    """执行分页查询并统计总数
+
+    AsyncSession 同一时间只能执行一条语句，因此 COUNT 放到独立会话上与分页查询并发执行，
+    总耗时约为两者中较慢的一条。当前事务已有写入（独立连接看不到未提交的数据）
+    或连接池只有一条连接、没有空余连接时，回退为在当前会话中依次执行。
+    """
+    if not can_count_concurrently(session):
+        count_result = await session.execute(count_statement)
+        return await session.execute(statement), count_result.scalar_one()
+
+    # 检查与占用名额之间没有 await，同一事件循环中的其他请求看到的是占用后的计数
+    pool = session.bind.pool
+    _counts_in_flight[pool] = _counts_in_flight.get(pool, 0) + 1
+    try:
+        result, total = await asyncio.gather(
+            session.execute(statement), _count_on_own_session(session, count_statement)
+        )
+    finally:
+        _counts_in_flight[pool] -= 1
+    return result, total
@@ -0,0 +1,17 @@
+"""Short-lived, process-local cache for unfiltered table totals."""
+
+from infrastructure.persistence.postgres.repositories.ttl_cache import TTLCache
+
+# 总数缓存有效期（秒）：翻页时复用最近一次统计的总数，本进程内的写入会立即使其失效
+COUNT_CACHE_TTL = 10.0
+
+
+class CountCache(TTLCache[int]):
+    """按键缓存总数，过期或失效后由调用方重新统计"""
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL):
+        super().__init__(ttl)
+
+
+# 各仓储共享的实例，键为表名
+count_cache = CountCache()
@@ -1,34 +1,100 @@
 """Event-aware repository base class for PostgreSQL implementations."""
 
+import asyncio
 from typing import TypeVar
 
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
 from domain.common.event_publisher import EventPublisher
 from domain.common.events import DomainEvent
 from domain.common.repository import BaseRepository
 
 T = TypeVar('T')
 
+# session.info 中等待提交的领域事件：[(publisher, events), ...]
+_PENDING_EVENTS = "pending_domain_events"
+
+# 后台发布任务的强引用，避免任务在完成前被垃圾回收
+_publish_tasks: set[asyncio.Task] = set()
+
+
+async def _publish_pending(pending: list[tuple[EventPublisher, list[DomainEvent]]]) -> None:
+    """按发布器合并整个工作单元的事件，每个发布器只发布一次，各发布器之间并发执行
+
+    同一发布器内的事件仍按写入顺序依次交付，处理器看到的事件顺序不变。
+    """
+    batches: dict[EventPublisher, list[DomainEvent]] = {}
+    for publisher, events in pending:
+        batches.setdefault(publisher, []).extend(events)
+    results = await asyncio.gather(
+        *(publisher.publish_events(events) for publisher, events in batches.items()),
+        return_exceptions=True,
+    )
+    for events, result in zip(batches.values(), results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to publish {len(events)} domain events after commit: {result}")
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending_events(session: Session) -> None:
+    """事务提交后在后台发布排队的事件：处理器只会看到已提交的数据，也不阻塞请求"""
+    pending = session.info.pop(_PENDING_EVENTS, None)
+    if not pending:
+        return
+    task = asyncio.get_running_loop().create_task(_publish_pending(pending))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    """事务回滚后丢弃排队的事件：对应的写入没有生效"""
+    session.info.pop(_PENDING_EVENTS, None)
+
 
 class EventAwareRepository(BaseRepository[T]):
-    """Base class for repositories that publish domain events after successful persistence."""
+    """Base class for repositories that publish domain events after the transaction commits.
+
+    Events are queued on the session and handed to the publisher, batched per unit of
+    work, once the outermost transaction commits; a rollback discards them.
+    """
+
+    session: AsyncSession
 
     def __init__(self, event_publisher: EventPublisher):
         self.event_publisher = event_publisher
 
-    async def _publish_events_from_entity(self, entity: T) -> None:
-        """Publish domain events from an entity if it's an aggregate root."""
+    def _queue_events(self, events: list[DomainEvent]) -> None:
+        """Queue events on the session until the transaction commits."""
+        if events:
+            self.session.info.setdefault(_PENDING_EVENTS, []).append(
+                (self.event_publisher, list(events))
+            )
+
+    def _publish_events_from_entity(self, entity: T) -> None:
+        """Queue domain events from an entity if it's an aggregate root."""
         if hasattr(entity, 'get_domain_events') and hasattr(entity, 'clear_domain_events'):
-            await self.event_publisher.publish_events_from_aggregate(entity)
+            self._queue_events(entity.get_domain_events())
+            entity.clear_domain_events()
 
-    async def _publish_events_from_entities(self, entities: list[T]) -> None:
-        """Publish domain events from multiple entities."""
-        for entity in entities:
-            await self._publish_events_from_entity(entity)
+    def _publish_events_from_entities(self, entities: list[T]) -> None:
+        """Queue domain events from multiple entities as a single batch."""
+        aggregates = [
+            entity
+            for entity in entities
+            if hasattr(entity, 'get_domain_events') and hasattr(entity, 'clear_domain_events')
+        ]
+        self._queue_events([event for aggregate in aggregates for event in aggregate.get_domain_events()])
+        for aggregate in aggregates:
+            aggregate.clear_domain_events()
 
-    async def _publish_event(self, event: DomainEvent) -> None:
-        """Publish a single domain event."""
-        await self.event_publisher.publish_event(event)
+    def _publish_event(self, event: DomainEvent) -> None:
+        """Queue a single domain event."""
+        self._queue_events([event])
 
-    async def _publish_events(self, events: list[DomainEvent]) -> None:
-        """Publish multiple domain events."""
-        await self.event_publisher.publish_events(events)
+    def _publish_events(self, events: list[DomainEvent]) -> None:
+        """Queue multiple domain events."""
+        self._queue_events(events)
@@ -1,14 +1,72 @@
+from collections.abc import AsyncIterator
+
 from loguru import logger
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import bindparam, false, func, insert, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import String, cast
 
+from domain.common.pagination import Page
 from domain.pets.entities import Gene
 from domain.pets.exceptions import GeneNotFoundError, GeneRepositoryError
 from domain.pets.repository import GeneRepository
 from domain.pets.value_objects import GeneCategoryEnum, InheritanceTypeEnum
 from infrastructure.persistence.postgres.mappers.gene_mapper import GeneMapper
 from infrastructure.persistence.postgres.models.gene import GeneModel
+from infrastructure.persistence.postgres.models.indexes import (
+    SEARCH_VECTOR_LANGUAGE,
+    i18n_text,
+    search_vector_match,
+)
+from infrastructure.persistence.postgres.models.types import is_valid_id
+from infrastructure.persistence.postgres.repositories.bulk_copy import copy_rows
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+)
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.projection import entity_columns
+from infrastructure.persistence.postgres.repositories.streaming import stream_domain
+
+# 只读列表/查找路径按列投影，返回 Row 直接映射为领域实体，不构建 ORM 实例
+_GENE_COLUMNS = entity_columns(GeneModel)
+
+# 热点查询（未删除条件由 soft_delete 全局追加）
+_GET_BY_ID = select(GeneModel).where(GeneModel.id == bindparam("id"))
+_GET_BY_NOTATION = select(*_GENE_COLUMNS).where(GeneModel.notation == bindparam("notation"))
+_GET_BY_CATEGORY = (
+    select(GeneModel)
+    .where(GeneModel.category == bindparam("category"))
+    .order_by(GeneModel.name)
+)
+_GET_BY_INHERITANCE_TYPE = (
+    select(GeneModel)
+    .where(GeneModel.inheritance_type == bindparam("inheritance_type"))
+    .order_by(GeneModel.name)
+)
+# 单条 UPDATE ... RETURNING
+_UPDATE = (
+    update(GeneModel)
+    .where(GeneModel.id == bindparam("gene_id"), GeneModel.is_deleted == false())
+    .values(
+        name=bindparam("new_name"),
+        alias=bindparam("new_alias"),
+        description=bindparam("new_description"),
+        notation=bindparam("new_notation"),
+        inheritance_type=bindparam("new_inheritance_type"),
+        category=bindparam("new_category"),
+        updated_at=bindparam("new_updated_at"),
+    )
+    .returning(GeneModel)
+    .execution_options(populate_existing=True)
+)
+# 单条 UPDATE 软删除
+_SOFT_DELETE = (
+    update(GeneModel)
+    .where(GeneModel.id == bindparam("gene_id"), GeneModel.is_deleted == false())
+    .values(is_deleted=True)
+)
 
 
 class PostgreSQLGeneRepositoryImpl(GeneRepository):
@@ -21,13 +79,10 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
 
     async def get_by_id(self, entity_id: str) -> Gene | None:
         """根据ID获取基因"""
+        if not is_valid_id(self.session, entity_id):
+            return None
         try:
-            stmt = (
-                select(GeneModel)
-                .where(GeneModel.id == entity_id)
-                .where(not GeneModel.is_deleted)
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_BY_ID, {"id": entity_id})
             model = result.scalar_one_or_none()
 
             if model is None:
@@ -35,48 +90,59 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
 
             return self.mapper.to_domain(model)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to get gene by id {entity_id}: {e}")
             raise GeneRepositoryError(f"Failed to get gene: {e}", "get_by_id")
 
     async def create(self, entity: Gene) -> Gene:
         """创建基因"""
         try:
-            model = self.mapper.to_model(entity)
-            self.session.add(model)
-            await self.session.flush()
-            await self.session.refresh(model)
+            # 单条 INSERT ... RETURNING 直接取回完整行（含服务端默认值），不经过工作单元的 flush 流程
+            stmt = insert(GeneModel).values(**self.mapper.to_row(entity)).returning(GeneModel)
+            result = await self.session.execute(stmt)
+            model = result.scalar_one()
 
             return self.mapper.to_domain(model)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to create gene {entity.id}: {e}")
             raise GeneRepositoryError(f"Failed to create gene: {e}", "create")
 
+    async def bulk_copy(self, entities: list[Gene]) -> int:
+        """通过 COPY FROM STDIN 批量导入基因（仅用于导入/初始化脚本，不发布领域事件）"""
+        if not entities:
+            return 0
+
+        try:
+            rows = [self.mapper.to_row(entity) for entity in entities]
+            return await copy_rows(self.session, GeneModel.__table__, rows)
+
+        # COPY 直接使用驱动连接，驱动自身的异常不会被包装为 SQLAlchemyError
+        except Exception as e:
+            self.logger.error(f"Failed to bulk copy {len(entities)} genes: {e}")
+            raise GeneRepositoryError(f"Failed to bulk copy genes: {e}", "bulk_copy")
+
     async def update(self, entity: Gene) -> Gene:
         """更新基因"""
         try:
-            existing_model = await self.session.get(GeneModel, entity.id)
-            if existing_model is None or existing_model.is_deleted:
+            params = {
+                "gene_id": entity.id,
+                "new_name": entity.name.model_dump(),
+                "new_alias": entity.alias.model_dump() if entity.alias else None,
+                "new_description": entity.description.model_dump() if entity.description else None,
+                "new_notation": entity.notation,
+                "new_inheritance_type": entity.inheritance_type,
+                "new_category": entity.category,
+                "new_updated_at": entity.updated_at,
+            }
+            result = await self.session.execute(_UPDATE, params)
+            updated_model = result.scalar_one_or_none()
+            if updated_model is None:
                 raise GeneNotFoundError(entity.id)
 
-            # 更新字段
-            existing_model.name = entity.name
-            existing_model.alias = entity.alias
-            existing_model.description = entity.description
-            existing_model.notation = entity.notation
-            existing_model.inheritance_type = entity.inheritance_type
-            existing_model.category = entity.category
-            existing_model.updated_at = entity.updated_at
-
-            await self.session.flush()
-            await self.session.refresh(existing_model)
-
-            return self.mapper.to_domain(existing_model)
+            return self.mapper.to_domain(updated_model)
 
-        except GeneNotFoundError:
-            raise
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to update gene {entity.id}: {e}")
             raise GeneRepositoryError(f"Failed to update gene: {e}", "update")
 
@@ -84,16 +150,11 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
         """删除基因（软删除）"""
         try:
             entity_id = entity.id if isinstance(entity, Gene) else entity
-            model = await self.session.get(GeneModel, entity_id)
-            if model is None or model.is_deleted:
-                return False
+            result = await self.session.execute(_SOFT_DELETE, {"gene_id": entity_id})
 
-            model.is_deleted = True
-            await self.session.flush()
-
-            return True
+            return result.rowcount > 0
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to delete gene {entity_id}: {e}")
             raise GeneRepositoryError(f"Failed to delete gene: {e}", "delete")
 
@@ -101,89 +162,95 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
         self,
         page: int = 1,
         page_size: int = 10,
-        include_deleted: bool = False
-    ) -> tuple[list[Gene], int]:
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Gene]:
         """获取基因列表"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            stmt = select(GeneModel)
+            stmt = select(*_GENE_COLUMNS)
             count_stmt = select(func.count(GeneModel.id))
 
-            if not include_deleted:
-                stmt = stmt.where(not GeneModel.is_deleted)
-                count_stmt = count_stmt.where(not GeneModel.is_deleted)
-
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+            # 未删除条件由 soft_delete 的全局查询条件追加；需要包含已删除记录时显式关闭
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+                count_stmt = count_stmt.execution_options(include_deleted=True)
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = stmt.offset(offset).limit(page_size).order_by(GeneModel.created_at.desc())
+            stmt = paginate(stmt, GeneModel, page, page_size, position)
 
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            # 仅在调用方需要总数时才执行 COUNT（否则通过多取一行判断是否有下一页），并与分页查询并发执行
+            total_count = None
+            if with_total:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            rows = result.all()
 
-            genes = self.mapper.to_domain_list(list(models))
+            genes = await self.mapper.to_domain_list_async(list(rows[:page_size]))
 
-            return genes, total_count
+            return Page(items=genes, has_more=len(rows) > page_size, total=total_count)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to list genes: {e}")
             raise GeneRepositoryError(f"Failed to list genes: {e}", "list_all")
 
-    async def get_by_category(self, category: GeneCategoryEnum) -> list[Gene]:
-        """根据基因类别获取基因列表"""
+    async def count(self, include_deleted: bool = False) -> int:
+        """统计基因数量"""
         try:
-            stmt = (
-                select(GeneModel)
-                .where(GeneModel.category == category)
-                .where(not GeneModel.is_deleted)
-                .order_by(GeneModel.name)
-            )
+            stmt = select(func.count(GeneModel.id))
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+
             result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            return result.scalar_one()
 
-            return self.mapper.to_domain_list(list(models))
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to count genes: {e}")
+            raise GeneRepositoryError(f"Failed to count genes: {e}", "count")
 
-        except Exception as e:
-            self.logger.error(f"Failed to get genes by category {category}: {e}")
-            raise GeneRepositoryError(f"Failed to get genes by category: {e}", "get_by_category")
+    async def get_by_category(self, category: GeneCategoryEnum) -> list[Gene]:
+        """根据基因类别获取基因列表"""
+        return [gene async for gene in self.iter_by_category(category)]
 
     async def get_by_inheritance_type(self, inheritance_type: InheritanceTypeEnum) -> list[Gene]:
         """根据遗传类型获取基因列表"""
-        try:
-            stmt = (
-                select(GeneModel)
-                .where(GeneModel.inheritance_type == inheritance_type)
-                .where(not GeneModel.is_deleted)
-                .order_by(GeneModel.name)
-            )
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+        return [gene async for gene in self.iter_by_inheritance_type(inheritance_type)]
 
-            return self.mapper.to_domain_list(list(models))
+    async def iter_by_category(self, category: GeneCategoryEnum) -> AsyncIterator[Gene]:
+        """流式遍历指定类别的基因（服务端游标分批读取）"""
+        try:
+            params = {"category": category}
+            async for gene in stream_domain(self.session, _GET_BY_CATEGORY, self.mapper, params):
+                yield gene
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to get genes by category {category}: {e}")
+            raise GeneRepositoryError(f"Failed to get genes by category: {e}", "get_by_category")
 
-        except Exception as e:
+    async def iter_by_inheritance_type(self, inheritance_type: InheritanceTypeEnum) -> AsyncIterator[Gene]:
+        """流式遍历指定遗传类型的基因（服务端游标分批读取）"""
+        try:
+            params = {"inheritance_type": inheritance_type}
+            async for gene in stream_domain(self.session, _GET_BY_INHERITANCE_TYPE, self.mapper, params):
+                yield gene
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to get genes by inheritance type {inheritance_type}: {e}")
             raise GeneRepositoryError(f"Failed to get genes by inheritance type: {e}", "get_by_inheritance_type")
 
     async def get_by_notation(self, notation: str) -> Gene | None:
         """根据基因标记获取基因"""
         try:
-            stmt = (
-                select(GeneModel)
-                .where(GeneModel.notation == notation)
-                .where(not GeneModel.is_deleted)
-            )
-            result = await self.session.execute(stmt)
-            model = result.scalar_one_or_none()
+            result = await self.session.execute(_GET_BY_NOTATION, {"notation": notation})
+            row = result.one_or_none()
 
-            if model is None:
+            if row is None:
                 return None
 
-            return self.mapper.to_domain(model)
+            return self.mapper.to_domain(row)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to get gene by notation {notation}: {e}")
             raise GeneRepositoryError(f"Failed to get gene by notation: {e}", "get_by_notation")
 
@@ -196,18 +263,24 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Gene], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Gene]:
         """搜索基因"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            # 构建搜索条件
-            search_conditions = [
-                or_(
-                    cast(GeneModel.name[language], String).ilike(f"%{search_term}%"),
-                    cast(GeneModel.alias[language], String).ilike(f"%{search_term}%"),
-                    cast(GeneModel.description[language], String).ilike(f"%{search_term}%"),
-                    GeneModel.notation.ilike(f"%{search_term}%")
-                )
+            # 构建搜索条件：子串匹配走三元组索引（notation 这类停用词短标记只能靠它命中）；
+            # 英文额外由 tsvector 全文检索命中多个词（两者均为 GIN 索引，可 BitmapOr）
+            text_arms = [
+                i18n_text(GeneModel.name, language).ilike(f"%{search_term}%"),
+                i18n_text(GeneModel.alias, language).ilike(f"%{search_term}%"),
+                i18n_text(GeneModel.description, language).ilike(f"%{search_term}%"),
+                GeneModel.notation.ilike(f"%{search_term}%")
             ]
+            if language == SEARCH_VECTOR_LANGUAGE:
+                text_arms.append(search_vector_match(GeneModel.__table__, search_term))
+            search_conditions = [or_(*text_arms)]
 
             # 添加过滤条件
             if category is not None:
@@ -216,30 +289,30 @@ class PostgreSQLGeneRepositoryImpl(GeneRepository):
             if inheritance_type is not None:
                 search_conditions.append(GeneModel.inheritance_type == inheritance_type)
 
-            if not include_deleted:
-                search_conditions.append(not GeneModel.is_deleted)
-
-            # 组合所有条件
-            where_clause = and_(*search_conditions)
-
-            stmt = select(GeneModel).where(where_clause)
-            count_stmt = select(func.count(GeneModel.id)).where(where_clause)
+            # 所有条件一次性传入 where，不逐个追加（每次 .where() 都会复制一份 Select）
+            stmt = select(*_GENE_COLUMNS).where(*search_conditions)
+            count_stmt = select(func.count(GeneModel.id)).where(*search_conditions)
 
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+            # 未删除条件由 soft_delete 的全局查询条件追加；需要包含已删除记录时显式关闭
+            if include_deleted:
+                stmt = stmt.execution_options(include_deleted=True)
+                count_stmt = count_stmt.execution_options(include_deleted=True)
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = stmt.offset(offset).limit(page_size).order_by(GeneModel.created_at.desc())
+            stmt = paginate(stmt, GeneModel, page, page_size, position)
 
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            # 仅在调用方需要总数时才执行 COUNT（否则通过多取一行判断是否有下一页），并与分页查询并发执行
+            total_count = None
+            if with_total:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            rows = result.all()
 
-            genes = self.mapper.to_domain_list(list(models))
+            genes = await self.mapper.to_domain_list_async(list(rows[:page_size]))
 
-            return genes, total_count
+            return Page(items=genes, has_more=len(rows) > page_size, total=total_count)
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             self.logger.error(f"Failed to search genes with term {search_term}: {e}")
             raise GeneRepositoryError(f"Failed to search genes: {e}", "search_genes")
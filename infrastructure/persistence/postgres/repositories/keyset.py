@@ -0,0 +1,41 @@
+"""Keyset (seek) pagination helpers for repository list/search queries."""
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper
+
+from domain.common.pagination import PageCursor
+from infrastructure.persistence.postgres.models.base import BaseModel
+from infrastructure.persistence.postgres.models.types import is_valid_id
+
+
+def decode_cursor(session: AsyncSession, cursor: str | None) -> PageCursor | None:
+    """解码分页游标；游标中的 ID 无法与 UUIDType 列比较时同样视为格式错误（ValueError）"""
+    if not cursor:
+        return None
+    position = PageCursor.decode(cursor)
+    if not is_valid_id(session, position.id):
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+    return position
+
+
+def paginate[*Ts](
+    statement: Select[*Ts],
+    model: type[BaseModel],
+    page: int,
+    page_size: int,
+    cursor: PageCursor | None = None,
+) -> Select[*Ts]:
+    """按 (created_at DESC, id DESC) 分页：传入游标时使用 keyset 条件，否则回退到 OFFSET（已弃用）
+
+    带游标时从上一页最后一行之后直接定位（走 (created_at, id) 索引），不必扫描并丢弃 OFFSET 之前的行，
+    深分页的代价与首页相同。多取一行（page_size + 1）用于判断是否还有下一页，调用方据此构建 Page。
+    """
+    columns = class_mapper(model).columns
+    created_at, entity_id = columns["created_at"], columns["id"]
+    statement = statement.order_by(created_at.desc(), entity_id.desc()).limit(page_size + 1)
+    if cursor is None:
+        return statement.offset((page - 1) * page_size)
+    # 显式指定参数类型，否则 id 会以 VARCHAR 绑定，无法与 uuid 列做行比较
+    position = tuple_(cursor.created_at, cursor.id, types=[created_at.type, entity_id.type])
+    return statement.where(tuple_(created_at, entity_id) < position)
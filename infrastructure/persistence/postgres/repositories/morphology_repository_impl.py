@@ -1,18 +1,103 @@
 from loguru import logger
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    bindparam,
+    exists,
+    false,
+    func,
+    insert,
+    or_,
+    select,
+    true,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import String, cast
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from domain.common.pagination import Page
 from domain.pets.entities import Morphology
 from domain.pets.exceptions import MorphologyNotFoundError, MorphologyRepositoryError
 from domain.pets.repository import MorphologyRepository
 from infrastructure.persistence.postgres.mappers import MorphologyMapper
 from infrastructure.persistence.postgres.models.breed import BreedModel
+from infrastructure.persistence.postgres.models.indexes import i18n_text
 from infrastructure.persistence.postgres.models.morph_gene_mapping import (
     MorphGeneMappingModel,
 )
 from infrastructure.persistence.postgres.models.morphology import MorphologyModel
+from infrastructure.persistence.postgres.models.types import is_valid_id
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+    has_writes,
+)
+from infrastructure.persistence.postgres.repositories.count_cache import count_cache
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.ttl_cache import (
+    invalidate_on_commit,
+)
+
+# 读取品系时的加载策略：显式预加载基因映射，其余关系禁止懒加载，映射器误触发的 N+1 查询会直接报错
+# 品系聚合只保存映射 ID：有效映射的 ID 以 LEFT OUTER JOIN 在同一条语句中取回，读取一页品系只需一次往返
+# （带 LIMIT 时 SQLAlchemy 先在子查询中分页再关联映射；结果需 unique() 合并同一品系的多行）
+_LOAD_OPTIONS = (
+    joinedload(
+        MorphologyModel.gene_mappings.and_(MorphGeneMappingModel.is_deleted == false())
+    ).load_only(MorphGeneMappingModel.id),
+    raiseload("*"),
+)
+
+# UPDATE ... RETURNING 无法附加 JOIN，更新后的映射 ID 用一条 selectin 查询取回
+_RETURNING_LOAD_OPTIONS = (
+    selectinload(
+        MorphologyModel.gene_mappings.and_(MorphGeneMappingModel.is_deleted == false())
+    ).load_only(MorphGeneMappingModel.id),
+    raiseload("*"),
+)
+
+# 热点查询
+_ACTIVE_MORPHOLOGIES = (
+    select(MorphologyModel).options(*_LOAD_OPTIONS).where(MorphologyModel.is_deleted == false())
+)
+_GET_BY_ID = _ACTIVE_MORPHOLOGIES.where(MorphologyModel.id == bindparam("id"))
+# EXISTS 半连接：每个品系只返回一次，已软删除的映射不会带来重复行
+_GET_CONTAINING_GENE = _ACTIVE_MORPHOLOGIES.where(
+    exists().where(
+        MorphGeneMappingModel.morphology_id == MorphologyModel.id,
+        MorphGeneMappingModel.gene_id == bindparam("gene_id"),
+        MorphGeneMappingModel.is_deleted == false(),
+    )
+)
+# 单条 UPDATE ... RETURNING
+_UPDATE = (
+    update(MorphologyModel)
+    .where(MorphologyModel.id == bindparam("morphology_id"), MorphologyModel.is_deleted == false())
+    .values(
+        name=bindparam("new_name"),
+        description=bindparam("new_description"),
+        updated_at=bindparam("new_updated_at"),
+    )
+    .returning(MorphologyModel)
+    .options(*_RETURNING_LOAD_OPTIONS)
+    .execution_options(populate_existing=True)
+)
+# 单条 UPDATE 软删除
+_SOFT_DELETE = (
+    update(MorphologyModel)
+    .where(MorphologyModel.id == bindparam("morphology_id"), MorphologyModel.is_deleted == false())
+    .values(is_deleted=True)
+)
+# 一次查询两个 EXISTS，不加载整行 JSONB 数据
+_MORPHOLOGY_AND_BREED_EXIST = select(
+    exists().where(
+        MorphologyModel.id == bindparam("morphology_id"), MorphologyModel.is_deleted == false()
+    ),
+    exists().where(BreedModel.id == bindparam("breed_id"), BreedModel.is_deleted == false()),
+)
 
 
 class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
@@ -25,19 +110,11 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
 
     async def get_by_id(self, entity_id: str) -> Morphology | None:
         """根据ID获取品系"""
+        if not is_valid_id(self.session, entity_id):
+            return None
         try:
-            stmt = (
-                select(MorphologyModel)
-                .options(
-                    selectinload(MorphologyModel.gene_mappings).selectinload(
-                        MorphGeneMappingModel.gene
-                    )
-                )
-                .where(MorphologyModel.id == entity_id)
-                .where(not MorphologyModel.is_deleted)
-            )
-            result = await self.session.execute(stmt)
-            model = result.scalar_one_or_none()
+            result = await self.session.execute(_GET_BY_ID, {"id": entity_id})
+            model = result.unique().scalar_one_or_none()
 
             if model is None:
                 return None
@@ -53,10 +130,16 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
     async def create(self, entity: Morphology) -> Morphology:
         """创建品系"""
         try:
-            model = self.mapper.to_model(entity)
-            self.session.add(model)
-            await self.session.flush()
-            await self.session.refresh(model)
+            # 单条 INSERT ... RETURNING：服务端默认值随插入一并返回，不再 refresh
+            stmt = (
+                insert(MorphologyModel)
+                .values(**self.mapper.to_row(entity))
+                .returning(MorphologyModel)
+            )
+            model = (await self.session.execute(stmt)).scalar_one()
+            invalidate_on_commit(self.session, count_cache, MorphologyModel.__tablename__)
+            # 新建的品系还没有基因映射，直接置为空列表，无需再查询
+            set_committed_value(model, "gene_mappings", [])
 
             return self.mapper.to_domain(model)
 
@@ -69,19 +152,18 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
     async def update(self, entity: Morphology) -> Morphology:
         """更新品系"""
         try:
-            existing_model = await self.session.get(MorphologyModel, entity.id)
-            if existing_model is None or existing_model.is_deleted:
+            params = {
+                "morphology_id": entity.id,
+                "new_name": entity.name.model_dump(),
+                "new_description": entity.description.model_dump() if entity.description else None,
+                "new_updated_at": entity.updated_at,
+            }
+            result = await self.session.execute(_UPDATE, params)
+            updated_model = result.scalar_one_or_none()
+            if updated_model is None:
                 raise MorphologyNotFoundError(entity.id)
 
-            # 更新字段
-            existing_model.name = entity.name
-            existing_model.description = entity.description
-            existing_model.updated_at = entity.updated_at
-
-            await self.session.flush()
-            await self.session.refresh(existing_model)
-
-            return self.mapper.to_domain(existing_model)
+            return self.mapper.to_domain(updated_model)
 
         except MorphologyNotFoundError:
             raise
@@ -95,13 +177,10 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
         """删除品系（软删除）"""
         try:
             entity_id = entity.id if isinstance(entity, Morphology) else entity
-            model = await self.session.get(MorphologyModel, entity_id)
-            if model is None or model.is_deleted:
+            result = await self.session.execute(_SOFT_DELETE, {"morphology_id": entity_id})
+            if result.rowcount == 0:
                 return False
-
-            model.is_deleted = True
-            await self.session.flush()
-
+            invalidate_on_commit(self.session, count_cache, MorphologyModel.__tablename__)
             return True
 
         except Exception as e:
@@ -111,39 +190,58 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
             )
 
     async def list_all(
-        self, page: int = 1, page_size: int = 10, include_deleted: bool = False
-    ) -> tuple[list[Morphology], int]:
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Morphology]:
         """获取品系列表"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            stmt = select(MorphologyModel).options(
-                selectinload(MorphologyModel.gene_mappings).selectinload(
-                    MorphGeneMappingModel.gene
-                )
-            )
+            # 未删除品系的总数在短时间内复用缓存，翻页时省去窗口计数或 COUNT；
+            # 当前事务已有写入时既不读也不写缓存，避免把未提交的数据计入总数
+            cacheable = with_total and not include_deleted and not has_writes(self.session)
+            generation = count_cache.generation
+            cached_total = count_cache.get(MorphologyModel.__tablename__) if cacheable else None
+            count_needed = with_total and cached_total is None
+
+            # 不带游标时用窗口函数在同一条查询中取得总数；keyset 条件会改变窗口的统计范围，带游标时单独 COUNT
+            window_count = count_needed and position is None
+            columns = [MorphologyModel]
+            if window_count:
+                columns.append(func.count().over().label("total_count"))
+            stmt = select(*columns).options(*_LOAD_OPTIONS)
             count_stmt = select(func.count(MorphologyModel.id))
 
             if not include_deleted:
-                stmt = stmt.where(not MorphologyModel.is_deleted)
-                count_stmt = count_stmt.where(not MorphologyModel.is_deleted)
-
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+                stmt = stmt.where(MorphologyModel.is_deleted == false())
+                count_stmt = count_stmt.where(MorphologyModel.is_deleted == false())
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = (
-                stmt.offset(offset)
-                .limit(page_size)
-                .order_by(MorphologyModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            morphologies = self.mapper.to_domain_list(list(models))
-
-            return morphologies, total_count
+            stmt = paginate(stmt, MorphologyModel, page, page_size, position)
+
+            total_count = cached_total
+            if count_needed and not window_count:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            rows = result.unique().all()
+
+            if window_count:
+                # OFFSET 越过末尾时没有行携带窗口计数，改为单独 COUNT
+                if rows or page == 1:
+                    total_count = rows[0].total_count if rows else 0
+                else:
+                    total_count = (await self.session.execute(count_stmt)).scalar_one()
+            if cacheable and count_needed:
+                count_cache.set(MorphologyModel.__tablename__, total_count, generation)
+            models = [row.MorphologyModel for row in rows[:page_size]]
+            morphologies = await self.mapper.to_domain_list_async(models)
+
+            return Page(items=morphologies, has_more=len(rows) > page_size, total=total_count)
 
         except Exception as e:
             self.logger.error(f"Failed to list morphologies: {e}")
@@ -153,29 +251,17 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
 
     async def get_by_gene_combination(self, gene_ids: list[str]) -> list[Morphology]:
         """根据基因组合获取品系列表"""
+        if not gene_ids:
+            return []
+
         try:
             # 查找包含所有指定基因的品系
-            stmt = (
-                select(MorphologyModel)
-                .options(
-                    selectinload(MorphologyModel.gene_mappings).selectinload(
-                        MorphGeneMappingModel.gene
-                    )
-                )
-                .join(
-                    MorphGeneMappingModel,
-                    MorphologyModel.id == MorphGeneMappingModel.morphology_id,
-                )
-                .where(MorphGeneMappingModel.gene_id.in_(gene_ids))
-                .where(not MorphologyModel.is_deleted)
-                .group_by(MorphologyModel.id)
-                .having(func.count(MorphGeneMappingModel.gene_id) == len(gene_ids))
-            )
+            stmt = _ACTIVE_MORPHOLOGIES.where(*self._contains_genes(gene_ids))
 
             result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            models = result.unique().scalars().all()
 
-            return self.mapper.to_domain_list(list(models))
+            return await self.mapper.to_domain_list_async(list(models))
 
         except Exception as e:
             self.logger.error(
@@ -188,29 +274,16 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
 
     async def get_by_required_genes(self, gene_ids: list[str]) -> list[Morphology]:
         """根据必需基因获取品系列表"""
+        if not gene_ids:
+            return []
+
         try:
-            stmt = (
-                select(MorphologyModel)
-                .options(
-                    selectinload(MorphologyModel.gene_mappings).selectinload(
-                        MorphGeneMappingModel.gene
-                    )
-                )
-                .join(
-                    MorphGeneMappingModel,
-                    MorphologyModel.id == MorphGeneMappingModel.morphology_id,
-                )
-                .where(MorphGeneMappingModel.gene_id.in_(gene_ids))
-                .where(MorphGeneMappingModel.is_required)
-                .where(not MorphologyModel.is_deleted)
-                .group_by(MorphologyModel.id)
-                .having(func.count(MorphGeneMappingModel.gene_id) == len(gene_ids))
-            )
+            stmt = _ACTIVE_MORPHOLOGIES.where(*self._contains_genes(gene_ids, required_only=True))
 
             result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            models = result.unique().scalars().all()
 
-            return self.mapper.to_domain_list(list(models))
+            return await self.mapper.to_domain_list_async(list(models))
 
         except Exception as e:
             self.logger.error(
@@ -221,28 +294,32 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
                 "get_by_required_genes",
             )
 
+    @staticmethod
+    def _contains_genes(gene_ids: list[str], required_only: bool = False) -> list[ColumnElement[bool]]:
+        """品系包含全部指定基因的条件：每个基因一个 EXISTS 半连接
+
+        规划器从选择性最高的基因经 gene_id 索引取出候选品系，再按 morphology_id 索引逐个探测其余基因，
+        不需要连接全部映射后 GROUP BY/HAVING 计数；重复传入的基因也不会影响结果。
+        """
+        conditions = []
+        for gene_id in dict.fromkeys(gene_ids):
+            mapping = exists().where(
+                MorphGeneMappingModel.morphology_id == MorphologyModel.id,
+                MorphGeneMappingModel.gene_id == gene_id,
+                MorphGeneMappingModel.is_deleted == false(),
+            )
+            if required_only:
+                mapping = mapping.where(MorphGeneMappingModel.is_required == true())
+            conditions.append(mapping)
+        return conditions
+
     async def get_morphologies_containing_gene(self, gene_id: str) -> list[Morphology]:
         """获取包含指定基因的所有品系"""
         try:
-            stmt = (
-                select(MorphologyModel)
-                .options(
-                    selectinload(MorphologyModel.gene_mappings).selectinload(
-                        MorphGeneMappingModel.gene
-                    )
-                )
-                .join(
-                    MorphGeneMappingModel,
-                    MorphologyModel.id == MorphGeneMappingModel.morphology_id,
-                )
-                .where(MorphGeneMappingModel.gene_id == gene_id)
-                .where(not MorphologyModel.is_deleted)
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            result = await self.session.execute(_GET_CONTAINING_GENE, {"gene_id": gene_id})
+            models = result.unique().scalars().all()
 
-            return self.mapper.to_domain_list(list(models))
+            return await self.mapper.to_domain_list_async(list(models))
 
         except Exception as e:
             self.logger.error(
@@ -261,8 +338,9 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
             # 简化起见，这里假设所有品系都与品种兼容
 
             # 首先检查品系和品种是否存在
-            morphology_exists = await self.session.get(MorphologyModel, morphology_id) is not None
-            breed_exists = await self.session.get(BreedModel, breed_id) is not None
+            params = {"morphology_id": morphology_id, "breed_id": breed_id}
+            result = await self.session.execute(_MORPHOLOGY_AND_BREED_EXIST, params)
+            morphology_exists, breed_exists = result.one()
 
             if not morphology_exists or not breed_exists:
                 return False
@@ -289,80 +367,88 @@ class PostgreSQLMorphologyRepositoryImpl(MorphologyRepository):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[Morphology], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Morphology]:
         """搜索品系"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            # 构建基础查询
-            stmt = select(MorphologyModel).options(
-                selectinload(MorphologyModel.gene_mappings).selectinload(
-                    MorphGeneMappingModel.gene
-                )
-            )
+            # 第一步只查询当前页的品系 ID：JSON 文本匹配、连接与去重只产出 ID，不构建被跳过的整行
+            # 不带游标时总数由同一条查询的窗口函数给出（窗口在 GROUP BY 之后计算，即去重后的品系数）
+            window_count = with_total and position is None
+            columns = [MorphologyModel.id]
+            if window_count:
+                columns.append(func.count().over().label("total_count"))
+            id_stmt = select(*columns)
             count_stmt = select(func.count(MorphologyModel.id))
 
-            # 搜索条件
+            # 搜索条件：表达式与三元组索引一致（column ->> 'language'），ILIKE '%term%' 可以走 GIN 索引
             search_conditions = [
                 or_(
-                    cast(MorphologyModel.name[language], String).ilike(f"%{search_term}%"),
-                    cast(MorphologyModel.description[language], String).ilike(
-                        f"%{search_term}%"
-                    ),
+                    i18n_text(MorphologyModel.name, language).ilike(f"%{search_term}%"),
+                    i18n_text(MorphologyModel.description, language).ilike(f"%{search_term}%"),
                 )
             ]
 
             # 基因过滤条件
             if gene_ids:
-                stmt = stmt.join(
+                id_stmt = id_stmt.join(
                     MorphGeneMappingModel,
                     MorphologyModel.id == MorphGeneMappingModel.morphology_id,
                 )
-                count_stmt = count_stmt.join(
+                count_stmt = select(func.count(func.distinct(MorphologyModel.id))).join(
                     MorphGeneMappingModel,
                     MorphologyModel.id == MorphGeneMappingModel.morphology_id,
                 )
                 search_conditions.append(MorphGeneMappingModel.gene_id.in_(gene_ids))
 
             if not include_deleted:
-                search_conditions.append(not MorphologyModel.is_deleted)
+                search_conditions.append(MorphologyModel.is_deleted == false())
 
             # 组合所有条件
             where_clause = and_(*search_conditions)
 
-            stmt = stmt.where(where_clause)
+            id_stmt = id_stmt.where(where_clause)
             count_stmt = count_stmt.where(where_clause)
 
             # 如果有基因过滤，需要去重
             if gene_ids:
-                stmt = stmt.group_by(MorphologyModel.id)
-                count_stmt = (
-                    select(func.count(func.distinct(MorphologyModel.id)))
-                    .select_from(
-                        MorphologyModel.join(
-                            MorphGeneMappingModel,
-                            MorphologyModel.id == MorphGeneMappingModel.morphology_id,
-                        )
-                    )
-                    .where(where_clause)
-                )
-
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
+                id_stmt = id_stmt.group_by(MorphologyModel.id)
 
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = (
-                stmt.offset(offset)
-                .limit(page_size)
-                .order_by(MorphologyModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
+            id_stmt = paginate(id_stmt, MorphologyModel, page, page_size, position)
+
+            # 带游标且需要总数时，COUNT 与 ID 查询并发执行
+            total_count = None
+            if with_total and not window_count:
+                result, total_count = await execute_with_count(self.session, id_stmt, count_stmt)
+            else:
+                result = await self.session.execute(id_stmt)
+            rows = result.all()
+
+            if window_count:
+                # OFFSET 越过末尾时没有行携带窗口计数，改为单独 COUNT
+                if rows or page == 1:
+                    total_count = rows[0].total_count if rows else 0
+                else:
+                    total_count = (await self.session.execute(count_stmt)).scalar_one()
+            page_ids = [row.id for row in rows[:page_size]]
+
+            # 第二步按 ID 加载当前页的完整品系及其基因映射
+            models = []
+            if page_ids:
+                stmt = (
+                    select(MorphologyModel)
+                    .options(*_LOAD_OPTIONS)
+                    .where(MorphologyModel.id.in_(page_ids))
+                    .order_by(MorphologyModel.created_at.desc(), MorphologyModel.id.desc())
+                )
+                models = (await self.session.execute(stmt)).unique().scalars().all()
 
-            morphologies = self.mapper.to_domain_list(list(models))
+            morphologies = await self.mapper.to_domain_list_async(list(models))
 
-            return morphologies, total_count
+            return Page(items=morphologies, has_more=len(rows) > page_size, total=total_count)
 
         except Exception as e:
             self.logger.error(
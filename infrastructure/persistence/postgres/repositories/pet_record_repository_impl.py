@@ -1,9 +1,23 @@
+from collections.abc import AsyncIterator
+
 from loguru import logger
-from sqlalchemy import ColumnElement, UnaryExpression, and_, func, select
+from sqlalchemy import (
+    ColumnElement,
+    UnaryExpression,
+    and_,
+    any_,
+    bindparam,
+    false,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from domain.common.event_publisher import EventPublisher
+from domain.common.pagination import Page
 from domain.pet_records.entities import PetRecord
 from domain.pet_records.exceptions import PetRecordDomainError, PetRecordNotFoundError
 from domain.pet_records.repository import PetRecordRepository
@@ -12,9 +26,49 @@ from infrastructure.persistence.postgres.mappers.pet_record_mapper import (
     PetRecordMapper,
 )
 from infrastructure.persistence.postgres.models.pet_record import PetRecordModel
+from infrastructure.persistence.postgres.models.types import is_valid_id
+from infrastructure.persistence.postgres.repositories.bulk_copy import copy_rows
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+)
 from infrastructure.persistence.postgres.repositories.event_aware_repository import (
     EventAwareRepository,
 )
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.streaming import stream_domain
+
+# 读取宠物记录时的加载策略：显式预加载宠物与创建者，其余关系禁止懒加载，映射器误触发的 N+1 查询会直接报错
+_LOAD_OPTIONS = (
+    selectinload(PetRecordModel.pet),
+    selectinload(PetRecordModel.creator),
+    raiseload("*"),
+)
+
+# 热点查询
+_GET_BY_ID = (
+    select(PetRecordModel)
+    .options(*_LOAD_OPTIONS)
+    .where(PetRecordModel.id == bindparam("id"), PetRecordModel.is_deleted == false())
+)
+# 流式遍历：映射器不读取宠物与创建者，逐批读取时不再为每批附加 selectin 查询
+_GET_BY_PET_ID = (
+    select(PetRecordModel)
+    .options(raiseload("*"))
+    .where(PetRecordModel.pet_id == bindparam("pet_id"), PetRecordModel.is_deleted == false())
+    .order_by(PetRecordModel.created_at.desc(), PetRecordModel.id.desc())
+)
+_GET_BY_CREATOR_ID = (
+    select(PetRecordModel)
+    .options(raiseload("*"))
+    .where(
+        PetRecordModel.creator_id == bindparam("creator_id"),
+        PetRecordModel.is_deleted == false(),
+    )
+    .order_by(PetRecordModel.created_at.desc(), PetRecordModel.id.desc())
+)
 
 
 class PostgreSQLPetRecordRepositoryImpl(
@@ -35,17 +89,10 @@ class PostgreSQLPetRecordRepositoryImpl(
 
     async def get_by_id(self, record_id: str) -> PetRecord | None:
         """根据ID获取宠物记录"""
+        if not is_valid_id(self.session, record_id):
+            return None
         try:
-            stmt = (
-                select(PetRecordModel)
-                .options(
-                    selectinload(PetRecordModel.pet),
-                    selectinload(PetRecordModel.creator),
-                )
-                .where(PetRecordModel.id == record_id)
-                .where(PetRecordModel.is_deleted.is_(False))
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_BY_ID, {"id": record_id})
             model = result.scalar_one_or_none()
 
             if model is None:
@@ -62,35 +109,50 @@ class PostgreSQLPetRecordRepositoryImpl(
         try:
             model = self.mapper.to_model(pet_record)
             self.session.add(model)
+            # 返回的是传入的实体，flush 后无需 refresh 读回行或加载宠物与创建者
             await self.session.flush()
-            await self.session.refresh(model, attribute_names=["pet", "creator"])
 
             # 发布领域事件并返回原实体
-            await self._publish_events_from_entity(pet_record)
+            self._publish_events_from_entity(pet_record)
             return pet_record
 
         except Exception as e:
             self.logger.error(f"Failed to create pet record {pet_record.id}: {e}")
             raise PetRecordDomainError(f"Failed to create pet record: {e}")
 
+    async def bulk_copy(self, entities: list[PetRecord]) -> int:
+        """通过 COPY FROM STDIN 批量导入宠物记录（仅用于导入/初始化脚本，不发布领域事件）"""
+        if not entities:
+            return 0
+
+        try:
+            rows = [self.mapper.to_row(entity) for entity in entities]
+            return await copy_rows(self.session, PetRecordModel.__table__, rows)
+
+        except Exception as e:
+            self.logger.error(f"Failed to bulk copy {len(entities)} pet records: {e}")
+            raise PetRecordDomainError(f"Failed to bulk copy pet records: {e}")
+
     async def update(self, pet_record: PetRecord) -> PetRecord:
         """更新宠物记录"""
         try:
-            existing_model = await self.session.get(PetRecordModel, pet_record.id)
-            if existing_model is None or existing_model.is_deleted:
+            # 单条 UPDATE：调用方持有的实体已是最新状态，不预先加载行，也不在更新后读回
+            stmt = (
+                update(PetRecordModel)
+                .where(PetRecordModel.id == pet_record.id, PetRecordModel.is_deleted == false())
+                .values(
+                    pet_id=pet_record.pet_id,
+                    creator_id=pet_record.creator_id,
+                    event_type=pet_record.event_type,
+                    event_data=pet_record.event_data.model_dump(),
+                    updated_at=pet_record.updated_at,
+                )
+            )
+            result = await self.session.execute(stmt)
+            if result.rowcount == 0:
                 raise PetRecordNotFoundError(pet_record.id)
 
-            # 更新字段
-            existing_model.pet_id = pet_record.pet_id
-            existing_model.creator_id = pet_record.creator_id
-            existing_model.event_type = pet_record.event_type
-            existing_model.event_data = pet_record.event_data.model_dump()
-            existing_model.updated_at = pet_record.updated_at
-
-            await self.session.flush()
-            await self.session.refresh(existing_model)
-
-            await self._publish_events_from_entity(pet_record)
+            self._publish_events_from_entity(pet_record)
             return pet_record
 
         except PetRecordNotFoundError:
@@ -105,18 +167,19 @@ class PostgreSQLPetRecordRepositoryImpl(
             record_entity: PetRecord | None = record if isinstance(record, PetRecord) else None
             record_id = record.id if isinstance(record, PetRecord) else record
 
-            model = await self.session.get(PetRecordModel, record_id)
-            if model is None or model.is_deleted:
+            # 单条 UPDATE 软删除
+            stmt = (
+                update(PetRecordModel)
+                .where(PetRecordModel.id == record_id, PetRecordModel.is_deleted == false())
+                .values(is_deleted=True)
+            )
+            result = await self.session.execute(stmt)
+            if result.rowcount == 0:
                 return False
 
-            if record_entity is None:
-                record_entity = self.mapper.to_domain(model)
-
-            model.is_deleted = True
-            await self.session.flush()
-
-            # 发布删除事件
-            await self._publish_events_from_entity(record_entity)
+            # 只传入 ID 时没有已加载的聚合，也就没有待发布的领域事件
+            if record_entity is not None:
+                self._publish_events_from_entity(record_entity)
 
             return True
 
@@ -133,37 +196,44 @@ class PostgreSQLPetRecordRepositoryImpl(
         event_type: PetEventTypeEnum | None = None,
         creator_id: str | None = None,
         include_deleted: bool = False,
-    ) -> tuple[list[PetRecord], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[PetRecord]:
         """获取宠物记录列表"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            stmt = select(
-                PetRecordModel,
-                func.count(PetRecordModel.id).over().label("total_count"),
-            ).options(
-                selectinload(PetRecordModel.pet),
-                selectinload(PetRecordModel.creator),
-            )
             conditions = self._generate_query_conditions(
                 search, pet_id, event_type, creator_id, include_deleted
             )
+            # 不带游标时用窗口函数在同一条查询中取得总数；keyset 条件会改变窗口的统计范围，带游标时单独 COUNT
+            window_count = with_total and position is None
+            columns = [PetRecordModel]
+            if window_count:
+                columns.append(func.count(PetRecordModel.id).over().label("total_count"))
+            stmt = select(*columns).options(*_LOAD_OPTIONS)
             if conditions:
                 stmt = stmt.where(*conditions)
 
-            stmt = (
-                stmt.offset((page - 1) * page_size)
-                .limit(page_size)
-                .order_by(PetRecordModel.created_at.desc())
-            )
+            stmt = paginate(stmt, PetRecordModel, page, page_size, position)
 
-            result = await self.session.execute(stmt)
+            total_count = None
+            count_stmt = select(func.count(PetRecordModel.id)).where(*conditions)
+            if with_total and not window_count:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
             rows = result.all()
 
-            if not rows:
-                return [], 0
-            total_count = rows[0].total_count
-            models = [row.PetRecordModel for row in rows]
-            records = self.mapper.to_domain_list(models)
-            return records, total_count
+            if window_count:
+                # OFFSET 越过末尾时没有行携带窗口计数，改为单独 COUNT
+                if rows or page == 1:
+                    total_count = rows[0].total_count if rows else 0
+                else:
+                    total_count = (await self.session.execute(count_stmt)).scalar_one()
+            models = [row.PetRecordModel for row in rows[:page_size]]
+            records = await self.mapper.to_domain_list_async(models)
+            return Page(items=records, has_more=len(rows) > page_size, total=total_count)
 
         except Exception as e:
             self.logger.error(f"Failed to list pet records: {e}")
@@ -171,46 +241,34 @@ class PostgreSQLPetRecordRepositoryImpl(
 
     async def get_by_pet_id(self, pet_id: str) -> list[PetRecord]:
         """根据宠物ID获取记录列表"""
-        try:
-            stmt = (
-                select(PetRecordModel)
-                .options(
-                    selectinload(PetRecordModel.pet),
-                    selectinload(PetRecordModel.creator),
-                )
-                .where(PetRecordModel.pet_id == pet_id)
-                .where(PetRecordModel.is_deleted.is_(False))
-                .order_by(PetRecordModel.created_at.desc())
-            )
+        return [record async for record in self.iter_by_pet_id(pet_id)]
 
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            return self.mapper.to_domain_list(list(models))
+    async def get_by_creator_id(self, creator_id: str) -> list[PetRecord]:
+        """根据创建者ID获取记录列表"""
+        return [record async for record in self.iter_by_creator_id(creator_id)]
 
+    async def iter_by_pet_id(self, pet_id: str) -> AsyncIterator[PetRecord]:
+        """流式遍历宠物的记录（服务端游标分批读取）"""
+        if not is_valid_id(self.session, pet_id):
+            return
+        try:
+            params = {"pet_id": pet_id}
+            async for record in stream_domain(self.session, _GET_BY_PET_ID, self.mapper, params):
+                yield record
         except Exception as e:
             self.logger.error(f"Failed to get pet records by pet_id {pet_id}: {e}")
             raise PetRecordDomainError(f"Failed to get pet records by pet: {e}")
 
-    async def get_by_creator_id(self, creator_id: str) -> list[PetRecord]:
-        """根据创建者ID获取记录列表"""
+    async def iter_by_creator_id(self, creator_id: str) -> AsyncIterator[PetRecord]:
+        """流式遍历创建者的记录（服务端游标分批读取）"""
+        if not is_valid_id(self.session, creator_id):
+            return
         try:
-            stmt = (
-                select(PetRecordModel)
-                .options(
-                    selectinload(PetRecordModel.pet),
-                    selectinload(PetRecordModel.creator),
-                )
-                .where(PetRecordModel.creator_id == creator_id)
-                .where(PetRecordModel.is_deleted.is_(False))
-                .order_by(PetRecordModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            return self.mapper.to_domain_list(list(models))
-
+            params = {"creator_id": creator_id}
+            async for record in stream_domain(
+                self.session, _GET_BY_CREATOR_ID, self.mapper, params
+            ):
+                yield record
         except Exception as e:
             self.logger.error(
                 f"Failed to get pet records by creator_id {creator_id}: {e}"
@@ -226,8 +284,13 @@ class PostgreSQLPetRecordRepositoryImpl(
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[PetRecord], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+        event_types: list[PetEventTypeEnum] | None = None,
+    ) -> Page[PetRecord]:
         """搜索宠物记录"""
+        position = decode_cursor(self.session, cursor)
+
         try:
             # 构建搜索条件
             search_conditions = []
@@ -235,10 +298,16 @@ class PostgreSQLPetRecordRepositoryImpl(
                 search_conditions.append(PetRecordModel.pet_id == pet_id)
             if event_type:
                 search_conditions.append(PetRecordModel.event_type == event_type)
+            if event_types:
+                # 整个列表作为一个数组参数（= ANY(:event_types)），不同长度的列表共用同一条语句与执行计划
+                search_conditions.append(
+                    PetRecordModel.event_type
+                    == any_(bindparam("event_types", event_types, type_=ARRAY(PetRecordModel.event_type.type)))
+                )
             if creator_id:
                 search_conditions.append(PetRecordModel.creator_id == creator_id)
             if not include_deleted:
-                search_conditions.append(PetRecordModel.is_deleted.is_(False))
+                search_conditions.append(PetRecordModel.is_deleted == false())
             # 注意：由于移除了description字段，搜索功能暂时禁用
             # 如果需要搜索功能，可以考虑在event_data中搜索
 
@@ -247,32 +316,25 @@ class PostgreSQLPetRecordRepositoryImpl(
 
             stmt = (
                 select(PetRecordModel)
-                .options(
-                    selectinload(PetRecordModel.pet),
-                    selectinload(PetRecordModel.creator),
-                )
+                .options(*_LOAD_OPTIONS)
                 .where(where_clause)
             )
             count_stmt = select(func.count(PetRecordModel.id)).where(where_clause)
 
-            # 获取总数
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar()
-
             # 分页查询
-            offset = (page - 1) * page_size
-            stmt = (
-                stmt.offset(offset)
-                .limit(page_size)
-                .order_by(PetRecordModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
+            stmt = paginate(stmt, PetRecordModel, page, page_size, position)
+
+            # 仅在调用方需要总数时才执行 COUNT，并与分页查询并发执行
+            total_count = None
+            if with_total:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
             models = result.scalars().all()
 
-            records = self.mapper.to_domain_list(list(models))
+            records = await self.mapper.to_domain_list_async(list(models[:page_size]))
 
-            return records, total_count
+            return Page(items=records, has_more=len(models) > page_size, total=total_count)
 
         except Exception as e:
             self.logger.error(
@@ -299,5 +361,6 @@ class PostgreSQLPetRecordRepositoryImpl(
         if creator_id:
             conditions.append(PetRecordModel.creator_id == creator_id)
         if not include_deleted:
-            conditions.append(PetRecordModel.is_deleted.is_(False))
+            # 写作 = false，与部分索引的 WHERE is_deleted = false 谓词一致
+            conditions.append(PetRecordModel.is_deleted == false())
         return conditions
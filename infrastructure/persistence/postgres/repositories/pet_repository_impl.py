@@ -1,11 +1,26 @@
 
+from collections.abc import AsyncIterator
+
 from loguru import logger
-from sqlalchemy import ColumnElement, UnaryExpression, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    UnaryExpression,
+    bindparam,
+    exists,
+    false,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import String, cast
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from domain.common.event_publisher import EventPublisher
+from domain.common.pagination import Page
 from domain.pets.entities import Pet
 from domain.pets.exceptions import PetNotFoundError, PetRepositoryError
 from domain.pets.repository import PetRepository
@@ -13,11 +28,90 @@ from infrastructure.persistence.postgres.mappers import PetMapper
 from infrastructure.persistence.postgres.models.morph_gene_mapping import (
     MorphGeneMappingModel,
 )
-from infrastructure.persistence.postgres.models.morphology import MorphologyModel
 from infrastructure.persistence.postgres.models.pet import PetModel
+from infrastructure.persistence.postgres.models.types import is_valid_id
+from infrastructure.persistence.postgres.repositories.bulk_copy import copy_rows
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+    has_writes,
+)
 from infrastructure.persistence.postgres.repositories.event_aware_repository import (
     EventAwareRepository,
 )
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.streaming import stream_domain
+from infrastructure.persistence.postgres.repositories.ttl_cache import (
+    TTLCache,
+    invalidate_on_commit,
+)
+
+# 名称存在性检查的短期缓存：创建/更新前的校验常在短时间内以相同参数重复调用。
+# 更新可能改掉旧名称而旧名称未知，因此任何宠物写入都清空整个缓存
+PET_NAME_EXISTS_TTL = 5.0
+pet_name_exists_cache: TTLCache[bool] = TTLCache(ttl=PET_NAME_EXISTS_TTL, maxsize=10_000)
+
+# 插入语句在模块加载时构建一次，后续调用直接复用缓存的编译结果
+_INSERT_PET = lambda_stmt(lambda: insert(PetModel))
+
+# 读取宠物时的加载策略在模块加载时构建一次：映射器只读取额外基因列表（宠物聚合只保存
+# 主人/品种/品系的 ID），因此只预加载它；其余关系禁止懒加载，误触发的 N+1 查询会直接报错
+_MAPPER_LOAD_OPTIONS = (
+    selectinload(PetModel.extra_gene_list).selectinload(MorphGeneMappingModel.gene),
+    raiseload("*"),
+)
+
+# 热点查询
+_GET_BY_ID = (
+    select(PetModel)
+    .options(*_MAPPER_LOAD_OPTIONS)
+    .where(PetModel.id == bindparam("id"), PetModel.is_deleted == false())
+)
+# 按外键列出宠物的查询只有筛选列不同，共用加载策略与排序
+_ACTIVE_PETS = (
+    select(PetModel)
+    .options(*_MAPPER_LOAD_OPTIONS)
+    .where(PetModel.is_deleted == false())
+    .order_by(PetModel.created_at.desc())
+)
+_GET_BY_OWNER_ID = _ACTIVE_PETS.where(PetModel.owner_id == bindparam("value"))
+_GET_BY_BREED_ID = _ACTIVE_PETS.where(PetModel.breed_id == bindparam("value"))
+_GET_BY_MORPHOLOGY_ID = _ACTIVE_PETS.where(PetModel.morphology_id == bindparam("value"))
+# 名称不唯一：同名时返回最近创建的宠物
+_GET_BY_NAME = _ACTIVE_PETS.where(PetModel.name == bindparam("name")).limit(1)
+
+# 单条 UPDATE ... RETURNING
+_UPDATE = (
+    update(PetModel)
+    .where(PetModel.id == bindparam("pet_id"), PetModel.is_deleted == false())
+    .values(
+        name=bindparam("new_name"),
+        description=bindparam("new_description"),
+        birth_date=bindparam("new_birth_date"),
+        owner_id=bindparam("new_owner_id"),
+        breed_id=bindparam("new_breed_id"),
+        gender=bindparam("new_gender"),
+        morphology_id=bindparam("new_morphology_id"),
+        updated_at=bindparam("new_updated_at"),
+    )
+    .returning(PetModel)
+    .options(*_MAPPER_LOAD_OPTIONS)
+    .execution_options(populate_existing=True)
+)
+# 单条 UPDATE 软删除
+_SOFT_DELETE = (
+    update(PetModel)
+    .where(PetModel.id == bindparam("pet_id"), PetModel.is_deleted == false())
+    .values(is_deleted=True)
+)
+# 调用方只传入 ID 时，在同一条 UPDATE 中取回被删除的行，用于构造发布事件的领域实体
+_SOFT_DELETE_RETURNING = (
+    _SOFT_DELETE.returning(PetModel)
+    .options(*_MAPPER_LOAD_OPTIONS)
+    .execution_options(populate_existing=True)
+)
 
 
 class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
@@ -31,18 +125,10 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
 
     async def get_by_id(self, entity_id: str) -> Pet | None:
         """根据ID获取宠物"""
+        if not is_valid_id(self.session, entity_id):
+            return None
         try:
-            stmt = (
-                select(PetModel)
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology).selectinload(MorphologyModel.gene_mappings),
-                    selectinload(PetModel.extra_gene_list).selectinload(MorphGeneMappingModel.gene)
-                )
-                .where(PetModel.id == entity_id)
-                .where(PetModel.is_deleted.is_(False))
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_BY_ID, {"id": entity_id})
             model = result.scalar_one_or_none()
 
             if model is None:
@@ -57,13 +143,15 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
     async def create(self, entity: Pet) -> Pet:
         """创建宠物"""
         try:
-            model = self.mapper.to_model(entity)
-            self.session.add(model)
-            await self.session.flush()
-            await self.session.refresh(model, attribute_names=['breed', 'morphology', 'extra_gene_list', 'owner'])
+            # 单条 INSERT ... RETURNING：服务端默认值随插入一并返回，不再 refresh 关系
+            stmt = insert(PetModel).values(**self.mapper.to_row(entity)).returning(PetModel)
+            model = (await self.session.execute(stmt)).scalar_one()
+            invalidate_on_commit(self.session, pet_name_exists_cache)
+            # 新建的宠物还没有额外基因映射，直接置为空列表，无需再查询
+            set_committed_value(model, "extra_gene_list", [])
 
             # 发布聚合上的领域事件
-            await self._publish_events_from_entity(entity)
+            self._publish_events_from_entity(entity)
 
             # 转换为领域实体返回
             created_pet = self.mapper.to_domain(model)
@@ -73,32 +161,64 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
             self.logger.error(f"Failed to create pet {entity.id}: {e}")
             raise PetRepositoryError(f"Failed to create pet: {e}", "create")
 
+    async def bulk_create(self, pets: list[Pet]) -> int:
+        """批量创建宠物（单条 INSERT 多行 VALUES，不经过工作单元）"""
+        if not pets:
+            return 0
+
+        try:
+            rows = [self.mapper.to_row(pet) for pet in pets]
+            await self.session.execute(_INSERT_PET, rows)
+            invalidate_on_commit(self.session, pet_name_exists_cache)
+
+            self._publish_events_from_entities(pets)
+            return len(rows)
+
+        except Exception as e:
+            self.logger.error(f"Failed to bulk create {len(pets)} pets: {e}")
+            raise PetRepositoryError(f"Failed to bulk create pets: {e}", "bulk_create")
+
+    async def bulk_copy(self, pets: list[Pet]) -> int:
+        """通过 COPY FROM STDIN 批量导入宠物（仅用于导入/初始化脚本，不发布领域事件）"""
+        if not pets:
+            return 0
+
+        try:
+            rows = [self.mapper.to_row(pet) for pet in pets]
+            copied = await copy_rows(self.session, PetModel.__table__, rows)
+            invalidate_on_commit(self.session, pet_name_exists_cache)
+            return copied
+
+        # COPY 直接使用驱动连接，驱动自身的异常不会被包装为 SQLAlchemyError
+        except Exception as e:
+            self.logger.error(f"Failed to bulk copy {len(pets)} pets: {e}")
+            raise PetRepositoryError(f"Failed to bulk copy pets: {e}", "bulk_copy")
+
     async def update(self, entity: Pet) -> Pet:
         """更新宠物"""
         try:
-            existing_model = await self.session.get(PetModel, entity.id)
-            if existing_model is None or existing_model.is_deleted:
+            params = {
+                "pet_id": entity.id,
+                "new_name": entity.name,
+                "new_description": entity.description,
+                "new_birth_date": entity.birth_date,
+                "new_owner_id": entity.owner_id,
+                "new_breed_id": entity.breed_id,
+                "new_gender": entity.gender,
+                "new_morphology_id": entity.morphology_id,
+                "new_updated_at": entity.updated_at,
+            }
+            result = await self.session.execute(_UPDATE, params)
+            updated_model = result.scalar_one_or_none()
+            if updated_model is None:
                 raise PetNotFoundError(entity.id)
-
-            # 更新字段
-            existing_model.name = entity.name
-            existing_model.description = entity.description
-            existing_model.birth_date = entity.birth_date
-            existing_model.owner_id = entity.owner_id
-            existing_model.breed_id = entity.breed_id
-            existing_model.gender = entity.gender
-            existing_model.morphology_id = entity.morphology_id
-            existing_model.updated_at = entity.updated_at
-
-            await self.session.flush()
-            await self.session.refresh(existing_model)
+            invalidate_on_commit(self.session, pet_name_exists_cache)
 
             # 发布聚合上的领域事件
-            await self._publish_events_from_entity(entity)
+            self._publish_events_from_entity(entity)
 
             # 转换为领域实体返回
-            updated_pet = self.mapper.to_domain(existing_model)
-            return updated_pet
+            return self.mapper.to_domain(updated_model)
 
         except PetNotFoundError:
             raise
@@ -112,20 +232,21 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
             pet_entity: Pet | None = entity if isinstance(entity, Pet) else None
             entity_id = entity.id if isinstance(entity, Pet) else entity
 
-            model = await self.session.get(PetModel, entity_id)
-            if model is None or model.is_deleted:
-                return False
-
-            # 软删除
-            model.is_deleted = True
-            await self.session.flush()
-
-            # 确保有领域实体用于发布事件
             if pet_entity is None:
+                result = await self.session.execute(_SOFT_DELETE_RETURNING, {"pet_id": entity_id})
+                model = result.scalar_one_or_none()
+                if model is None:
+                    return False
                 pet_entity = self.mapper.to_domain(model)
+            else:
+                result = await self.session.execute(_SOFT_DELETE, {"pet_id": entity_id})
+                if result.rowcount == 0:
+                    return False
+
+            invalidate_on_commit(self.session, pet_name_exists_cache)
 
             # 发布删除事件
-            await self._publish_events_from_entity(pet_entity)
+            self._publish_events_from_entity(pet_entity)
 
             return True
 
@@ -137,48 +258,60 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
         self,
         page: int = 1,
         page_size: int = 10,
-        search: str = None,
-        owner_id: str = None,
-        include_deleted: bool = False
-    ) -> tuple[list[Pet], int]:
+        search: str | None = None,
+        owner_id: str | None = None,
+        include_deleted: bool = False,
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[Pet]:
         """获取宠物列表"""
+        position = decode_cursor(self.session, cursor)
+
         try:
-            stmt = (
-                select(
-                    PetModel,
-                    func.count(PetModel.id).over().label("total_count")
-                )
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology),
-                    selectinload(PetModel.extra_gene_list),
-                    selectinload(PetModel.owner)
-                )
-            )
             conditions = self._generate_query_conditions(search, owner_id, include_deleted)
+            stmt = select(PetModel).options(*_MAPPER_LOAD_OPTIONS)
             if conditions:
                 stmt = stmt.where(*conditions)
 
-            stmt = stmt.offset((page - 1) * page_size).limit(page_size).order_by(PetModel.created_at.desc())
-
-            result = await self.session.execute(stmt)
-            rows = result.all()
+            # 分页查询
+            stmt = paginate(stmt, PetModel, page, page_size, position)
+
+            # 仅在调用方需要总数时才执行 COUNT，并与分页查询并发执行。
+            # 不用 count(*) OVER ()：窗口函数要求先取出全部匹配行，分页查询无法在 LIMIT 处提前结束索引扫描
+            total_count = None
+            if with_total:
+                count_stmt = select(func.count(PetModel.id)).where(*conditions)
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
+            models = result.scalars().all()
 
-            if not rows:
-                return [], 0
-            total_count = rows[0].total_count
-            models = [row.PetModel for row in rows]
-            pets = self.mapper.to_domain_list(models)
-            return pets, total_count
+            pets = await self.mapper.to_domain_list_async(list(models[:page_size]))
+            return Page(items=pets, has_more=len(models) > page_size, total=total_count)
 
         except Exception as e:
             self.logger.error(f"Failed to list pets: {e}")
             raise PetRepositoryError(f"Failed to list pets: {e}", "list_all")
 
+    async def iter_all(self, owner_id: str | None = None) -> AsyncIterator[Pet]:
+        """流式遍历未删除的宠物（服务端游标分批读取）"""
+        stmt = (
+            select(PetModel)
+            .options(*_MAPPER_LOAD_OPTIONS)
+            .where(*self._generate_query_conditions(owner_id=owner_id))
+            .order_by(PetModel.created_at.desc())
+        )
+        try:
+            async for pet in stream_domain(self.session, stmt, self.mapper):
+                yield pet
+        except Exception as e:
+            self.logger.error(f"Failed to stream pets: {e}")
+            raise PetRepositoryError(f"Failed to stream pets: {e}", "iter_all")
+
     def _generate_query_conditions(
         self,
-        search: str = None,
-        owner_id: str = None,
+        search: str | None = None,
+        owner_id: str | None = None,
         include_deleted: bool = False
     ) -> list[UnaryExpression | ColumnElement]:
         """生成查询条件"""
@@ -188,95 +321,36 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
         if owner_id:
             conditions.append(PetModel.owner_id == owner_id)
         if not include_deleted:
-            conditions.append(PetModel.is_deleted.is_(False))
+            conditions.append(PetModel.is_deleted == false())
         return conditions
 
-    async def get_by_owner_id(self, owner_id: str) -> list[Pet]:
-        """根据主人ID获取宠物列表"""
+    async def _list_by(self, stmt: Select, value: str, operation: str) -> list[Pet]:
+        """执行按外键筛选的预构建查询（服务端游标分批读取，ORM 对象不会一次全部驻留）"""
+        if not is_valid_id(self.session, value):
+            return []
         try:
-            stmt = (
-                select(PetModel)
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology),
-                    selectinload(PetModel.extra_gene_list)
-                )
-                .where(PetModel.owner_id == owner_id)
-                .where(PetModel.is_deleted.is_(False))
-                .order_by(PetModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            return self.mapper.to_domain_list(list(models))
+            return [pet async for pet in stream_domain(self.session, stmt, self.mapper, {"value": value})]
 
         except Exception as e:
-            self.logger.error(f"Failed to get pets by owner_id {owner_id}: {e}")
-            raise PetRepositoryError(f"Failed to get pets by owner: {e}", "get_by_owner_id")
+            self.logger.error(f"Failed to {operation} {value}: {e}")
+            raise PetRepositoryError(f"Failed to {operation}: {e}", operation)
+
+    async def get_by_owner_id(self, owner_id: str) -> list[Pet]:
+        """根据主人ID获取宠物列表"""
+        return await self._list_by(_GET_BY_OWNER_ID, owner_id, "get_by_owner_id")
 
     async def get_by_breed_id(self, breed_id: str) -> list[Pet]:
         """根据品种ID获取宠物列表"""
-        try:
-            stmt = (
-                select(PetModel)
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology),
-                    selectinload(PetModel.extra_gene_list)
-                )
-                .where(PetModel.breed_id == breed_id)
-                .where(PetModel.is_deleted.is_(False))
-                .order_by(PetModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            return self.mapper.to_domain_list(list(models))
-
-        except Exception as e:
-            self.logger.error(f"Failed to get pets by breed_id {breed_id}: {e}")
-            raise PetRepositoryError(f"Failed to get pets by breed: {e}", "get_by_breed_id")
+        return await self._list_by(_GET_BY_BREED_ID, breed_id, "get_by_breed_id")
 
     async def get_by_morphology_id(self, morphology_id: str) -> list[Pet]:
         """根据品系ID获取宠物列表"""
-        try:
-            stmt = (
-                select(PetModel)
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology),
-                    selectinload(PetModel.extra_gene_list)
-                )
-                .where(PetModel.morphology_id == morphology_id)
-                .where(PetModel.is_deleted.is_(False))
-                .order_by(PetModel.created_at.desc())
-            )
-
-            result = await self.session.execute(stmt)
-            models = result.scalars().all()
-
-            return self.mapper.to_domain_list(list(models))
-
-        except Exception as e:
-            self.logger.error(f"Failed to get pets by morphology_id {morphology_id}: {e}")
-            raise PetRepositoryError(f"Failed to get pets by morphology: {e}", "get_by_morphology_id")
+        return await self._list_by(_GET_BY_MORPHOLOGY_ID, morphology_id, "get_by_morphology_id")
 
     async def get_by_name(self, name: str, language: str = "en") -> Pet | None:
-        """根据名称获取宠物（支持国际化）"""
+        """根据名称获取宠物（宠物名称不区分语言，language 参数仅为接口兼容保留）"""
         try:
-            stmt = (
-                select(PetModel)
-                .options(
-                    selectinload(PetModel.breed),
-                    selectinload(PetModel.morphology),
-                    selectinload(PetModel.extra_gene_list)
-                )
-                .where(cast(PetModel.name[language], String) == name)
-                .where(PetModel.is_deleted.is_(False))
-            )
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(_GET_BY_NAME, {"name": name})
             model = result.scalar_one_or_none()
 
             if model is None:
@@ -291,15 +365,25 @@ class PostgreSQLPetRepositoryImpl(EventAwareRepository[Pet], PetRepository):
     async def exists_by_name(self, name: str, exclude_id: str | None = None) -> bool:
         """检查指定名称的宠物是否存在（可选排除ID）"""
         try:
-            stmt = select(func.count(PetModel.id)).where(
-                PetModel.name == name,
-                PetModel.is_deleted.is_(False),
-            )
+            # 当前事务已有写入时既不读也不写缓存，避免缓存未提交的数据
+            cacheable = not has_writes(self.session)
+            cache_key = f"{name}\x00{exclude_id or ''}"
+            generation = pet_name_exists_cache.generation
+            if cacheable:
+                cached = pet_name_exists_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            # EXISTS 找到第一行即停止，不必像 COUNT 那样访问所有同名宠物
+            conditions = [PetModel.name == name, PetModel.is_deleted == false()]
             if exclude_id:
-                stmt = stmt.where(PetModel.id != exclude_id)
-            result = await self.session.execute(stmt)
-            count = result.scalar() or 0
-            return count > 0
+                conditions.append(PetModel.id != exclude_id)
+            result = await self.session.execute(select(exists().where(*conditions)))
+            name_exists = bool(result.scalar())
+
+            if cacheable:
+                pet_name_exists_cache.set(cache_key, name_exists, generation)
+            return name_exists
         except Exception as e:
             self.logger.error(f"Failed to check pet exists by name {name}: {e}")
             raise PetRepositoryError(f"Failed to check exists_by_name: {e}", "exists_by_name")
@@ -5,14 +5,47 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 from loguru import logger
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Row,
+    Select,
+    and_,
+    false,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.pets.read_models import PetSearchReadRepository, PetSearchRow
-from domain.pets.value_objects import GenderEnum
+from domain.common.pagination import Page
 from infrastructure.persistence.postgres.models.breed import BreedModel
-from infrastructure.persistence.postgres.models.pet import PetModel
+from infrastructure.persistence.postgres.models.indexes import search_vector_match
+from infrastructure.persistence.postgres.models.pet import (
+    PET_NAME_SEARCH_COLUMN,
+    PET_NAME_SEARCH_CONFIG,
+    PetModel,
+)
 from infrastructure.persistence.postgres.models.user import UserModel
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    can_count_concurrently,
+    execute_with_count,
+)
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+
+# 分页子查询从 pets 取出的列，供 _join_names 关联名称
+_PAGE_COLUMNS = (
+    PetModel.id,
+    PetModel.name,
+    PetModel.gender,
+    PetModel.created_at,
+    PetModel.owner_id,
+    PetModel.breed_id,
+)
 
 
 class PostgreSQLPetSearchReadRepository(PetSearchReadRepository):
@@ -30,7 +63,11 @@ class PostgreSQLPetSearchReadRepository(PetSearchReadRepository):
         page: int = 1,
         page_size: int = 10,
         include_deleted: bool = False,
-    ) -> tuple[list[PetSearchRow], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[PetSearchRow]:
+        position = decode_cursor(self.session, cursor)
+
         try:
             conditions = []
             if owner_id:
@@ -40,65 +77,118 @@ class PostgreSQLPetSearchReadRepository(PetSearchReadRepository):
             if morphology_id:
                 conditions.append(PetModel.morphology_id == morphology_id)
             if not include_deleted:
-                conditions.append(PetModel.is_deleted.is_(False))
+                conditions.append(PetModel.is_deleted == false())
             if search_term:
-                conditions.append(PetModel.name.ilike(f"%{search_term}%"))
+                # 子串匹配走三元组索引；多个词按任意顺序出现时由 tsvector 全文检索命中（两者均为 GIN 索引，可 BitmapOr）
+                conditions.append(
+                    or_(
+                        PetModel.name.ilike(f"%{search_term}%"),
+                        search_vector_match(
+                            PetModel.__table__,
+                            search_term,
+                            config=PET_NAME_SEARCH_CONFIG,
+                            column=PET_NAME_SEARCH_COLUMN,
+                        ),
+                    )
+                )
 
             where_clause = and_(*conditions) if conditions else None
 
-            stmt = (
-                select(
-                    PetModel.id,
-                    PetModel.name,
-                    PetModel.gender,
-                    PetModel.created_at,
-                    PetModel.owner_id,
-                    UserModel.username,
-                    UserModel.full_name,
-                    PetModel.breed_id,
-                    BreedModel.name.label("breed_name"),
-                )
-                .select_from(PetModel)
-                .join(UserModel, and_(UserModel.id == PetModel.owner_id, UserModel.is_deleted.is_(False)), isouter=True)
-                .join(BreedModel, and_(BreedModel.id == PetModel.breed_id, BreedModel.is_deleted.is_(False)), isouter=True)
+            # COUNT 能在独立连接上并发执行时不会延长总耗时；不能并发时（事务已有写入或单连接池）
+            # 首页改用窗口函数在同一条查询中取得总数，省去一次串行往返。带游标时 keyset 条件会改变窗口的统计范围
+            window_count = (
+                with_total and position is None and not can_count_concurrently(self.session)
             )
-
             count_stmt = select(func.count(PetModel.id)).select_from(PetModel)
             if where_clause is not None:
-                stmt = stmt.where(where_clause)
                 count_stmt = count_stmt.where(where_clause)
 
-            count_result = await self.session.execute(count_stmt)
-            total_count = count_result.scalar() or 0
-
-            offset = (page - 1) * page_size
-            stmt = stmt.order_by(PetModel.created_at.desc()).offset(offset).limit(page_size)
-
-            result = await self.session.execute(stmt)
+            if window_count:
+                # 窗口计数必须遍历全部匹配行：先在 pets 上完成筛选、计数与分页，再只为当前页的行关联主人与品种，
+                # 否则两次 LEFT JOIN 会对每个匹配行各执行一遍
+                page_stmt = select(*_PAGE_COLUMNS, func.count().over().label("total_count"))
+                if where_clause is not None:
+                    page_stmt = page_stmt.where(where_clause)
+                page_rows = paginate(page_stmt, PetModel, page, page_size, position).subquery("page_rows")
+                stmt = self._join_names(page_rows, page_rows.c.total_count).order_by(
+                    page_rows.c.created_at.desc(), page_rows.c.id.desc()
+                )
+            else:
+                # 不做窗口计数时直接关联：嵌套循环按 keyset 索引顺序逐行查找主键，取满一页即停止
+                stmt = self._join_names(PetModel.__table__)
+                if where_clause is not None:
+                    stmt = stmt.where(where_clause)
+                # 分页查询
+                stmt = paginate(stmt, PetModel, page, page_size, position)
+
+            # 仅在调用方需要总数时才执行 COUNT，并与分页查询分别在两条连接上并发执行
+            total_count = None
+            if with_total and not window_count:
+                result, total_count = await execute_with_count(self.session, stmt, count_stmt)
+            else:
+                result = await self.session.execute(stmt)
             rows: Sequence = result.all()
 
-            return [self._to_row(row) for row in rows], total_count
+            if window_count:
+                # OFFSET 越过末尾时没有行携带窗口计数，改为单独 COUNT
+                if rows or page == 1:
+                    total_count = rows[0].total_count if rows else 0
+                else:
+                    total_count = (await self.session.execute(count_stmt)).scalar_one()
+
+            return Page(
+                items=[self._to_row(row) for row in rows[:page_size]],
+                has_more=len(rows) > page_size,
+                total=total_count,
+            )
 
         except Exception as exc:
             logger.error(f"Failed to search pets read model: {exc}")
             raise
 
     @staticmethod
-    def _to_row(row: Sequence) -> PetSearchRow:
-        owner_username = getattr(row, "username", None)
-        owner_full_name = getattr(row, "full_name", None)
-        owner_name = owner_username or owner_full_name
-
-        breed_name = getattr(row, "breed_name", None)
+    def _join_names(pets: FromClause, *extra_columns: ColumnElement) -> Select:
+        """为宠物行关联主人与品种名称，列顺序与 _to_row 的解包顺序一致（额外列追加在末尾）
+
+        已删除的主人/品种只在 ON 中排除：宠物仍然返回，对应名称为空。主键查找后的这一过滤几乎没有开销。
+        """
+        return (
+            select(
+                pets.c.id,
+                pets.c.name,
+                pets.c.gender,
+                pets.c.created_at,
+                pets.c.owner_id,
+                UserModel.username,
+                UserModel.full_name,
+                pets.c.breed_id,
+                BreedModel.name.label("breed_name"),
+                *extra_columns,
+            )
+            .select_from(pets)
+            .join(
+                UserModel,
+                and_(UserModel.id == pets.c.owner_id, UserModel.is_deleted == false()),
+                isouter=True,
+            )
+            .join(
+                BreedModel,
+                and_(BreedModel.id == pets.c.breed_id, BreedModel.is_deleted == false()),
+                isouter=True,
+            )
+        )
 
+    @staticmethod
+    def _to_row(row: Row) -> PetSearchRow:
+        """按查询列的顺序解包结果行；gender 列已由 SmallIntEnumType 转换为 GenderEnum"""
+        pet_id, name, gender, created_at, owner_id, username, full_name, breed_id, breed_name, *_ = row
         return PetSearchRow(
-            id=row.id,
-            name=row.name,
-            gender=GenderEnum(row.gender) if not isinstance(row.gender, GenderEnum) else row.gender,
-            created_at=row.created_at,
-            owner_id=row.owner_id,
-            owner_name=owner_name,
-            breed_id=row.breed_id,
+            id=pet_id,
+            name=name,
+            gender=gender,
+            created_at=created_at,
+            owner_id=owner_id,
+            owner_name=username or full_name,
+            breed_id=breed_id,
             breed_name=breed_name,
         )
-
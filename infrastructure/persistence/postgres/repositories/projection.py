@@ -0,0 +1,14 @@
+"""Column projections for read paths that only map rows to domain entities."""
+
+from typing import Any
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def entity_columns(model: Any) -> tuple[InstrumentedAttribute, ...]:
+    """模型全部映射列的 ORM 属性
+
+    select(*entity_columns(Model)) 返回 Row 而不是模型实例，跳过逐行构建 InstanceState 和身份映射；
+    Row 支持按列名访问属性，mapper.to_domain 可以直接转换。语句仍以模型为主体，soft_delete 的全局条件照常生效。
+    """
+    return tuple(getattr(model, column.key) for column in model.__table__.columns)
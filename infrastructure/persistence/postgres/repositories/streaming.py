@@ -0,0 +1,27 @@
+"""Helpers for streaming large result sets through server-side cursors."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.persistence.postgres.mappers.base import BaseMapper
+
+# 每批从服务端游标拉取的行数
+STREAM_CHUNK_SIZE = 1000
+
+
+async def stream_domain[T](
+    session: AsyncSession,
+    statement: Select[Any],
+    mapper: BaseMapper[T, Any],
+    params: dict[str, Any] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[T]:
+    """按批次流式读取查询结果并逐个转换为领域实体，内存占用与批大小相关而非结果总数"""
+    result = await session.stream_scalars(
+        statement.execution_options(yield_per=chunk_size), params
+    )
+    async for model in result:
+        yield mapper.to_domain(model)
@@ -0,0 +1,81 @@
+"""Short-lived, process-local key/value cache with per-entry expiry."""
+
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# session.info 中等待事务结束后再次执行的缓存失效：[(cache, key), ...]，key 为 None 表示清空
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+class TTLCache[V]:
+    """按键缓存查询结果，过期或失效后由调用方重新查询
+
+    缓存只在当前进程内有效：其他进程（多 worker 部署）的写入无法通知到这里，结果最多滞后 ttl 秒。
+    条目数达到 maxsize 时淘汰最早写入的条目。
+    """
+
+    def __init__(self, ttl: float, maxsize: int | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[str, tuple[float, V]] = {}
+        # 每次失效递增：查询前记下的代数与写入时不一致，说明查询期间发生过失效，结果可能已过时
+        self.generation = 0
+
+    def get(self, key: str) -> V | None:
+        """返回未过期的值，没有缓存或已过期时返回 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: V, generation: int | None = None) -> None:
+        """记录刚查询出的值；传入查询前的 generation 时，期间发生过失效则不写入"""
+        if generation is not None and generation != self.generation:
+            return
+        # 重新插入使条目移到末尾，字典的插入顺序即写入先后
+        self._entries.pop(key, None)
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: str) -> None:
+        """写入改变结果后丢弃缓存"""
+        self.generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """清空全部缓存"""
+        self.generation += 1
+        self._entries.clear()
+
+
+def invalidate_on_commit(session: AsyncSession, cache: TTLCache, key: str | None = None) -> None:
+    """写入后立即失效缓存，并在事务提交或回滚后再失效一次
+
+    写入到提交之间，并发请求仍会读到旧的已提交数据并写回缓存；
+    事务结束后再次失效，丢弃这段时间写回的旧值。key 为 None 时清空整个缓存。
+    """
+    _invalidate(cache, key)
+    session.info.setdefault(_PENDING_INVALIDATIONS, []).append((cache, key))
+
+
+def _invalidate(cache: TTLCache, key: str | None) -> None:
+    if key is None:
+        cache.clear()
+    else:
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _apply_pending_invalidations(session: Session) -> None:
+    """事务结束后执行排队的缓存失效"""
+    for cache, key in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        _invalidate(cache, key)
@@ -1,16 +1,97 @@
 from loguru import logger
-from sqlalchemy import ColumnElement, UnaryExpression, func
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    UnaryExpression,
+    bindparam,
+    exists,
+    false,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 
+from domain.common.pagination import Page
 from domain.users.entities import User
 from domain.users.repository import UserRepository
 from domain.users.value_objects import UserTypeEnum
 from infrastructure.persistence.postgres.mappers.user_mapper import UserMapper
+from infrastructure.persistence.postgres.models.types import is_valid_id
 from infrastructure.persistence.postgres.models.user import UserModel
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    execute_with_count,
+    has_writes,
+)
 from infrastructure.persistence.postgres.repositories.event_aware_repository import (
     EventAwareRepository,
 )
+from infrastructure.persistence.postgres.repositories.keyset import (
+    decode_cursor,
+    paginate,
+)
+from infrastructure.persistence.postgres.repositories.projection import entity_columns
+
+# 按 ID/用户名/邮箱查询用户的缓存，存放在 session.info 中，只在会话（即单个请求）内有效：
+# 认证流程在同一请求中按相同的键重复查询。缓存包含密码哈希与启用/删除状态，不跨请求复用，
+# 其他进程中的修改密码、停用或删除立即生效。更新可能改掉旧的用户名/邮箱而旧值未知，因此任何用户写入都清空整个缓存
+_USER_CACHE = "user_cache"
+
+# 插入语句在模块加载时构建一次，后续调用直接复用缓存的编译结果
+_INSERT_USER = lambda_stmt(lambda: insert(UserModel))
+
+# 用户映射器不访问任何关系：禁止懒加载，误触发的 N+1 查询会直接报错
+_LOAD_OPTIONS = (raiseload("*"),)
+
+# 列表查询只取映射列，由映射器直接从 Row 构建实体
+_USER_COLUMNS = entity_columns(UserModel)
+
+# 热点查询在模块加载时构建一次，调用时只传入参数
+_ACTIVE_USERS = select(UserModel).options(*_LOAD_OPTIONS).where(UserModel.is_deleted == false())
+_GET_BY_ID = _ACTIVE_USERS.where(UserModel.id == bindparam("value"))
+_GET_BY_USERNAME = _ACTIVE_USERS.where(UserModel.username == bindparam("value"))
+_GET_BY_EMAIL = _ACTIVE_USERS.where(UserModel.email == bindparam("value"))
+# 批量按 ID 查询：expanding 参数在执行时展开为 IN 列表，一条语句取回全部用户
+_GET_BY_IDS = (
+    select(*_USER_COLUMNS)
+    .where(UserModel.is_deleted == false())
+    .where(UserModel.id.in_(bindparam("ids", expanding=True)))
+)
+
+# 单条 UPDATE ... RETURNING：不预先加载行，也不在更新后再次查询
+_UPDATE = (
+    update(UserModel)
+    .where(UserModel.id == bindparam("user_id"))
+    .values(
+        username=bindparam("new_username"),
+        email=bindparam("new_email"),
+        full_name=bindparam("new_full_name"),
+        hashed_password=bindparam("new_hashed_password"),
+        user_type=bindparam("new_user_type"),
+        is_active=bindparam("new_is_active"),
+        updated_at=bindparam("new_updated_at"),
+        is_deleted=bindparam("new_is_deleted"),
+    )
+    .returning(UserModel)
+    .options(*_LOAD_OPTIONS)
+    .execution_options(populate_existing=True)
+)
+# 单条 UPDATE 完成软删除，不把行加载进会话
+_SOFT_DELETE = (
+    update(UserModel)
+    .where(UserModel.id == bindparam("user_id"), UserModel.is_deleted == false())
+    .values(is_deleted=True)
+)
+# 调用方只传入 ID 时，在同一条 UPDATE 中取回被删除的行，用于构造发布事件的领域实体
+_SOFT_DELETE_RETURNING = (
+    _SOFT_DELETE.returning(UserModel)
+    .options(*_LOAD_OPTIONS)
+    .execution_options(populate_existing=True)
+)
 
 
 class PostgreSQLUserRepositoryImpl(EventAwareRepository[User], UserRepository):
@@ -24,33 +105,47 @@ class PostgreSQLUserRepositoryImpl(EventAwareRepository[User], UserRepository):
 
     async def get_by_id(self, user_id: str) -> User | None:
         """根据ID获取用户"""
-        statement = select(UserModel).where(
-            UserModel.id == user_id,
-            UserModel.is_deleted.is_(False),
-        )
-        result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
-        return self.mapper.to_domain(model) if model else None
+        if not is_valid_id(self.session, user_id):
+            return None
+        return await self._get_one(f"id:{user_id}", _GET_BY_ID, {"value": user_id})
+
+    async def get_by_ids(self, ids: list[str]) -> dict[str, User]:
+        """根据ID批量获取用户：一次查询代替逐个 get_by_id"""
+        unique_ids = [user_id for user_id in dict.fromkeys(ids) if is_valid_id(self.session, user_id)]
+        if not unique_ids:
+            return {}
+        result = await self.session.execute(_GET_BY_IDS, {"ids": unique_ids})
+        users = await self.mapper.to_domain_list_async(list(result.all()))
+        return {user.id: user for user in users}
 
     async def get_by_username(self, username: str) -> User | None:
         """根据用户名获取用户"""
-        statement = select(UserModel).where(
-            UserModel.username == username,
-            UserModel.is_deleted.is_(False),
-        )
-        result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
-        return self.mapper.to_domain(model) if model else None
+        return await self._get_one(f"username:{username}", _GET_BY_USERNAME, {"value": username})
 
     async def get_by_email(self, email: str) -> User | None:
         """根据邮箱获取用户"""
-        statement = select(UserModel).where(
-            UserModel.email == email,
-            UserModel.is_deleted.is_(False),
-        )
-        result = await self.session.execute(statement)
+        return await self._get_one(f"email:{email}", _GET_BY_EMAIL, {"value": email})
+
+    async def _get_one(self, cache_key: str, statement: Select, params: dict) -> User | None:
+        """按唯一键查询单个用户，命中会话内缓存时不访问数据库"""
+        # 当前事务已有写入时既不读也不写缓存，避免回滚后仍返回未提交的数据
+        cacheable = not has_writes(self.session)
+        cache: dict[str, User] = self.session.info.setdefault(_USER_CACHE, {})
+        if cacheable:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                # 返回副本：调用方会修改实体并在其上记录领域事件
+                return cached.model_copy(deep=True)
+
+        result = await self.session.execute(statement, params)
         model = result.scalar_one_or_none()
-        return self.mapper.to_domain(model) if model else None
+        if model is None:
+            return None
+
+        user = self.mapper.to_domain(model)
+        if cacheable:
+            cache[cache_key] = user.model_copy(deep=True)
+        return user
 
     async def create(self, user: User) -> User:
         """创建用户"""
@@ -58,64 +153,70 @@ class PostgreSQLUserRepositoryImpl(EventAwareRepository[User], UserRepository):
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
+        self.session.info.pop(_USER_CACHE, None)
 
         # 发布聚合上的领域事件
-        await self._publish_events_from_entity(user)
+        self._publish_events_from_entity(user)
 
         # 转换为领域实体返回
         created_user = self.mapper.to_domain(model)
         return created_user
 
+    async def bulk_create(self, users: list[User]) -> int:
+        """批量创建用户（单条 INSERT 多行 VALUES，不经过工作单元）"""
+        if not users:
+            return 0
+
+        rows = [self.mapper.to_row(user) for user in users]
+        await self.session.execute(_INSERT_USER, rows)
+        self.session.info.pop(_USER_CACHE, None)
+
+        self._publish_events_from_entities(users)
+        return len(rows)
+
     async def update(self, user: User) -> User:
         """更新用户"""
-        statement = select(UserModel).where(UserModel.id == user.id)
-        result = await self.session.execute(statement)
-        existing_model = result.scalar_one_or_none()
-        if not existing_model:
+        params = {
+            "user_id": user.id,
+            "new_username": user.username,
+            "new_email": user.email,
+            "new_full_name": user.full_name,
+            "new_hashed_password": user.hashed_password,
+            "new_user_type": user.user_type,
+            "new_is_active": user.is_active,
+            "new_updated_at": user.updated_at,
+            "new_is_deleted": user.is_deleted,
+        }
+        result = await self.session.execute(_UPDATE, params)
+        updated_model = result.scalar_one_or_none()
+        if updated_model is None:
             raise ValueError(f"User with id {user.id} not found")
-
-        # 更新字段
-        existing_model.username = user.username
-        existing_model.email = user.email
-        existing_model.full_name = user.full_name
-        existing_model.hashed_password = user.hashed_password
-        existing_model.user_type = user.user_type
-        existing_model.is_active = user.is_active
-        existing_model.updated_at = user.updated_at
-        existing_model.is_deleted = user.is_deleted
-
-        self.session.add(existing_model)
-        await self.session.flush()
-        await self.session.refresh(existing_model)
+        self.session.info.pop(_USER_CACHE, None)
 
         # 发布聚合上的领域事件
-        await self._publish_events_from_entity(user)
+        self._publish_events_from_entity(user)
 
         # 转换为领域实体返回
-        updated_user = self.mapper.to_domain(existing_model)
-        return updated_user
+        return self.mapper.to_domain(updated_model)
 
     async def delete(self, user: User | str) -> bool:
         """删除用户（软删除）"""
         user_entity: User | None = user if isinstance(user, User) else None
         user_id = user.id if isinstance(user, User) else user
 
-        statement = select(UserModel).where(
-            UserModel.id == user_id,
-            UserModel.is_deleted.is_(False),
-        )
-        result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
-        if not model:
-            return False
-
-        model.is_deleted = True
-        self.session.add(model)
-        await self.session.flush()
-
         if user_entity is None:
+            result = await self.session.execute(_SOFT_DELETE_RETURNING, {"user_id": user_id})
+            model = result.scalar_one_or_none()
+            if model is None:
+                return False
             user_entity = self.mapper.to_domain(model)
-        await self._publish_events_from_entity(user_entity)
+        else:
+            result = await self.session.execute(_SOFT_DELETE, {"user_id": user_id})
+            if result.rowcount == 0:
+                return False
+
+        self.session.info.pop(_USER_CACHE, None)
+        self._publish_events_from_entity(user_entity)
 
         return True
 
@@ -127,29 +228,42 @@ class PostgreSQLUserRepositoryImpl(EventAwareRepository[User], UserRepository):
         user_type: str | None = None,
         is_active: bool | None = None,
         include_deleted: bool = False,
-    ) -> tuple[list[User], int]:
+        cursor: str | None = None,
+        with_total: bool = False,
+    ) -> Page[User]:
         """获取用户列表"""
-        statement = select(
-            UserModel,
-            func.count(UserModel.id).over().label("total_count")
-        )
+        position = decode_cursor(self.session, cursor)
 
         conditions = self._generate_query_conditions(search, user_type, is_active, include_deleted)
+        # 不带游标时用窗口函数在同一条查询中取得总数；keyset 条件会改变窗口的统计范围，带游标时单独 COUNT
+        window_count = with_total and position is None
+        # 只查询映射列：返回 Row 而不是模型实例，跳过逐行构建 InstanceState 和身份映射
+        columns = [*_USER_COLUMNS]
+        if window_count:
+            columns.append(func.count(UserModel.id).over().label("total_count"))
+        statement = select(*columns)
         if conditions:
             statement = statement.where(*conditions)
 
-        statement = statement.offset((page - 1) * page_size).limit(page_size).order_by(UserModel.created_at.desc())
+        # 分页查询
+        statement = paginate(statement, UserModel, page, page_size, position)
 
-        result = await self.session.execute(statement)
+        total_count = None
+        count_statement = select(func.count(UserModel.id)).where(*conditions)
+        if with_total and not window_count:
+            result, total_count = await execute_with_count(self.session, statement, count_statement)
+        else:
+            result = await self.session.execute(statement)
         rows = result.all()
 
-        if not rows:
-            return [], 0
-        total_count = rows[0].total_count
-        models = [row.UserModel for row in rows]
-        users = self.mapper.to_domain_list(models)
-
-        return users, total_count
+        if window_count:
+            # OFFSET 越过末尾时没有行携带窗口计数，改为单独 COUNT
+            if rows or page == 1:
+                total_count = rows[0].total_count if rows else 0
+            else:
+                total_count = (await self.session.execute(count_statement)).scalar_one()
+        users = await self.mapper.to_domain_list_async(list(rows[:page_size]))
+        return Page(items=users, has_more=len(rows) > page_size, total=total_count)
 
     def _generate_query_conditions(
         self,
@@ -161,39 +275,40 @@ class PostgreSQLUserRepositoryImpl(EventAwareRepository[User], UserRepository):
         """生成查询条件"""
         conditions = []
         if search:
-            conditions.append(UserModel.username.ilike(f"%{search}%"))
+            # 每列都有三元组 GIN 索引，OR 条件可以走 BitmapOr 合并三个索引扫描
+            pattern = f"%{search}%"
+            conditions.append(
+                or_(
+                    UserModel.username.ilike(pattern),
+                    UserModel.email.ilike(pattern),
+                    UserModel.full_name.ilike(pattern),
+                )
+            )
         if user_type:
             conditions.append(UserModel.user_type == UserTypeEnum(user_type))
         if is_active is not None:
             conditions.append(UserModel.is_active == is_active)
         if not include_deleted:
-            conditions.append(UserModel.is_deleted.is_(False))
+            conditions.append(UserModel.is_deleted == false())
         return conditions
 
     async def exists_by_username(
         self, username: str, exclude_id: str | None = None
     ) -> bool:
         """检查用户名是否存在"""
-        statement = select(UserModel).where(
-            UserModel.username == username,
-            UserModel.is_deleted.is_(False),
-        )
+        conditions = [UserModel.username == username, UserModel.is_deleted == false()]
         if exclude_id:
-            statement = statement.where(UserModel.id != exclude_id)
-
-        result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
-        return model is not None
+            conditions.append(UserModel.id != exclude_id)
+        return await self._exists(conditions)
 
     async def exists_by_email(self, email: str, exclude_id: str | None = None) -> bool:
         """检查邮箱是否存在"""
-        statement = select(UserModel).where(
-            UserModel.email == email,
-            UserModel.is_deleted.is_(False),
-        )
+        conditions = [UserModel.email == email, UserModel.is_deleted == false()]
         if exclude_id:
-            statement = statement.where(UserModel.id != exclude_id)
+            conditions.append(UserModel.id != exclude_id)
+        return await self._exists(conditions)
 
-        result = await self.session.execute(statement)
-        model = result.scalar_one_or_none()
-        return model is not None
+    async def _exists(self, conditions: list[ColumnElement[bool]]) -> bool:
+        """EXISTS 只返回一个布尔值，不取回也不构建整行用户模型"""
+        result = await self.session.execute(select(exists().where(*conditions)))
+        return bool(result.scalar())
@@ -2,6 +2,14 @@
 
 from passlib.context import CryptContext
 
+from infrastructure.config import settings
+
+# Default context shared by every hasher that does not customise its schemes,
+# so CryptContext setup and bcrypt backend loading happen once per process.
+_DEFAULT_CONTEXT = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
 
 class BcryptPasswordHasher:
     """Bcrypt implementation of PasswordHasher protocol.
@@ -21,9 +29,10 @@ class BcryptPasswordHasher:
             schemes: List of hashing schemes to use. Defaults to ["bcrypt"].
             deprecated: Deprecated scheme handling. Defaults to "auto".
         """
-        if schemes is None:
-            schemes = ["bcrypt"]
-        self._context = CryptContext(schemes=schemes, deprecated=deprecated)
+        if schemes is None and deprecated == "auto":
+            self._context = _DEFAULT_CONTEXT
+        else:
+            self._context = CryptContext(schemes=schemes or ["bcrypt"], deprecated=deprecated)
 
     def hash(self, password: str) -> str:
         """Hash a plain text password using bcrypt.
@@ -1,6 +1,6 @@
 from typing import Any, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar('T')
 
@@ -16,7 +16,8 @@ class ApiResponse[T](BaseModel):
 
     @classmethod
     def success(cls, data: T = None, message: str = "Operation successful", code: int = 200, meta: dict = None) -> "ApiResponse[T]":
-        return cls(
+        # 未参数化调用时 T 不做任何校验，直接构造跳过一次无意义的校验
+        return cls.model_construct(
             code=code,
             message=message,
             data=data,
@@ -38,26 +39,45 @@ class ApiResponse[T](BaseModel):
             }
         if isinstance(message, Exception):
             message = str(message)
-        return cls(
+        return cls.model_construct(
             code=code,
             message=message,
             data=data
         )
+class PageMeta(BaseModel):
+    """分页元数据"""
+
+    total: int | None = 0
+    page: int = 1
+    page_size: int = 10
+    has_more: bool | None = None
+    next_cursor: str | None = None
+
+
 class PaginatedResponse(ApiResponse[list[T]]):
     data: list[T] | None = None
-    meta: dict = {"total": 0, "page": 1, "page_size": 10}
+    meta: PageMeta = Field(default_factory=PageMeta)
 
     @classmethod
-    def create(cls, items: list[T], total: int, page: int = 1, page_size: int = 10) -> "PaginatedResponse[T]":
+    def create(
+        cls,
+        items: list[T],
+        total: int | None,
+        page: int = 1,
+        page_size: int = 10,
+        next_cursor: str | None = None,
+        has_more: bool | None = None,
+    ) -> "PaginatedResponse[T]":
         """创建分页响应"""
-        return cls(
-            data=items,
-            meta={
-                "total": total,
-                "page": page,
-                "page_size": page_size
-            }
+        meta = PageMeta(
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
+        # 条目已是构建好的响应模型，直接构造，不再逐条重新校验
+        return cls.model_construct(data=items, meta=meta)
 
 class MessageResponse(BaseModel):
     detail: str
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 from domain.users.exceptions import (
     DuplicateEmailError,
@@ -71,19 +72,7 @@ class ExceptionMapping:
         Returns:
             ErrorCode: 对应的错误码枚举
         """
-        exception_type = type(exception)
-
-        # 直接查找异常类型
-        if exception_type in cls.EXCEPTION_MAP:
-            return cls.EXCEPTION_MAP[exception_type]
-
-        # 查找父类异常类型
-        for exc_type, error_code in cls.EXCEPTION_MAP.items():
-            if isinstance(exception, exc_type):
-                return error_code
-
-        # 如果没有找到，返回内部错误
-        return ErrorCode.INTERNAL_ERROR
+        return _resolve_error_code(type(exception))
 
     @classmethod
     def get_error_info(cls, exception: Exception) -> tuple[int, str]:
@@ -114,6 +103,7 @@ class ExceptionMapping:
             error_code: 对应的错误码
         """
         cls.EXCEPTION_MAP[exception_type] = error_code
+        _resolve_error_code.cache_clear()
 
     @classmethod
     def register_custom_exception(cls, exception_type: type[Exception], code: int, message: str):
@@ -131,6 +121,19 @@ class ExceptionMapping:
         custom_error.message = message
 
         cls.EXCEPTION_MAP[exception_type] = custom_error
+        _resolve_error_code.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _resolve_error_code(exception_type: type[BaseException]) -> ErrorCode:
+    """沿 MRO 由具体到一般查找第一个已映射的异常类型，结果按异常类型缓存（注册新映射时清空）"""
+    for base in exception_type.__mro__:
+        error_code = ExceptionMapping.EXCEPTION_MAP.get(base)
+        if error_code is not None:
+            return error_code
+
+    # 如果没有找到，返回内部错误
+    return ErrorCode.INTERNAL_ERROR
 
 
 # 便捷的异常映射函数
@@ -104,12 +104,27 @@ async def list_breeds(
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(10, ge=1, le=100, description="每页数量"),
     include_deleted: bool = Query(False, description="是否包含已删除"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    with_total: bool = Query(True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）"),
     breed_query_service: BreedQueryService = Depends(get_breed_query_service),
 ) -> PaginatedResponse[BreedResponse]:
-    query = ListBreedsQuery(page=page, page_size=page_size, include_deleted=include_deleted)
+    query = ListBreedsQuery(
+        page=page,
+        page_size=page_size,
+        include_deleted=include_deleted,
+        cursor=cursor,
+        with_total=with_total,
+    )
     result = await breed_query_service.list_breeds(query)
     items = [BreedResponse.model_validate(b.model_dump()) for b in result.breeds]
-    return PaginatedResponse.create(items=items, total=result.total, page=page, page_size=page_size)
+    return PaginatedResponse.create(
+        items=items,
+        total=result.total,
+        page=page,
+        page_size=page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+    )
 
 
 @router.get(
@@ -124,6 +139,8 @@ async def search_breeds(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     include_deleted: bool = Query(False),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    with_total: bool = Query(True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）"),
     breed_query_service: BreedQueryService = Depends(get_breed_query_service),
 ) -> PaginatedResponse[BreedResponse]:
     query = SearchBreedsQuery(
@@ -132,9 +149,18 @@ async def search_breeds(
         page=page,
         page_size=page_size,
         include_deleted=include_deleted,
+        cursor=cursor,
+        with_total=with_total,
     )
     result = await breed_query_service.search_breeds(query)
     items = [BreedResponse.model_validate(b.model_dump()) for b in result.breeds]
-    return PaginatedResponse.create(items=items, total=result.total, page=page, page_size=page_size)
+    return PaginatedResponse.create(
+        items=items,
+        total=result.total,
+        page=page,
+        page_size=page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
+    )
 
 
@@ -83,6 +83,8 @@ async def search_pets(
     morphology_id: str | None = Query(None, description="按品系ID过滤"),
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(10, ge=1, le=100, description="每页数量"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    with_total: bool = Query(True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）"),
     query_service: PetQueryService = Depends(get_pet_query_service),
 ) -> PaginatedResponse[PetSummaryResponse]:
     """搜索宠物"""
@@ -93,6 +95,8 @@ async def search_pets(
         morphology_id=morphology_id,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        with_total=with_total,
     )
     result = await query_service.search_pets(query)
     items = [PetSummaryResponse.model_validate(pet.model_dump()) for pet in result.pets]
@@ -101,6 +105,8 @@ async def search_pets(
         total=result.total_count,
         page=result.page,
         page_size=result.page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
 
 
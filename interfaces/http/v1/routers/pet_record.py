@@ -425,6 +425,8 @@ async def list_pet_records(
     event_type: str | None = None,
     creator_id: str | None = None,
     include_deleted: bool = False,
+    cursor: str | None = None,
+    with_total: bool = True,
     query_service: PetRecordQueryService = Depends(get_pet_record_query_service),
 ) -> PaginatedResponse[PetRecordSummaryResponse]:
     """获取宠物记录列表"""
@@ -436,6 +438,8 @@ async def list_pet_records(
         event_type=event_type,
         creator_id=creator_id,
         include_deleted=include_deleted,
+        cursor=cursor,
+        with_total=with_total,
     )
     result = await query_service.list_pet_records(query)
 
@@ -450,6 +454,8 @@ async def list_pet_records(
         total=result.total,
         page=result.page,
         page_size=result.page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
 
 
@@ -469,10 +475,13 @@ async def search_pet_records(
         search_term=request.search_term,
         pet_id=request.pet_id,
         event_type=request.event_type,
+        event_types=request.event_types,
         creator_id=request.creator_id,
         page=request.page,
         page_size=request.page_size,
         include_deleted=request.include_deleted,
+        cursor=request.cursor,
+        with_total=request.with_total,
     )
     result = await query_service.search_pet_records(query)
 
@@ -487,6 +496,8 @@ async def search_pet_records(
         total=result.total,
         page=result.page,
         page_size=result.page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
 
 
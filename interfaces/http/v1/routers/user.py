@@ -187,6 +187,8 @@ async def list_all(
     user_type: str = Query(None, description="用户类型过滤"),
     is_active: bool = Query(None, description="激活状态过滤"),
     include_deleted: bool = Query(False, description="是否包含已删除用户"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    with_total: bool = Query(True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）"),
     user_query_service: UserQueryService = Depends(get_user_query_service),
 ) -> PaginatedResponse[UserResponse]:
     """获取用户列表"""
@@ -208,6 +210,8 @@ async def list_all(
         user_type=user_type_enum,
         is_active=is_active,
         include_deleted=include_deleted,
+        cursor=cursor,
+        with_total=with_total,
     )
 
     result = await user_query_service.list_users(query)
@@ -216,7 +220,12 @@ async def list_all(
     user_responses = [UserResponse.model_validate(user.model_dump()) for user in result.users]
 
     return PaginatedResponse.create(
-        items=user_responses, total=result.total, page=page, page_size=page_size
+        items=user_responses,
+        total=result.total,
+        page=page,
+        page_size=page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
 
 
@@ -256,13 +265,20 @@ async def get_user_pets(
     page: int = Query(1, ge=1, description="页码"),
     page_size: int = Query(10, ge=1, le=100, description="每页数量"),
     search: str = Query(None, description="搜索关键字（宠物名）"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    with_total: bool = Query(True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）"),
     pet_query_service: PetQueryService = Depends(get_pet_query_service),
 ) -> PaginatedResponse[PetSummaryResponse]:
     """获取用户宠物列表"""
     from application.pets.queries import SearchPetsQuery
 
     query = SearchPetsQuery(
-        owner_id=user_id, search_term=search, page=page, page_size=page_size
+        owner_id=user_id,
+        search_term=search,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        with_total=with_total,
     )
     result = await pet_query_service.search_pets(query)
 
@@ -272,4 +288,6 @@ async def get_user_pets(
         total=result.total_count,
         page=page,
         page_size=page_size,
+        next_cursor=result.next_cursor,
+        has_more=result.has_more,
     )
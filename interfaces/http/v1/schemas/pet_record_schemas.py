@@ -46,10 +46,13 @@ class PetRecordSearchRequest(BaseModel):
     search_term: str | None = Field(None, description="搜索关键词")
     pet_id: str | None = Field(None, description="宠物ID")
     event_type: PetEventTypeEnum | None = Field(None, description="事件类型")
+    event_types: list[PetEventTypeEnum] | None = Field(None, description="事件类型列表（匹配任意一个）")
     creator_id: str | None = Field(None, description="创建者ID")
     page: int = Field(default=1, description="页码，从1开始")
     page_size: int = Field(default=10, description="每页大小")
     include_deleted: bool = Field(default=False, description="是否包含已删除的记录")
+    cursor: str | None = Field(None, description="分页游标（上一页返回的 next_cursor）")
+    with_total: bool = Field(default=True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）")
 
 
 class PetRecordListRequest(BaseModel):
@@ -61,6 +64,8 @@ class PetRecordListRequest(BaseModel):
     event_type: PetEventTypeEnum | None = Field(None, description="事件类型")
     creator_id: str | None = Field(None, description="创建者ID")
     include_deleted: bool = Field(default=False, description="是否包含已删除的记录")
+    cursor: str | None = Field(None, description="分页游标（上一页返回的 next_cursor）")
+    with_total: bool = Field(default=True, description="是否返回总数（默认返回；传 false 可省去一次 COUNT 查询）")
 
 
 # 特定事件类型的请求模型
@@ -8,6 +8,7 @@ import pytest
 from pydantic import Field
 
 from domain.common.events import DomainEvent, EventBus
+from domain.common.pagination import Page
 from domain.pets.entities import Pet
 from domain.pets.value_objects import GenderEnum
 from domain.users.entities import User
@@ -101,7 +102,7 @@ def mock_user_repository() -> MagicMock:
     mock.create = AsyncMock()
     mock.update = AsyncMock()
     mock.delete = AsyncMock(return_value=True)
-    mock.list_all = AsyncMock(return_value=([], 0))
+    mock.list_all = AsyncMock(return_value=Page(items=[], has_more=False, total=0))
     return mock
 
 
@@ -223,6 +223,25 @@ class TestEventPublisher:
         # Verify events were cleared from aggregate
         assert not aggregate.has_domain_events()
 
+    @pytest.mark.anyio
+    async def test_publish_events_from_aggregates_batches(self):
+        """Test that events from several aggregates are published in one call."""
+        mock_bus = AsyncMock(spec=EventBus)
+        publisher = EventPublisher(mock_bus)
+
+        first = TestAggregate(name="First")
+        first.do_something()
+        second = TestAggregate(name="Second")
+        second.do_something()
+        second.do_something()
+
+        await publisher.publish_events_from_aggregates([first, second])
+
+        mock_bus.publish_all.assert_called_once()
+        assert len(mock_bus.publish_all.call_args.args[0]) == 3
+        assert not first.has_domain_events()
+        assert not second.has_domain_events()
+
     @pytest.mark.anyio
     async def test_publish_event(self, publisher, event_bus):
         """Test publishing a single event directly."""
@@ -1,8 +1,9 @@
 """Integration test configuration and fixtures."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
@@ -18,6 +19,10 @@ from infrastructure.persistence.postgres.mappers.morphology_mapper import (
 )
 from infrastructure.persistence.postgres.mappers.pet_mapper import PetMapper
 from infrastructure.persistence.postgres.mappers.user_mapper import UserMapper
+from infrastructure.persistence.postgres.repositories.count_cache import count_cache
+from infrastructure.persistence.postgres.repositories.pet_repository_impl import (
+    pet_name_exists_cache,
+)
 
 # Use SQLite for integration tests (in-memory)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -60,6 +65,29 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def clear_query_caches() -> Generator[None, None, None]:
+    """Keep cached totals and lookups from leaking between test databases."""
+    count_cache.clear()
+    pet_name_exists_cache.clear()
+    yield
+    count_cache.clear()
+    pet_name_exists_cache.clear()
+
+
+@pytest.fixture
+def executed_statements(async_engine) -> Generator[list[str], None, None]:
+    """Record every SQL statement sent to the test database."""
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def event_publisher() -> EventPublisher:
     """Create an event publisher for testing."""
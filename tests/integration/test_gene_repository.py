@@ -0,0 +1,133 @@
+"""Integration tests for Gene repository."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.common.entities import I18n
+from domain.pets.entities import Gene
+from domain.pets.exceptions import GeneNotFoundError
+from domain.pets.value_objects import GeneCategoryEnum
+from infrastructure.persistence.postgres.mappers.gene_mapper import GeneMapper
+from infrastructure.persistence.postgres.models.gene import GeneModel
+from infrastructure.persistence.postgres.models.indexes import SEARCH_VECTOR_DDL
+from infrastructure.persistence.postgres.repositories.gene_repository_impl import (
+    PostgreSQLGeneRepositoryImpl,
+)
+
+
+class TestGeneRepositoryIntegration:
+    """Integration tests for PostgreSQLGeneRepositoryImpl."""
+
+    @pytest.fixture
+    def repository(
+        self, db_session: AsyncSession, gene_mapper: GeneMapper
+    ) -> PostgreSQLGeneRepositoryImpl:
+        """Create a gene repository instance."""
+        return PostgreSQLGeneRepositoryImpl(db_session, gene_mapper)
+
+    @pytest.fixture
+    def sample_gene(self) -> Gene:
+        """Create a sample gene for testing."""
+        return Gene(
+            id="gene-123",
+            name=I18n(en_US="Albino", zh_CN="白化"),
+            notation="a",
+            category=GeneCategoryEnum.COLOR,
+        )
+
+    @pytest.mark.anyio
+    async def test_get_by_id_excludes_deleted(self, repository, sample_gene):
+        """Test that get_by_id finds active genes and skips soft-deleted ones."""
+        await repository.create(sample_gene)
+
+        found = await repository.get_by_id("gene-123")
+        assert found is not None
+        assert found.notation == "a"
+        assert found.category == GeneCategoryEnum.COLOR
+
+        assert await repository.delete("gene-123") is True
+        assert await repository.get_by_id("gene-123") is None
+
+    @pytest.mark.anyio
+    async def test_update_gene(self, repository, sample_gene):
+        """Test that update writes the new values and returns the stored row."""
+        created = await repository.create(sample_gene)
+        created.update_details(name=I18n(en_US="Albino T+", zh_CN="白化"), notation="a2")
+
+        updated = await repository.update(created)
+
+        assert updated.name.get_text("en_US") == "Albino T+"
+        assert updated.notation == "a2"
+        assert (await repository.get_by_id("gene-123")).notation == "a2"
+
+    @pytest.mark.anyio
+    async def test_update_deleted_gene_raises(self, repository, sample_gene):
+        """Test that updating a soft-deleted gene raises GeneNotFoundError."""
+        created = await repository.create(sample_gene)
+        await repository.delete(created)
+
+        with pytest.raises(GeneNotFoundError):
+            await repository.update(created)
+
+    @pytest.mark.anyio
+    async def test_list_all_filters_deleted(self, repository, sample_gene):
+        """Test that list_all only returns active genes by default."""
+        await repository.create(sample_gene)
+        await repository.create(Gene(id="gene-456", name=I18n(en_US="Pied"), notation="p"))
+        await repository.delete("gene-456")
+
+        page = await repository.list_all(with_total=True)
+        assert page.total == 1
+        assert [gene.id for gene in page.items] == ["gene-123"]
+
+        page = await repository.list_all(include_deleted=True, with_total=True)
+        assert page.total == 2
+        assert await repository.count() == 1
+
+    @pytest.mark.anyio
+    async def test_list_all_with_cursor_walks_every_page(self, repository):
+        """Test that keyset pagination returns each gene exactly once."""
+        for index in range(5):
+            await repository.create(Gene(id=f"gene-{index}", name=I18n(en_US=f"Gene {index}")))
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repository.list_all(page_size=2, cursor=cursor)
+            assert page.total is None
+            seen.extend(gene.id for gene in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert not page.has_more
+        assert sorted(seen) == [f"gene-{index}" for index in range(5)]
+
+    @pytest.mark.anyio
+    async def test_get_by_category_streams_active_genes(self, repository, sample_gene):
+        """Test that category lookups stream only active genes of that category."""
+        await repository.create(sample_gene)
+        await repository.create(
+            Gene(id="gene-456", name=I18n(en_US="Pied"), category=GeneCategoryEnum.COLOR)
+        )
+        await repository.create(
+            Gene(id="gene-789", name=I18n(en_US="Stripe"), category=GeneCategoryEnum.PATTERN)
+        )
+        await repository.delete("gene-456")
+
+        genes = await repository.get_by_category(GeneCategoryEnum.COLOR)
+        assert [gene.id for gene in genes] == ["gene-123"]
+
+        streamed = [gene.id async for gene in repository.iter_by_category(GeneCategoryEnum.PATTERN)]
+        assert streamed == ["gene-789"]
+
+    def test_search_vector_ddl_upgrades_existing_tables(self):
+        """Test that the tsvector column and index DDL is idempotent for databases created earlier."""
+        statements = GeneModel.__table__.info[SEARCH_VECTOR_DDL]
+        assert statements == [
+            "ALTER TABLE genes ADD COLUMN IF NOT EXISTS tsv_en_us tsvector GENERATED ALWAYS AS "
+            "(to_tsvector('english', coalesce(name ->> 'en_US', '') || ' ' || "
+            "coalesce(alias ->> 'en_US', '') || ' ' || coalesce(description ->> 'en_US', '') "
+            "|| ' ' || coalesce(notation, ''))) STORED",
+            "CREATE INDEX IF NOT EXISTS idx_genes_tsv_en_us ON genes USING gin (tsv_en_us)",
+        ]
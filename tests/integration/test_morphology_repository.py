@@ -0,0 +1,167 @@
+"""Integration tests for Morphology repository."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.common.entities import I18n
+from domain.pets.entities import Morphology
+from domain.pets.exceptions import MorphologyNotFoundError
+from infrastructure.persistence.postgres.mappers.morphology_mapper import (
+    MorphologyMapper,
+)
+from infrastructure.persistence.postgres.models.gene import GeneModel
+from infrastructure.persistence.postgres.models.morph_gene_mapping import (
+    MorphGeneMappingModel,
+)
+from infrastructure.persistence.postgres.models.morphology import MorphologyModel
+from infrastructure.persistence.postgres.repositories.morphology_repository_impl import (
+    PostgreSQLMorphologyRepositoryImpl,
+)
+
+
+class TestMorphologyRepositoryIntegration:
+    """Integration tests for PostgreSQLMorphologyRepositoryImpl."""
+
+    @pytest.fixture
+    def repository(
+        self, db_session: AsyncSession, morphology_mapper: MorphologyMapper
+    ) -> PostgreSQLMorphologyRepositoryImpl:
+        """Create a morphology repository instance."""
+        return PostgreSQLMorphologyRepositoryImpl(db_session, morphology_mapper)
+
+    @pytest.fixture
+    async def stored_morphologies(self, db_session: AsyncSession) -> None:
+        """Store one active and one soft-deleted morphology."""
+        db_session.add(MorphologyModel(id="morph-1", name={"en_US": "Tangerine"}))
+        db_session.add(
+            MorphologyModel(id="morph-2", name={"en_US": "Hypo"}, is_deleted=True)
+        )
+        await db_session.flush()
+
+    @pytest.mark.anyio
+    async def test_get_by_id_excludes_deleted(self, repository, stored_morphologies):
+        """Test that get_by_id finds active morphologies and skips soft-deleted ones."""
+        found = await repository.get_by_id("morph-1")
+        assert found is not None
+        assert found.name.get_text("en_US") == "Tangerine"
+        assert found.gene_mapping_ids == []
+
+        assert await repository.get_by_id("morph-2") is None
+
+    @pytest.mark.anyio
+    async def test_list_all_filters_deleted(self, repository, stored_morphologies):
+        """Test that list_all only returns active morphologies by default."""
+        page = await repository.list_all(with_total=True)
+        assert page.total == 1
+        assert [morphology.id for morphology in page.items] == ["morph-1"]
+
+        page = await repository.list_all(include_deleted=True, with_total=True)
+        assert page.total == 2
+
+    @pytest.mark.anyio
+    async def test_finders_use_fixed_number_of_queries(
+        self, repository, db_session, stored_morphologies, executed_statements
+    ):
+        """Test that finders load gene mapping ids in the same statement as the morphologies."""
+        db_session.add(GeneModel(id="gene-a", name={"en_US": "gene-a"}))
+        db_session.add(
+            MorphGeneMappingModel(id="map-1", morphology_id="morph-1", gene_id="gene-a")
+        )
+        db_session.add(
+            MorphGeneMappingModel(
+                id="map-2", morphology_id="morph-2", gene_id="gene-a", is_deleted=True
+            )
+        )
+        await db_session.flush()
+        db_session.expunge_all()
+
+        executed_statements.clear()
+        await repository.get_by_id("morph-1")
+        # Gene mappings are joined into the morphology query
+        assert len(executed_statements) == 1
+
+        executed_statements.clear()
+        page = await repository.list_all(include_deleted=True, with_total=True)
+        assert len(executed_statements) == 1
+        assert page.total == 2
+        assert {m.id: m.gene_mapping_ids for m in page.items} == {
+            "morph-1": ["map-1"],
+            "morph-2": [],
+        }
+
+    @pytest.mark.anyio
+    async def test_list_all_reuses_cached_total(
+        self, repository, db_session, stored_morphologies, executed_statements
+    ):
+        """Test that committed totals are reused until a write invalidates them."""
+        await db_session.commit()
+        first = await repository.list_all(with_total=True)
+        assert first.total == 1
+
+        executed_statements.clear()
+        second = await repository.list_all(with_total=True)
+        assert second.total == 1
+        assert len(executed_statements) == 1
+        assert "count(" not in executed_statements[0].lower()
+
+        await repository.create(Morphology(id="morph-3", name=I18n(en_US="Albino")))
+        await db_session.commit()
+        assert (await repository.list_all(with_total=True)).total == 2
+
+    @pytest.mark.anyio
+    async def test_page_past_the_end_reports_the_real_total(self, repository, db_session):
+        """Test that an empty OFFSET page still reports the total instead of 0."""
+        for index in range(5):
+            db_session.add(
+                MorphologyModel(id=f"morph-{index}", name={"en_US": f"Tangerine {index}"})
+            )
+        await db_session.flush()
+
+        page = await repository.list_all(page=4, page_size=2, with_total=True)
+        assert page.items == []
+        assert page.total == 5
+
+    @pytest.mark.anyio
+    async def test_create_and_update_morphology(self, repository):
+        """Test that create and update return the stored values without a reload."""
+        created = await repository.create(
+            Morphology(id="morph-3", name=I18n(en_US="Albino"))
+        )
+        assert created.created_at is not None
+        assert created.gene_mapping_ids == []
+
+        created.update_name(I18n(en_US="Albino T+"))
+        updated = await repository.update(created)
+        assert updated.name.get_text("en_US") == "Albino T+"
+
+        await repository.delete("morph-3")
+        with pytest.raises(MorphologyNotFoundError):
+            await repository.update(created)
+
+    @pytest.mark.anyio
+    async def test_get_by_gene_combination_requires_every_gene(
+        self, repository, db_session, stored_morphologies
+    ):
+        """Test that only morphologies carrying all requested genes are returned."""
+        for gene_id in ("gene-a", "gene-b"):
+            db_session.add(GeneModel(id=gene_id, name={"en_US": gene_id}))
+        db_session.add(
+            MorphGeneMappingModel(id="map-1", morphology_id="morph-1", gene_id="gene-a")
+        )
+        db_session.add(
+            MorphGeneMappingModel(
+                id="map-2", morphology_id="morph-1", gene_id="gene-b", is_required=False
+            )
+        )
+        await db_session.flush()
+
+        found = await repository.get_by_gene_combination(["gene-a", "gene-b", "gene-a"])
+        assert [morphology.id for morphology in found] == ["morph-1"]
+        assert sorted(found[0].gene_mapping_ids) == ["map-1", "map-2"]
+
+        assert [m.id for m in await repository.get_by_required_genes(["gene-a"])] == ["morph-1"]
+        assert await repository.get_by_required_genes(["gene-a", "gene-b"]) == []
+        assert await repository.get_by_gene_combination([]) == []
+
+        containing = await repository.get_morphologies_containing_gene("gene-b")
+        assert [morphology.id for morphology in containing] == ["morph-1"]
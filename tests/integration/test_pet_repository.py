@@ -0,0 +1,198 @@
+"""Integration tests for Pet repository."""
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.common.event_publisher import EventPublisher
+from domain.pets.entities import Pet
+from domain.pets.exceptions import PetNotFoundError, PetRepositoryError
+from infrastructure.persistence.postgres.mappers.pet_mapper import PetMapper
+from infrastructure.persistence.postgres.models.indexes import SEARCH_VECTOR_DDL
+from infrastructure.persistence.postgres.models.pet import PetModel
+from infrastructure.persistence.postgres.repositories import pet_repository_impl
+from infrastructure.persistence.postgres.repositories.pet_repository_impl import (
+    PostgreSQLPetRepositoryImpl,
+)
+from infrastructure.persistence.postgres.repositories.pet_search_read_repository import (
+    PostgreSQLPetSearchReadRepository,
+)
+
+
+class TestPetRepositoryIntegration:
+    """Integration tests for PostgreSQLPetRepositoryImpl."""
+
+    @pytest.fixture
+    def repository(
+        self, db_session: AsyncSession, pet_mapper: PetMapper, event_publisher: EventPublisher
+    ) -> PostgreSQLPetRepositoryImpl:
+        """Create a pet repository instance."""
+        return PostgreSQLPetRepositoryImpl(db_session, pet_mapper, event_publisher)
+
+    @pytest.mark.anyio
+    async def test_create_pet(self, repository, sample_pet, executed_statements):
+        """Test that create returns the stored pet from a single INSERT ... RETURNING."""
+        created = await repository.create(sample_pet)
+
+        assert created.id == "pet-123"
+        assert created.created_at is not None
+        assert created.extra_gene_list == []
+        assert len(executed_statements) == 1
+
+    @pytest.mark.anyio
+    async def test_bulk_create_pets(self, repository, executed_statements):
+        """Test that bulk_create writes every pet with a single executemany INSERT."""
+        pets = [
+            Pet(id=f"pet-{i}", name=f"Pet {i}", owner_id="user-123", breed_id="breed-123")
+            for i in range(5)
+        ]
+
+        assert await repository.bulk_create(pets) == 5
+        assert len(executed_statements) == 1
+
+        stored = await repository.get_by_id("pet-3")
+        assert stored.name == "Pet 3"
+        assert stored.gender == pets[3].gender
+        assert stored.created_at is not None
+
+    @pytest.mark.anyio
+    async def test_bulk_copy_pets(self, repository, db_session, monkeypatch):
+        """Test that bulk_copy hands mapper rows to COPY and invalidates the name cache."""
+        copied_tables = []
+
+        async def copy_via_insert(session, table, rows):
+            # SQLite has no COPY: write the same rows with an INSERT so they can be read back
+            copied_tables.append(table.name)
+            await session.execute(insert(table), rows)
+            return len(rows)
+
+        monkeypatch.setattr(pet_repository_impl, "copy_rows", copy_via_insert)
+        assert await repository.exists_by_name("Pet 2") is False
+
+        pets = [
+            Pet(id=f"pet-{i}", name=f"Pet {i}", owner_id="user-123", breed_id="breed-123")
+            for i in range(3)
+        ]
+        assert await repository.bulk_copy(pets) == 3
+        assert await repository.bulk_copy([]) == 0
+        assert copied_tables == ["pets"]
+
+        stored = await repository.get_by_id("pet-2")
+        assert stored.gender == pets[2].gender
+        assert stored.created_at is not None
+        await db_session.commit()
+        assert await repository.exists_by_name("Pet 2") is True
+
+        async def failing_copy(*_args):
+            raise RuntimeError("copy failed")
+
+        monkeypatch.setattr(pet_repository_impl, "copy_rows", failing_copy)
+        with pytest.raises(PetRepositoryError):
+            await repository.bulk_copy(pets)
+
+    @pytest.mark.anyio
+    async def test_update_pet(self, repository, sample_pet, executed_statements):
+        """Test that update writes the new values with a single UPDATE ... RETURNING."""
+        created = await repository.create(sample_pet)
+        created.name = "Fluffy II"
+
+        executed_statements.clear()
+        updated = await repository.update(created)
+
+        assert updated.name == "Fluffy II"
+        assert executed_statements[0].lstrip().upper().startswith("UPDATE")
+        assert not any(s.lstrip().upper().startswith("SELECT pets.") for s in executed_statements)
+        assert (await repository.get_by_id("pet-123")).name == "Fluffy II"
+
+    @pytest.mark.anyio
+    async def test_delete_pet(self, repository, sample_pet):
+        """Test that soft-deleted pets can no longer be read, updated or deleted."""
+        created = await repository.create(sample_pet)
+        await repository.create(
+            Pet(id="pet-456", name="Sunny", owner_id="user-123", breed_id="breed-123")
+        )
+
+        assert await repository.delete("pet-123") is True
+        assert await repository.delete("pet-123") is False
+        assert await repository.get_by_id("pet-123") is None
+        with pytest.raises(PetNotFoundError):
+            await repository.update(created)
+
+        assert await repository.delete(await repository.get_by_id("pet-456")) is True
+        assert await repository.get_by_id("pet-456") is None
+
+    @pytest.mark.anyio
+    async def test_exists_by_name_reuses_cached_result(
+        self, repository, db_session, sample_pet, executed_statements
+    ):
+        """Test that committed name checks are reused until a pet write invalidates them."""
+        created = await repository.create(sample_pet)
+        await db_session.commit()
+
+        assert await repository.exists_by_name("Fluffy") is True
+        assert await repository.exists_by_name("Fluffy", exclude_id="pet-123") is False
+
+        executed_statements.clear()
+        assert await repository.exists_by_name("Fluffy") is True
+        assert executed_statements == []
+
+        created.name = "Sunny"
+        await repository.update(created)
+        await db_session.commit()
+        assert await repository.exists_by_name("Fluffy") is False
+
+    @pytest.mark.anyio
+    async def test_get_by_name_returns_latest_active_pet(self, repository, sample_pet):
+        """Test that name lookups skip deleted pets and tolerate duplicate names."""
+        await repository.create(sample_pet)
+        await repository.create(
+            Pet(id="pet-456", name="Fluffy", owner_id="user-456", breed_id="breed-123")
+        )
+
+        found = await repository.get_by_name("Fluffy")
+        assert found is not None and found.name == "Fluffy"
+
+        await repository.delete("pet-123")
+        await repository.delete("pet-456")
+        assert await repository.get_by_name("Fluffy") is None
+
+    @pytest.mark.anyio
+    async def test_finders_use_fixed_number_of_queries(
+        self, repository, db_session, executed_statements
+    ):
+        """Test that readers stay within their query budget regardless of how many pets match."""
+        for index in range(3):
+            await repository.create(
+                Pet(id=f"pet-{index}", name=f"Pet {index}", owner_id="user-1", breed_id="breed-1")
+            )
+        db_session.expunge_all()
+
+        # One statement for the pets plus one for the extra gene list, the only relation the mapper reads
+        budgets = {
+            "get_by_id": (lambda: repository.get_by_id("pet-1"), 2),
+            "list_all": (lambda: repository.list_all(), 2),
+            "list_all with total": (lambda: repository.list_all(with_total=True), 3),
+            "get_by_owner_id": (lambda: repository.get_by_owner_id("user-1"), 2),
+            "get_by_name": (lambda: repository.get_by_name("Pet 1"), 2),
+            "search_pets": (
+                lambda: PostgreSQLPetSearchReadRepository(db_session).search_pets(with_total=True),
+                1,
+            ),
+        }
+        for name, (read, budget) in budgets.items():
+            executed_statements.clear()
+            await read()
+            assert len(executed_statements) == budget, name
+
+        executed_statements.clear()
+        streamed = [pet.id async for pet in repository.iter_all(owner_id="user-1")]
+        assert len(streamed) == 3
+        assert len(executed_statements) == 2
+
+    def test_name_search_vector_ddl_upgrades_existing_tables(self):
+        """Test that search_pets' name_tsv column is added to pets tables created before it existed."""
+        assert PetModel.__table__.info[SEARCH_VECTOR_DDL] == [
+            "ALTER TABLE pets ADD COLUMN IF NOT EXISTS name_tsv tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, ''))) STORED",
+            "CREATE INDEX IF NOT EXISTS idx_pets_name_tsv ON pets USING gin (name_tsv)",
+        ]
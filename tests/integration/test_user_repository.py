@@ -1,12 +1,23 @@
 """Integration tests for User repository."""
 
+import asyncio
+from datetime import UTC, datetime
+
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from domain.common.event_publisher import EventPublisher
+from domain.common.pagination import PageCursor
 from domain.users.entities import User
+from domain.users.repository import UserRepository
 from domain.users.value_objects import UserTypeEnum
+from infrastructure.dependencies.repositories import get_user_repository
 from infrastructure.persistence.postgres.mappers.user_mapper import UserMapper
+from infrastructure.persistence.postgres.models.user import UserModel
+from infrastructure.persistence.postgres.repositories.event_aware_repository import (
+    EventAwareRepository,
+)
 from infrastructure.persistence.postgres.repositories.user_repository_impl import (
     PostgreSQLUserRepositoryImpl,
 )
@@ -22,6 +33,17 @@ class TestUserRepositoryIntegration:
         """Create a user repository instance."""
         return PostgreSQLUserRepositoryImpl(db_session, user_mapper, event_publisher)
 
+    @pytest.mark.anyio
+    async def test_dependency_provides_event_aware_repository(
+        self, db_session, user_mapper, event_publisher
+    ):
+        """Test that the UserRepository dependency resolves to the single event-aware impl."""
+        repository = await get_user_repository(db_session, user_mapper, event_publisher)
+
+        assert type(repository) is PostgreSQLUserRepositoryImpl
+        assert isinstance(repository, UserRepository)
+        assert isinstance(repository, EventAwareRepository)
+
     @pytest.fixture
     def sample_user(self) -> User:
         """Create a sample user for testing."""
@@ -63,6 +85,91 @@ class TestUserRepositoryIntegration:
 
         assert result is None
 
+    @pytest.mark.anyio
+    async def test_get_by_ids_loads_users_in_one_query(
+        self, repository, sample_user, executed_statements
+    ):
+        """Test that get_by_ids fetches every requested user with a single statement."""
+        await repository.create(sample_user)
+        other = sample_user.model_copy(
+            update={"id": "user-456", "username": "other", "email": "other@example.com"}
+        )
+        await repository.create(other)
+        await repository.delete("user-456")
+
+        executed_statements.clear()
+        users = await repository.get_by_ids(["user-123", "user-456", "missing", "user-123"])
+        assert len(executed_statements) == 1
+        assert list(users) == ["user-123"]
+        assert users["user-123"].username == sample_user.username
+
+        assert await repository.get_by_ids([]) == {}
+
+    @pytest.mark.anyio
+    async def test_malformed_id_is_a_miss_on_postgresql(self, user_mapper, event_publisher):
+        """Test that a non-UUID id is treated as not found instead of sent to a uuid column."""
+        # Nothing listens on this address: any query issued would fail to connect
+        engine = create_async_engine("postgresql+asyncpg://user@127.0.0.1:1/cryptic")
+        async with AsyncSession(engine) as session:
+            repository = PostgreSQLUserRepositoryImpl(session, user_mapper, event_publisher)
+            assert await repository.get_by_id("nonexistent-id") is None
+            assert await repository.get_by_ids(["nonexistent-id"]) == {}
+            # uuid.UUID accepts the URN form, but the driver and PostgreSQL reject it
+            urn = "urn:uuid:a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11"
+            assert await repository.get_by_id(urn) is None
+
+            cursor = PageCursor(created_at=datetime.now(UTC), id="nonexistent-id").encode()
+            with pytest.raises(ValueError, match="Invalid pagination cursor"):
+                await repository.list_all(cursor=cursor)
+        await engine.dispose()
+
+    @pytest.mark.anyio
+    async def test_lookups_reuse_cached_user(
+        self, repository, db_session, sample_user, executed_statements
+    ):
+        """Test that committed lookups are reused until a user write invalidates them."""
+        created = await repository.create(sample_user)
+        await db_session.commit()
+
+        assert (await repository.get_by_username("testuser")).id == "user-123"
+
+        executed_statements.clear()
+        cached = await repository.get_by_username("testuser")
+        assert cached.email == "test@example.com"
+        assert executed_statements == []
+
+        # Callers get their own copy to mutate
+        cached.full_name = "Changed Locally"
+        assert (await repository.get_by_username("testuser")).full_name == "Test User"
+
+        created.update_username("renamed")
+        await repository.update(created)
+        await db_session.commit()
+        assert await repository.get_by_username("testuser") is None
+        assert (await repository.get_by_id("user-123")).username == "renamed"
+
+    @pytest.mark.anyio
+    async def test_cache_does_not_outlive_the_session(
+        self, repository, db_session, sample_user, async_engine, user_mapper, event_publisher
+    ):
+        """Test that a deactivation made elsewhere is seen by the next request, not a cached user."""
+        await repository.create(sample_user)
+        await db_session.commit()
+        assert (await repository.get_by_username("testuser")).is_active is True
+
+        # Another process deactivates the user without going through this repository
+        async with AsyncSession(async_engine) as other_session:
+            await other_session.execute(
+                update(UserModel).where(UserModel.id == "user-123").values(is_active=False)
+            )
+            await other_session.commit()
+
+        async with AsyncSession(async_engine, expire_on_commit=False) as next_session:
+            next_repository = PostgreSQLUserRepositoryImpl(
+                next_session, user_mapper, event_publisher
+            )
+            assert (await next_repository.get_by_username("testuser")).is_active is False
+
     @pytest.mark.anyio
     async def test_get_user_by_username(self, repository, sample_user):
         """Test getting a user by username."""
@@ -120,34 +227,40 @@ class TestUserRepositoryIntegration:
         assert await repository.exists_by_username(sample_user.username) is True
 
     @pytest.mark.anyio
-    async def test_update_user(self, repository, sample_user):
-        """Test updating a user."""
+    async def test_update_user(self, repository, sample_user, executed_statements):
+        """Test that update writes the new values with a single UPDATE ... RETURNING."""
         created = await repository.create(sample_user)
 
         created.full_name = "Updated Name"
         created.is_active = False
 
+        executed_statements.clear()
         result = await repository.update(created)
 
         assert result.full_name == "Updated Name"
         assert result.is_active is False
+        assert len(executed_statements) == 1
+        assert executed_statements[0].lstrip().upper().startswith("UPDATE")
 
     @pytest.mark.anyio
-    async def test_delete_user_soft_delete(self, repository, sample_user):
-        """Test soft deleting a user."""
+    async def test_delete_user_soft_delete(self, repository, sample_user, executed_statements):
+        """Test soft deleting a user with a single UPDATE."""
         await repository.create(sample_user)
 
+        executed_statements.clear()
         result = await repository.delete(sample_user.id)
 
         assert result is True
+        assert len(executed_statements) == 1
+        assert await repository.delete(sample_user.id) is False
 
         # Should not find deleted user
         found = await repository.get_by_id(sample_user.id)
         assert found is None
 
     @pytest.mark.anyio
-    async def test_list_all_users(self, repository):
-        """Test listing all users."""
+    async def test_list_all_users(self, repository, executed_statements):
+        """Test listing all users with the total counted in the page query."""
         # Create multiple users
         for i in range(5):
             user = User(
@@ -158,10 +271,13 @@ class TestUserRepositoryIntegration:
             )
             await repository.create(user)
 
-        users, total = await repository.list_all(page=1, page_size=10)
+        executed_statements.clear()
+        page = await repository.list_all(page=1, page_size=10, with_total=True)
 
-        assert len(users) == 5
-        assert total == 5
+        assert len(page.items) == 5
+        assert page.total == 5
+        assert not page.has_more
+        assert len(executed_statements) == 1
 
     @pytest.mark.anyio
     async def test_list_all_users_pagination(self, repository):
@@ -177,29 +293,60 @@ class TestUserRepositoryIntegration:
             await repository.create(user)
 
         # Get first page
-        users_page1, total = await repository.list_all(page=1, page_size=3)
-        assert len(users_page1) == 3
-        assert total == 10
+        page1 = await repository.list_all(page=1, page_size=3, with_total=True)
+        assert len(page1.items) == 3
+        assert page1.total == 10
+        assert page1.has_more
 
         # Get second page
-        users_page2, _ = await repository.list_all(page=2, page_size=3)
-        assert len(users_page2) == 3
+        page2 = await repository.list_all(page=2, page_size=3)
+        assert len(page2.items) == 3
+        assert page2.total is None
 
         # Ensure no overlap
-        page1_ids = {u.id for u in users_page1}
-        page2_ids = {u.id for u in users_page2}
+        page1_ids = {u.id for u in page1.items}
+        page2_ids = {u.id for u in page2.items}
         assert len(page1_ids & page2_ids) == 0
 
+        # A page past the end still reports the total
+        page5 = await repository.list_all(page=5, page_size=3, with_total=True)
+        assert page5.items == []
+        assert page5.total == 10
+
+    @pytest.mark.anyio
+    async def test_list_all_searches_username_email_and_full_name(self, repository):
+        """Test that the search term matches username, email or full name."""
+        for user_id, username, email, full_name in [
+            ("user-1", "gecko_fan", "one@example.com", None),
+            ("user-2", "someone", "gecko@example.com", None),
+            ("user-3", "another", "three@example.com", "Leopard Gecko Keeper"),
+            ("user-4", "unrelated", "four@example.com", "Nobody"),
+        ]:
+            await repository.create(
+                User(
+                    id=user_id,
+                    username=username,
+                    email=email,
+                    full_name=full_name,
+                    hashed_password="hashed",
+                )
+            )
+
+        page = await repository.list_all(search="gecko", with_total=True)
+
+        assert page.total == 3
+        assert {user.id for user in page.items} == {"user-1", "user-2", "user-3"}
+
     @pytest.mark.anyio
     async def test_list_excludes_deleted(self, repository, sample_user):
         """Test that list excludes soft-deleted users."""
         await repository.create(sample_user)
         await repository.delete(sample_user.id)
 
-        users, total = await repository.list_all()
+        page = await repository.list_all(with_total=True)
 
-        assert total == 0
-        assert len(users) == 0
+        assert page.total == 0
+        assert len(page.items) == 0
 
     @pytest.mark.anyio
     async def test_list_includes_deleted_when_requested(self, repository, sample_user):
@@ -207,8 +354,111 @@ class TestUserRepositoryIntegration:
         await repository.create(sample_user)
         await repository.delete(sample_user.id)
 
-        users, total = await repository.list_all(include_deleted=True)
+        page = await repository.list_all(include_deleted=True, with_total=True)
+
+        assert page.total == 1
+        assert len(page.items) == 1
+
+    @pytest.mark.anyio
+    async def test_list_all_with_cursor_walks_every_page(self, repository):
+        """Test that keyset pagination returns each user exactly once."""
+        for i in range(5):
+            await repository.create(
+                User(
+                    id=f"user-{i}",
+                    username=f"user{i}",
+                    email=f"user{i}@example.com",
+                    hashed_password="hashed",
+                )
+            )
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repository.list_all(page_size=2, cursor=cursor)
+            seen.extend(user.id for user in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert not page.has_more
+        assert sorted(seen) == [f"user-{i}" for i in range(5)]
+
+    @pytest.mark.anyio
+    async def test_bulk_create_users(self, repository):
+        """Test inserting users in a single batch."""
+        users = [
+            User(
+                id=f"user-{i}",
+                username=f"user{i}",
+                email=f"user{i}@example.com",
+                hashed_password="hashed",
+            )
+            for i in range(5)
+        ]
+
+        inserted = await repository.bulk_create(users)
+
+        assert inserted == 5
+        page = await repository.list_all(page=1, page_size=10, with_total=True)
+        assert page.total == 5
+        assert {u.id for u in page.items} == {u.id for u in users}
+
+    @pytest.mark.anyio
+    async def test_events_are_published_only_after_commit(
+        self, db_session, user_mapper, sample_user
+    ):
+        """Test that domain events wait for the commit and are dropped on rollback."""
+        published = []
+
+        class RecordingPublisher(EventPublisher):
+            async def publish_events(self, events):
+                published.extend(events)
+
+        repository = PostgreSQLUserRepositoryImpl(db_session, user_mapper, RecordingPublisher())
+        created = await repository.create(sample_user)
 
-        assert total == 1
-        assert len(users) == 1
+        created.deactivate()
+        await repository.update(created)
+        await asyncio.sleep(0)
+        assert published == []
 
+        await db_session.commit()
+        await asyncio.sleep(0)
+        assert [type(event).__name__ for event in published] == ["UserDeactivatedEvent"]
+
+        published.clear()
+        created.activate()
+        await repository.update(created)
+        await db_session.rollback()
+        await asyncio.sleep(0)
+        assert published == []
+
+    @pytest.mark.anyio
+    async def test_publishers_are_flushed_concurrently_after_commit(
+        self, db_session, user_mapper, sample_user
+    ):
+        """Test that each publisher's batch is published in parallel with the others."""
+        timeline = []
+
+        class SlowPublisher(EventPublisher):
+            def __init__(self, name):
+                super().__init__()
+                self.name = name
+
+            async def publish_events(self, events):
+                timeline.append(f"{self.name}-start")
+                await asyncio.sleep(0.01)
+                timeline.append(f"{self.name}-end")
+
+        first = PostgreSQLUserRepositoryImpl(db_session, user_mapper, SlowPublisher("a"))
+        second = PostgreSQLUserRepositoryImpl(db_session, user_mapper, SlowPublisher("b"))
+        created = await first.create(sample_user)
+        created.deactivate()
+        await first.update(created)
+        created.activate()
+        await second.update(created)
+
+        await db_session.commit()
+        await asyncio.sleep(0.05)
+        assert timeline == ["a-start", "b-start", "a-end", "b-end"]
@@ -0,0 +1,36 @@
+"""Unit tests for keyset pagination cursor and page results."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from domain.common.pagination import Page, PageCursor
+from domain.users.entities import User
+
+
+class TestPageCursor:
+    """Test cases for PageCursor."""
+
+    def test_encode_decode_round_trip(self):
+        """Test that a decoded cursor equals the original."""
+        cursor = PageCursor(created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC), id="abc")
+
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    def test_decode_rejects_malformed_cursor(self):
+        """Test that garbage input raises ValueError."""
+        with pytest.raises(ValueError):
+            PageCursor.decode("not-a-cursor")
+
+    def test_next_cursor_points_after_last_item(self):
+        """Test that a page with more rows yields a cursor for its last item."""
+        users = [
+            User(id=f"user-{i}", username=f"u{i}", email=f"u{i}@example.com", hashed_password="hash")
+            for i in range(2)
+        ]
+
+        next_cursor = Page(items=users, has_more=True).next_cursor
+
+        assert next_cursor is not None
+        assert PageCursor.decode(next_cursor).id == "user-1"
+        assert Page(items=users, has_more=False).next_cursor is None
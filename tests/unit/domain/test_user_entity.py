@@ -214,6 +214,19 @@ class TestUserDomainEvents:
         events = user.get_domain_events()
         assert events == []
 
+    def test_constructed_user_has_domain_events_list(self):
+        """Test that model_construct also initializes domain events."""
+        user = User.model_construct(
+            id="user-123",
+            username="testuser",
+            email="test@example.com",
+            hashed_password="hash",
+        )
+
+        assert user.get_domain_events() == []
+        user.deactivate()
+        assert len(user.get_domain_events()) == 1
+
     def test_user_can_add_domain_event(self):
         """Test that user can add domain events."""
         from domain.users.events import UserCreatedEvent
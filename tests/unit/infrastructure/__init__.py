@@ -0,0 +1 @@
+"""Infrastructure unit tests package."""
@@ -0,0 +1,95 @@
+"""Unit tests for the COPY FROM STDIN bulk import helper."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from domain.pet_records.pet_record_data import FeedingRecordData
+from domain.pet_records.value_objects import PetEventTypeEnum
+from domain.pets.value_objects import GeneCategoryEnum, InheritanceTypeEnum
+from infrastructure.persistence.postgres.models.gene import GeneModel
+from infrastructure.persistence.postgres.models.pet_record import PetRecordModel
+from infrastructure.persistence.postgres.repositories.bulk_copy import copy_rows
+
+
+class TestCopyRows:
+    """Test cases for copy_rows on the asyncpg driver."""
+
+    @pytest.fixture
+    def driver_connection(self) -> MagicMock:
+        """Create an asyncpg-like connection that records the COPY calls."""
+        driver_connection = MagicMock(spec=["copy_records_to_table"])
+        driver_connection.copy_records_to_table = AsyncMock()
+        return driver_connection
+
+    @pytest.fixture
+    def session(self, driver_connection) -> MagicMock:
+        """Create a session whose connection exposes the driver connection."""
+        connection = MagicMock()
+        connection.dialect = asyncpg_dialect()
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver_connection)
+        )
+        session = MagicMock()
+        session.connection = AsyncMock(return_value=connection)
+        return session
+
+    @pytest.mark.anyio
+    async def test_encodes_nulls_jsonb_and_enum_columns(self, session, driver_connection):
+        """Test that NULLs stay None, JSONB becomes JSON text and enums become SMALLINT codes."""
+        rows = [
+            {
+                "id": "gene-1",
+                "name": {"en_US": "Albino", "zh_CN": "白化"},
+                "notation": "a",
+                "inheritance_type": InheritanceTypeEnum.RECESSIVE,
+                "category": None,
+            },
+            {
+                "id": "gene-2",
+                "name": {"en_US": "Pastel"},
+                "notation": None,
+                "inheritance_type": None,
+                "category": GeneCategoryEnum.PATTERN,
+            },
+        ]
+
+        assert await copy_rows(session, GeneModel.__table__, rows) == 2
+
+        recessive = list(InheritanceTypeEnum).index(InheritanceTypeEnum.RECESSIVE) + 1
+        pattern = list(GeneCategoryEnum).index(GeneCategoryEnum.PATTERN) + 1
+        driver_connection.copy_records_to_table.assert_awaited_once_with(
+            "genes",
+            records=[
+                ("gene-1", '{"en_US": "Albino", "zh_CN": "白化"}', "a", recessive, None),
+                ("gene-2", '{"en_US": "Pastel"}', None, None, pattern),
+            ],
+            columns=["id", "name", "notation", "inheritance_type", "category"],
+        )
+
+    @pytest.mark.anyio
+    async def test_serializes_value_objects_and_groups_by_column_set(
+        self, session, driver_connection
+    ):
+        """Test that value objects in raw JSONB columns are dumped and each column set gets its own COPY."""
+        event_data = FeedingRecordData(food_name="cricket", food_amount=3)
+        row = {
+            "id": "record-1",
+            "pet_id": "pet-1",
+            "creator_id": "user-1",
+            "event_type": PetEventTypeEnum.FEEDING,
+            "event_data": event_data,
+        }
+        rows = [row, {**row, "id": "record-2", "is_deleted": True}]
+
+        assert await copy_rows(session, PetRecordModel.__table__, rows) == 2
+
+        calls = driver_connection.copy_records_to_table.await_args_list
+        assert [call.kwargs["columns"][-1] for call in calls] == ["event_data", "is_deleted"]
+        first_record = calls[0].kwargs["records"][0]
+        assert first_record[3] == list(PetEventTypeEnum).index(PetEventTypeEnum.FEEDING) + 1
+        assert first_record[4] == (
+            '{"notes": null, "food_name": "cricket", "food_amount": 3.0, '
+            '"food_unit": "g", "feeding_method": null, "description": null}'
+        )
@@ -0,0 +1,69 @@
+"""Unit tests for running a page query and its COUNT concurrently."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from infrastructure.persistence.postgres.repositories.concurrent_count import (
+    can_count_concurrently,
+    execute_with_count,
+)
+
+POOL_SIZE = 4
+
+PAGE_STATEMENT = select(literal(1))
+COUNT_STATEMENT = select(func.count()).select_from(PAGE_STATEMENT.subquery())
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create an engine whose queue pool has no overflow and a short checkout timeout."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'count.db'}",
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=1,
+    )
+    yield engine
+    await engine.dispose()
+
+
+class TestExecuteWithCount:
+    """Test cases for execute_with_count."""
+
+    @pytest.mark.anyio
+    async def test_counts_concurrently_when_pool_has_spare_connections(self, engine):
+        """Test that an idle pool lets the COUNT run on its own connection."""
+        async with AsyncSession(engine) as session:
+            assert can_count_concurrently(session)
+
+            result, total = await execute_with_count(session, PAGE_STATEMENT, COUNT_STATEMENT)
+
+        assert result.scalar_one() == 1
+        assert total == 1
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_sequential_when_pool_is_exhausted(self, engine):
+        """Test that requests holding every pooled connection do not wait for a second one."""
+        all_connected = asyncio.Event()
+        connected = 0
+
+        async def list_with_total() -> int:
+            nonlocal connected
+            async with AsyncSession(engine) as session:
+                await session.execute(select(literal(1)))
+                connected += 1
+                if connected == POOL_SIZE:
+                    all_connected.set()
+                await all_connected.wait()
+
+                _, total = await execute_with_count(session, PAGE_STATEMENT, COUNT_STATEMENT)
+                return total
+
+        totals = await asyncio.wait_for(
+            asyncio.gather(*(list_with_total() for _ in range(POOL_SIZE))), timeout=10
+        )
+
+        assert totals == [1] * POOL_SIZE
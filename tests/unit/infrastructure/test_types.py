@@ -0,0 +1,32 @@
+"""Unit tests for the custom column types."""
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from domain.pets.value_objects import GeneCategoryEnum
+from infrastructure.persistence.postgres.models.types import SmallIntEnumType
+
+
+class TestSmallIntEnumType:
+    """Test cases for SmallIntEnumType."""
+
+    @pytest.fixture
+    def column_type(self) -> SmallIntEnumType:
+        """Create the column type for gene categories."""
+        return SmallIntEnumType(GeneCategoryEnum)
+
+    def test_round_trips_members_by_declaration_order(self, column_type):
+        """Test that members map to 1-based codes and back."""
+        dialect = asyncpg_dialect()
+        for code, member in enumerate(GeneCategoryEnum, start=1):
+            assert column_type.process_bind_param(member, dialect) == code
+            assert column_type.process_bind_param(member.value, dialect) == code
+            assert column_type.process_result_value(code, dialect) is member
+        assert column_type.process_bind_param(None, dialect) is None
+        assert column_type.process_result_value(None, dialect) is None
+
+    def test_unknown_code_raises_a_clear_error(self, column_type):
+        """Test that a code outside the enum names the enum instead of raising a bare KeyError."""
+        unknown = len(GeneCategoryEnum) + 1
+        with pytest.raises(ValueError, match=f"Unknown GeneCategoryEnum code {unknown}"):
+            column_type.process_result_value(unknown, asyncpg_dialect())